@@ -0,0 +1,274 @@
+import time
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import Batch
+
+from app.ai.embedding_engine import pool_chunks
+from app.ai.lexical import LEXICAL_VECTOR_NAME, encode_lexical
+from app.ai.vector_store import (
+    BUILDING_VERSIONS_KEY,
+    INDEX_GENERATION_KEY,
+    VectorStore,
+    WORKER_ID,
+    VectorStoreBase,
+    journal_key,
+    writers_key,
+)
+from app.core.config import settings
+from app.db.redis import get_redis
+from app.models.case import Case, CaseStatus
+
+
+class AsyncVectorStore(VectorStoreBase):
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        store = VectorStore()
+        self.alias_name = store.alias_name
+        self.collection_name = store.collection_name
+        self.chunk_collection_name = store.chunk_collection_name
+        self.hybrid = store.hybrid
+        self.embedding_service = store.embedding_service
+
+        self.client = AsyncQdrantClient(
+            url=settings.qdrant_url,
+            grpc_port=settings.qdrant_grpc_port,
+            prefer_grpc=settings.qdrant_prefer_grpc,
+            pool_size=settings.qdrant_pool_size,
+            grpc_options={
+                "grpc.keepalive_time_ms": 30_000,
+                "grpc.keepalive_permit_without_calls": 1,
+            },
+        )
+        self._read_collection_name = None
+        self._read_hybrid = False
+        self._alias_checked_at = 0.0
+        self._initialized = True
+
+    async def alias_target(self) -> Optional[str]:
+        for alias in (await self.client.get_aliases()).aliases:
+            if alias.alias_name == self.alias_name:
+                return alias.collection_name
+        return None
+
+    async def _read_collection(self) -> str:
+        now = time.monotonic()
+        if now - self._alias_checked_at > settings.qdrant_alias_refresh_seconds:
+            target = await self.alias_target()
+            config = None
+            if target not in (None, self.collection_name):
+                config = (await self.client.get_collection(target)).config
+            self._read_collection_name, self._read_hybrid = self._read_target(
+                target, config
+            )
+            await self._report_writer()
+            self._alias_checked_at = now
+        return self._read_collection_name
+
+    async def _report_writer(self):
+        try:
+            redis = await get_redis()
+            await redis.zadd(
+                writers_key(self.collection_name), {WORKER_ID: time.time()}
+            )
+        except Exception:
+            pass
+
+    async def _journal_write(self, case_id: int):
+        await self._report_writer()
+        try:
+            redis = await get_redis()
+            for version in await redis.smembers(BUILDING_VERSIONS_KEY):
+                if version != self.collection_name and version.startswith(
+                    f"{self.alias_name}__"
+                ):
+                    await redis.sadd(journal_key(version), case_id)
+        except Exception:
+            pass
+
+    async def _bump_generation(self):
+        try:
+            redis = await get_redis()
+            await redis.incr(INDEX_GENERATION_KEY)
+        except Exception:
+            pass
+
+    async def _upsert(
+        self,
+        collection_name: str,
+        point_ids: List[str],
+        embeddings: np.ndarray,
+        payloads: List[Dict],
+        lexical_texts: Optional[List[str]] = None,
+    ):
+        vectors = np.asarray(embeddings).tolist()
+        if self.hybrid and lexical_texts is not None:
+            vectors = {
+                "": vectors,
+                LEXICAL_VECTOR_NAME: [encode_lexical(text) for text in lexical_texts],
+            }
+        await self.client.upsert(
+            collection_name=collection_name,
+            points=Batch(ids=point_ids, vectors=vectors, payloads=payloads),
+            wait=True,
+        )
+
+    async def index_case(self, case: Case) -> bool:
+        await self._journal_write(case.id)
+        try:
+            search_text = self._create_search_text(case)
+            if settings.embedding_index_chunks:
+                chunk_embeddings = await self.embedding_service.aencode_chunks(
+                    search_text
+                )
+                embedding = pool_chunks(chunk_embeddings)
+                await self.client.delete(
+                    collection_name=self.chunk_collection_name,
+                    points_selector=self._case_selector([case.id]),
+                )
+                point_ids, payloads = self._chunk_points(case, len(chunk_embeddings))
+                await self._upsert(
+                    self.chunk_collection_name, point_ids, chunk_embeddings, payloads
+                )
+            else:
+                embedding = await self.embedding_service.aencode_document(search_text)
+
+            await self._upsert(
+                self.collection_name,
+                [self._generate_point_id(case.id)],
+                embedding[np.newaxis, :],
+                [self._build_payload(case)],
+                [self._create_lexical_text(case)],
+            )
+            await self._bump_generation()
+            return True
+        except Exception:
+            return False
+
+    async def _query(
+        self,
+        query: Union[np.ndarray, str],
+        case_type: Optional[str],
+        limit: int,
+        score_threshold: Optional[float],
+        exclude_case_id: Optional[int],
+        lexical_text: Optional[str] = None,
+    ) -> List[Dict]:
+        if score_threshold is None:
+            score_threshold = settings.similarity_threshold
+
+        collection_name = await self._read_collection()
+        if self._read_hybrid and lexical_text:
+            dense, lexical = await self.client.query_batch_points(
+                collection_name=collection_name,
+                requests=self._hybrid_requests(
+                    query, lexical_text, case_type, score_threshold, exclude_case_id
+                ),
+            )
+            dense = dense.points
+            lexical_only = self._lexical_only(dense, lexical.points)
+            if lexical_only:
+                rescored = await self.client.query_points(
+                    collection_name=collection_name,
+                    query=query,
+                    limit=len(lexical_only),
+                    query_filter=self._id_filter(lexical_only),
+                    search_params=self._search_params(),
+                    with_payload=self._payload_selector(),
+                )
+                dense = dense + rescored.points
+            results = self._fuse(dense, lexical.points, limit, score_threshold)
+            return [self._to_similar_case(result) for result in results]
+
+        results = (
+            await self.client.query_points(
+                collection_name=collection_name,
+                query=query,
+                limit=limit,
+                score_threshold=score_threshold,
+                query_filter=self._search_filter(case_type, exclude_case_id),
+                search_params=self._search_params(),
+                with_payload=self._payload_selector(),
+            )
+        ).points
+
+        return [self._to_similar_case(result) for result in results]
+
+    async def search_similar(
+        self,
+        query_text: str,
+        case_type: Optional[str] = None,
+        limit: int = 5,
+        score_threshold: Optional[float] = None,
+        exclude_case_id: Optional[int] = None,
+    ) -> List[Dict]:
+        query_embedding = await self.embedding_service.aencode_query(query_text)
+        return await self._query(
+            query_embedding,
+            case_type,
+            limit,
+            score_threshold,
+            exclude_case_id,
+            query_text,
+        )
+
+    async def search_by_case(
+        self, case: Case, limit: int = 5, score_threshold: Optional[float] = None
+    ) -> List[Dict]:
+        lexical_text = self._create_lexical_text(case)
+        if case.status == CaseStatus.APPROVED:
+            try:
+                results = await self._query(
+                    self._generate_point_id(case.id),
+                    case.case_type.value,
+                    limit,
+                    score_threshold,
+                    case.id,
+                    lexical_text,
+                )
+                self.stored_vector_searches.inc()
+                return results
+            except Exception:
+                pass
+
+        self.encoded_searches.inc()
+        return await self._query(
+            await self.embedding_service.aencode_query(self._create_search_text(case)),
+            case.case_type.value,
+            limit,
+            score_threshold,
+            case.id,
+            lexical_text,
+        )
+
+    async def delete_case(self, case_id: int) -> bool:
+        await self._journal_write(case_id)
+        try:
+            await self.client.delete(
+                collection_name=self.collection_name,
+                points_selector=[self._generate_point_id(case_id)],
+            )
+            if settings.embedding_index_chunks:
+                await self.client.delete(
+                    collection_name=self.chunk_collection_name,
+                    points_selector=self._case_selector([case_id]),
+                )
+            await self._bump_generation()
+            return True
+        except Exception:
+            return False
+
+    async def update_case(self, case: Case) -> bool:
+        await self.delete_case(case.id)
+        return await self.index_case(case)
@@ -0,0 +1,101 @@
+import threading
+import time
+from concurrent.futures import Future
+from queue import Empty, Queue
+from typing import Callable, List
+
+import numpy as np
+
+from app.core.metrics import metrics
+
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+QUEUE_WAIT_BUCKETS = (0.001, 0.002, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+
+class _Request:
+    __slots__ = ("texts", "future", "enqueued_at")
+
+    def __init__(self, texts: List[str]):
+        self.texts = texts
+        self.future = Future()
+        self.enqueued_at = time.perf_counter()
+
+
+class MicroBatcher:
+    def __init__(
+        self,
+        encode_fn: Callable[[List[str]], np.ndarray],
+        max_batch_size: int,
+        window_ms: float,
+        name: str = "embedding",
+    ):
+        self.encode_fn = encode_fn
+        self.max_batch_size = max(1, max_batch_size)
+        self.window = max(0.0, window_ms) / 1000
+        self.batch_size_histogram = metrics.histogram(
+            f"{name}_batch_size", BATCH_SIZE_BUCKETS
+        )
+        self.queue_wait_histogram = metrics.histogram(
+            f"{name}_queue_wait_seconds", QUEUE_WAIT_BUCKETS
+        )
+        self.queue_depth = metrics.gauge(f"{name}_queue_depth")
+
+        self._queue: Queue = Queue()
+        self._worker = threading.Thread(
+            target=self._run, name=f"{name}-batcher", daemon=True
+        )
+        self._worker.start()
+
+    def submit(self, texts: List[str]) -> Future:
+        request = _Request(texts)
+        self._queue.put(request)
+        self.queue_depth.set(self._queue.qsize())
+        return request.future
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        return self.submit(texts).result()
+
+    def _collect(self) -> List[_Request]:
+        first = self._queue.get()
+        batch = [first]
+        size = len(first.texts)
+        deadline = time.perf_counter() + self.window
+
+        while size < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                request = (
+                    self._queue.get(timeout=remaining)
+                    if remaining > 0
+                    else self._queue.get_nowait()
+                )
+            except Empty:
+                break
+            batch.append(request)
+            size += len(request.texts)
+
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            self.queue_depth.set(self._queue.qsize())
+            started_at = time.perf_counter()
+            texts = [text for request in batch for text in request.texts]
+
+            self.batch_size_histogram.observe(len(texts))
+            for request in batch:
+                self.queue_wait_histogram.observe(started_at - request.enqueued_at)
+
+            try:
+                embeddings = self.encode_fn(texts)
+            except Exception as e:
+                for request in batch:
+                    request.future.set_exception(e)
+                continue
+
+            offset = 0
+            for request in batch:
+                count = len(request.texts)
+                request.future.set_result(embeddings[offset : offset + count])
+                offset += count
@@ -1,50 +1,63 @@
 from typing import List
 
-from openai import OpenAI
+from openai import (
+    APIError,
+    ContentFilterFinishReasonError,
+    LengthFinishReasonError,
+)
+from pydantic import ValidationError
 
+from app.ai.openai_client import client
 from app.ai.prompts.loader import prompts
-from app.core.config import settings
+from app.core.metrics import metrics
 from app.models.case import CaseStatus, CaseType
-from app.schemas.case import ScammerInfoCreate
+from app.schemas.case import CaseTriage, ScammerInfoCreate
 
-client = OpenAI(
-    api_key=settings.openai_api_key,
-)
+FALLBACK_TITLE_LENGTH = 20
+MAX_TITLE_LENGTH = 200
 
+triage_fallbacks = metrics.counter("case_triage_fallbacks")
 
-async def generate_title(statement: str):
-    response = client.chat.completions.create(
-        model="gpt-4o-mini",
-        messages=[
-            {"role": "system", "content": prompts.case_title},
-            {"role": "user", "content": statement},
-        ],
-        max_tokens=50,
-        temperature=0.5,
-    )
-    return response.choices[0].message.content.strip()
+
+def _case_message(
+    case_type: CaseType, statement: str, scammer_infos: List[ScammerInfoCreate]
+) -> str:
+    return f"statement: {statement}\nscammer_infos: {scammer_infos}\ncase_type: {case_type}"
 
 
-async def analyze_case(
+async def triage_case(
     case_type: CaseType, statement: str, scammer_infos: List[ScammerInfoCreate]
-):
-    response = client.chat.completions.create(
-        model="gpt-4o-mini",
-        messages=[
-            {"role": "system", "content": prompts.case_analysis},
-            {
-                "role": "user",
-                "content": f"statement: {statement}\nscammer_infos: {scammer_infos}\ncase_type: {case_type}",
-            },
-        ],
-        max_tokens=50,
-        temperature=0.5,
-    )
-    result = response.choices[0].message.content.strip()
-    status_map = {
-        "통과": CaseStatus.APPROVED,
-        "검토": CaseStatus.PENDING,
-        "거부": CaseStatus.REJECTED,
-    }
-
-    return status_map.get(result, CaseStatus.PENDING)
+) -> CaseTriage:
+    try:
+        response = await client.chat.completions.parse(
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "system", "content": prompts.case_triage},
+                {
+                    "role": "user",
+                    "content": _case_message(case_type, statement, scammer_infos),
+                },
+            ],
+            response_format=CaseTriage,
+            max_tokens=200,
+            temperature=0.5,
+        )
+        triage = response.choices[0].message.parsed
+    except (
+        APIError,
+        ValidationError,
+        LengthFinishReasonError,
+        ContentFilterFinishReasonError,
+    ):
+        triage = None
+
+    if triage is None or not triage.title.strip():
+        triage_fallbacks.inc()
+        return CaseTriage(
+            verdict=CaseStatus.PENDING,
+            title=" ".join(statement.split())[:FALLBACK_TITLE_LENGTH].strip(),
+            identifiers=[],
+        )
+
+    triage.title = triage.title.strip()[:MAX_TITLE_LENGTH]
+    return triage
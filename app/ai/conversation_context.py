@@ -0,0 +1,43 @@
+from functools import lru_cache
+from typing import List
+
+import tiktoken
+
+CHAT_MODEL = "gpt-4o-mini"
+MESSAGE_OVERHEAD_TOKENS = 4
+FOLD_TARGET_RATIO = 0.5
+
+
+@lru_cache(maxsize=1)
+def _encoding() -> tiktoken.Encoding:
+    return tiktoken.encoding_for_model(CHAT_MODEL)
+
+
+def count_tokens(text: str) -> int:
+    return len(_encoding().encode(text, disallowed_special=()))
+
+
+def message_tokens(message: dict) -> int:
+    return count_tokens(message["content"]) + MESSAGE_OVERHEAD_TOKENS
+
+
+def _fitting_suffix(history: List[dict], budget: int) -> int:
+    used = 0
+    start = len(history)
+    while start > 0:
+        tokens = message_tokens(history[start - 1])
+        if used + tokens > budget:
+            break
+        used += tokens
+        start -= 1
+    return start
+
+
+def truncate_history(history: List[dict], budget: int) -> int:
+    return _fitting_suffix(history, budget)
+
+
+def split_history(history: List[dict], budget: int) -> int:
+    if _fitting_suffix(history, budget) == 0:
+        return 0
+    return _fitting_suffix(history, int(budget * FOLD_TARGET_RATIO))
@@ -0,0 +1,481 @@
+import asyncio
+import fcntl
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+import numpy as np
+from qdrant_client.models import ScoredPoint
+
+from app.ai.embedding_engine import EmbeddingEngine, pool_chunks
+from app.ai.vector_store import INDEX_GENERATION_KEY, VectorStoreBase
+from app.core.config import settings
+from app.db.redis import get_binary_redis
+from app.models.case import Case, CaseStatus, CaseType
+
+MIN_CAPACITY = 1024
+
+ROW_DTYPE = np.dtype(
+    [("case_id", "<i8"), ("case_type", "<i2"), ("status", "<i1"), ("alive", "?")]
+)
+CASE_TYPE_CODES = {case_type.value: code for code, case_type in enumerate(CaseType)}
+STATUS_CODES = {status.value: code for code, status in enumerate(CaseStatus)}
+APPROVED_CODE = STATUS_CODES[CaseStatus.APPROVED.value]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS points (
+    row INTEGER PRIMARY KEY,
+    case_id INTEGER NOT NULL UNIQUE,
+    payload TEXT NOT NULL
+);
+"""
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+class EmbeddedVectorStore(VectorStoreBase):
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self.path = settings.embedded_vector_path
+        self.alias_name = self.collection_name = self.path
+        self.chunk_collection_name = self.path
+        self.hybrid = False
+        self.dimension = settings.embedding_dimension
+        self.embedding_service = EmbeddingEngine()
+
+        self._lock = threading.RLock()
+        self._lock_depth = 0
+        self._partitions: Dict[int, np.ndarray] = {}
+        os.makedirs(self.path, exist_ok=True)
+        self._lock_file = open(os.path.join(self.path, "lock"), "a")
+        self._db = sqlite3.connect(
+            os.path.join(self.path, "points.sqlite3"), check_same_thread=False
+        )
+        with self._lock:
+            fcntl.flock(self._lock_file, fcntl.LOCK_EX)
+            try:
+                self._db.executescript(SCHEMA)
+                self._open()
+            finally:
+                fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+        self._initialized = True
+
+    @contextmanager
+    def _locked(self, exclusive: bool = False):
+        with self._lock:
+            if self._lock_depth == 0:
+                fcntl.flock(
+                    self._lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
+                )
+                try:
+                    self._refresh()
+                except BaseException:
+                    fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+                    raise
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+                if self._lock_depth == 0:
+                    fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+
+    def _refresh(self):
+        meta = dict(self._db.execute("SELECT key, value FROM meta"))
+        if (meta["generation"], meta["capacity"]) != (self.generation, self.capacity):
+            self.generation, self.capacity = meta["generation"], meta["capacity"]
+            self._vectors, self._rows = self._map(self.generation, self.capacity)
+            self._partitions = {}
+        if (meta["count"], meta.get("epoch", 0)) != (self.count, self.epoch):
+            self.count, self.epoch = meta["count"], meta.get("epoch", 0)
+            self._partitions = {}
+
+    def _meta(self, key: str, default: int) -> int:
+        row = self._db.execute(
+            "SELECT value FROM meta WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else default
+
+    def _set_meta(self, **values: int):
+        self._db.executemany(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", values.items()
+        )
+
+    def _files(self, generation: int):
+        return (
+            os.path.join(self.path, f"vectors.{generation}.f32"),
+            os.path.join(self.path, f"rows.{generation}.bin"),
+        )
+
+    def _map(self, generation: int, capacity: int):
+        vectors_path, rows_path = self._files(generation)
+        for path, row_size in (
+            (vectors_path, self.dimension * 4),
+            (rows_path, ROW_DTYPE.itemsize),
+        ):
+            with open(path, "ab") as f:
+                if f.tell() < capacity * row_size:
+                    f.truncate(capacity * row_size)
+
+        vectors = np.memmap(
+            vectors_path, dtype=np.float32, mode="r+", shape=(capacity, self.dimension)
+        )
+        rows = np.memmap(rows_path, dtype=ROW_DTYPE, mode="r+", shape=(capacity,))
+        return vectors, rows
+
+    def _open(self):
+        dimension = self._meta("dimension", self.dimension)
+        if dimension != self.dimension:
+            raise ValueError(
+                f"{self.path} stores {dimension}-d vectors, "
+                f"but the embedding model produces {self.dimension}-d"
+            )
+
+        self.generation = self._meta("generation", 0)
+        self.count = self._meta("count", 0)
+        self.epoch = self._meta("epoch", 0)
+        self.capacity = self._meta("capacity", MIN_CAPACITY)
+        self._vectors, self._rows = self._map(self.generation, self.capacity)
+        self._set_meta(
+            dimension=self.dimension,
+            generation=self.generation,
+            count=self.count,
+            epoch=self.epoch,
+            capacity=self.capacity,
+        )
+        self._db.commit()
+
+    def _grow(self, needed: int):
+        if needed <= self.capacity:
+            return
+        capacity = self.capacity
+        while capacity < needed:
+            capacity *= 2
+        self._vectors.flush()
+        self._rows.flush()
+        self._vectors, self._rows = self._map(self.generation, capacity)
+        self.capacity = capacity
+        self._set_meta(capacity=capacity)
+
+    def _bump_generation(self):
+        try:
+            get_binary_redis().incr(INDEX_GENERATION_KEY)
+        except Exception:
+            pass
+
+    def _tombstone(self, case_ids: List[int]) -> int:
+        placeholders = ",".join("?" * len(case_ids))
+        rows = [
+            row
+            for (row,) in self._db.execute(
+                f"SELECT row FROM points WHERE case_id IN ({placeholders})", case_ids
+            )
+        ]
+        if rows:
+            self._rows["alive"][rows] = False
+            self._db.execute(
+                f"DELETE FROM points WHERE case_id IN ({placeholders})", case_ids
+            )
+        return len(rows)
+
+    def upsert_points(
+        self,
+        point_ids: List[str],
+        embeddings: np.ndarray,
+        payloads: List[Dict],
+        lexical_texts: Optional[List[str]] = None,
+    ):
+        if not payloads:
+            return
+        embeddings = _normalize(embeddings)
+
+        with self._locked(exclusive=True):
+            self._tombstone([payload["case_id"] for payload in payloads])
+
+            start = self.count
+            end = start + len(payloads)
+            self._grow(end)
+
+            self._vectors[start:end] = embeddings
+            self._rows[start:end] = [
+                (
+                    payload["case_id"],
+                    CASE_TYPE_CODES.get(payload["case_type"], -1),
+                    STATUS_CODES.get(payload["status"], -1),
+                    True,
+                )
+                for payload in payloads
+            ]
+            self._vectors.flush()
+            self._rows.flush()
+
+            self._db.executemany(
+                "INSERT INTO points (row, case_id, payload) VALUES (?, ?, ?)",
+                [
+                    (start + i, payload["case_id"], json.dumps(payload))
+                    for i, payload in enumerate(payloads)
+                ],
+            )
+            self._set_meta(count=end, epoch=self.epoch + 1)
+            self._db.commit()
+            self.count = end
+            self.epoch += 1
+            self._partitions = {}
+
+        self._bump_generation()
+
+    def index_case(self, case: Case) -> bool:
+        try:
+            search_text = self._create_search_text(case)
+            if settings.embedding_index_chunks:
+                embedding = pool_chunks(
+                    self.embedding_service.encode_chunks(search_text)
+                )
+            else:
+                embedding = self.embedding_service.encode_document(search_text)
+
+            self.upsert_points(
+                [self._generate_point_id(case.id)],
+                embedding[np.newaxis, :],
+                [self._build_payload(case)],
+            )
+            return True
+        except Exception:
+            return False
+
+    def delete_cases(self, case_ids: List[int]):
+        if not case_ids:
+            return
+        with self._locked(exclusive=True):
+            self._tombstone(case_ids)
+            self._set_meta(epoch=self.epoch + 1)
+            self._db.commit()
+            self.epoch += 1
+            self._partitions = {}
+            dead = (
+                self.count
+                - self._db.execute("SELECT COUNT(*) FROM points").fetchone()[0]
+            )
+            if self.count > MIN_CAPACITY and (
+                dead > settings.embedded_compaction_ratio * self.count
+            ):
+                self.compact()
+
+        self._bump_generation()
+
+    def delete_case(self, case_id: int) -> bool:
+        try:
+            self.delete_cases([case_id])
+            return True
+        except Exception:
+            return False
+
+    def update_case(self, case: Case) -> bool:
+        return self.index_case(case)
+
+    def compact(self):
+        with self._locked(exclusive=True):
+            alive = np.flatnonzero(self._rows["alive"][: self.count])
+            generation = self.generation + 1
+            capacity = max(MIN_CAPACITY, 2 * len(alive))
+            vectors, rows = self._map(generation, capacity)
+            vectors[: len(alive)] = self._vectors[alive]
+            rows[: len(alive)] = self._rows[alive]
+            vectors.flush()
+            rows.flush()
+
+            self._db.executemany(
+                "UPDATE points SET row = ? WHERE row = ?",
+                [(new, int(old)) for new, old in enumerate(alive)],
+            )
+            self._set_meta(generation=generation, count=len(alive), capacity=capacity)
+            self._db.commit()
+
+            old_files = self._files(self.generation)
+            self._vectors, self._rows = vectors, rows
+            self.generation, self.count, self.capacity = (
+                generation,
+                len(alive),
+                capacity,
+            )
+            self._partitions = {}
+            for path in old_files:
+                os.remove(path)
+
+    def _partition(self, case_type_code: int, rows: np.ndarray) -> np.ndarray:
+        candidates = self._partitions.get(case_type_code)
+        if candidates is None:
+            candidates = np.flatnonzero(
+                rows["alive"]
+                & (rows["status"] == APPROVED_CODE)
+                & (rows["case_type"] == case_type_code)
+            )
+            self._partitions[case_type_code] = candidates
+        return candidates
+
+    def _top_k(
+        self,
+        query: np.ndarray,
+        case_type: Optional[str],
+        limit: int,
+        score_threshold: float,
+        exclude_case_id: Optional[int],
+    ):
+        with self._locked():
+            count = self.count
+            vectors = self._vectors[:count]
+            rows = self._rows[:count]
+            case_type_code = CASE_TYPE_CODES.get(case_type) if case_type else None
+
+            partitioned = (
+                case_type_code is not None and settings.embedded_partition_by_case_type
+            )
+            if partitioned:
+                candidates = self._partition(case_type_code, rows)
+            else:
+                mask = rows["alive"] & (rows["status"] == APPROVED_CODE)
+                if case_type_code is not None:
+                    mask &= rows["case_type"] == case_type_code
+                candidates = np.flatnonzero(mask)
+            case_ids = rows["case_id"][candidates]
+
+        if partitioned:
+            scores = vectors[candidates] @ query
+        else:
+            scores = (vectors @ query)[candidates]
+
+        keep = scores >= score_threshold
+        if exclude_case_id:
+            keep &= case_ids != exclude_case_id
+        case_ids, scores = case_ids[keep], scores[keep]
+
+        if len(case_ids) > limit:
+            best = np.argpartition(-scores, limit)[:limit]
+            case_ids, scores = case_ids[best], scores[best]
+        order = np.argsort(-scores)
+        return case_ids[order], scores[order]
+
+    def _payloads(self, case_ids: np.ndarray) -> Dict[int, Dict]:
+        placeholders = ",".join("?" * len(case_ids))
+        with self._locked():
+            return {
+                case_id: json.loads(payload)
+                for case_id, payload in self._db.execute(
+                    "SELECT case_id, payload FROM points "
+                    f"WHERE case_id IN ({placeholders})",
+                    [int(case_id) for case_id in case_ids],
+                )
+            }
+
+    def _query(
+        self,
+        query: np.ndarray,
+        case_type: Optional[str],
+        limit: int,
+        score_threshold: Optional[float],
+        exclude_case_id: Optional[int],
+        lexical_text: Optional[str] = None,
+    ) -> List[Dict]:
+        if score_threshold is None:
+            score_threshold = settings.similarity_threshold
+
+        case_ids, scores = self._top_k(
+            _normalize(query), case_type, limit, score_threshold, exclude_case_id
+        )
+        if not len(case_ids):
+            return []
+
+        payloads = self._payloads(case_ids)
+        return [
+            self._to_similar_case(
+                ScoredPoint(
+                    id=int(case_id),
+                    version=0,
+                    score=float(score),
+                    payload=payloads[int(case_id)],
+                )
+            )
+            for case_id, score in zip(case_ids, scores)
+            if int(case_id) in payloads
+        ]
+
+    def _stored_vector(self, case_id: int) -> Optional[np.ndarray]:
+        with self._locked():
+            row = self._db.execute(
+                "SELECT row FROM points WHERE case_id = ?", (case_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            return np.array(self._vectors[row[0]])
+
+    def search_similar(
+        self,
+        query_text: str,
+        case_type: Optional[str] = None,
+        limit: int = 5,
+        score_threshold: Optional[float] = None,
+        exclude_case_id: Optional[int] = None,
+    ) -> List[Dict]:
+        query_embedding = self.embedding_service.encode_query(query_text)
+        return self._query(
+            query_embedding, case_type, limit, score_threshold, exclude_case_id
+        )
+
+    def search_by_case(
+        self, case: Case, limit: int = 5, score_threshold: Optional[float] = None
+    ) -> List[Dict]:
+        stored = None
+        if case.status == CaseStatus.APPROVED:
+            stored = self._stored_vector(case.id)
+        if stored is not None:
+            self.stored_vector_searches.inc()
+            return self._query(
+                stored, case.case_type.value, limit, score_threshold, case.id
+            )
+
+        self.encoded_searches.inc()
+        return self.search_similar(
+            query_text=self._create_search_text(case),
+            case_type=case.case_type.value,
+            limit=limit,
+            score_threshold=score_threshold,
+            exclude_case_id=case.id,
+        )
+
+
+class AsyncEmbeddedVectorStore:
+    def __init__(self):
+        self.store = EmbeddedVectorStore()
+
+    async def index_case(self, case: Case) -> bool:
+        return await asyncio.to_thread(self.store.index_case, case)
+
+    async def search_similar(self, *args, **kwargs) -> List[Dict]:
+        return await asyncio.to_thread(self.store.search_similar, *args, **kwargs)
+
+    async def search_by_case(self, *args, **kwargs) -> List[Dict]:
+        return await asyncio.to_thread(self.store.search_by_case, *args, **kwargs)
+
+    async def delete_case(self, case_id: int) -> bool:
+        return await asyncio.to_thread(self.store.delete_case, case_id)
+
+    async def update_case(self, case: Case) -> bool:
+        return await asyncio.to_thread(self.store.update_case, case)
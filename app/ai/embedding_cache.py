@@ -0,0 +1,120 @@
+import hashlib
+import sys
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Optional
+
+import numpy as np
+
+from app.core.metrics import metrics
+from app.db.redis import get_binary_redis
+
+
+def normalize_text(text: str) -> str:
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+class EmbeddingCache:
+    def __init__(
+        self,
+        model_name: str,
+        max_bytes: int,
+        redis_ttl_seconds: int,
+        use_redis: bool = True,
+    ):
+        self.model_name = model_name
+        self.max_bytes = max_bytes
+        self.redis_ttl_seconds = redis_ttl_seconds
+        self.use_redis = use_redis
+
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+        self.local_hits = metrics.counter("embedding_cache_local_hits")
+        self.redis_hits = metrics.counter("embedding_cache_redis_hits")
+        self.misses = metrics.counter("embedding_cache_misses")
+        self.evictions = metrics.counter("embedding_cache_evictions")
+        self.local_bytes = metrics.gauge("embedding_cache_local_bytes")
+
+    def key(self, text: str) -> str:
+        digest = hashlib.sha256(
+            f"{self.model_name}\0{normalize_text(text)}".encode()
+        ).hexdigest()
+        return f"embedding:{digest}"
+
+    def _entry_size(self, key: str, value: bytes) -> int:
+        return sys.getsizeof(key) + sys.getsizeof(value)
+
+    def _get_local(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def _set_local(self, key: str, value: bytes):
+        size = self._entry_size(key, value)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= self._entry_size(key, previous)
+
+            self._entries[key] = value
+            self._size += size
+
+            while self._size > self.max_bytes:
+                evicted_key, evicted = self._entries.popitem(last=False)
+                self._size -= self._entry_size(evicted_key, evicted)
+                self.evictions.inc()
+
+            self.local_bytes.set(self._size)
+
+    def _get_remote(self, key: str) -> Optional[bytes]:
+        if not self.use_redis:
+            return None
+        try:
+            return get_binary_redis().get(key)
+        except Exception:
+            return None
+
+    def _set_remote(self, key: str, value: bytes):
+        if not self.use_redis:
+            return
+        try:
+            get_binary_redis().set(key, value, ex=self.redis_ttl_seconds)
+        except Exception:
+            pass
+
+    def get(self, text: str) -> Optional[np.ndarray]:
+        key = self.key(text)
+
+        value = self._get_local(key)
+        if value is not None:
+            self.local_hits.inc()
+            return np.frombuffer(value, dtype=np.float32)
+
+        value = self._get_remote(key)
+        if value is not None:
+            self.redis_hits.inc()
+            self._set_local(key, value)
+            return np.frombuffer(value, dtype=np.float32)
+
+        self.misses.inc()
+        return None
+
+    def set(self, text: str, embedding: np.ndarray):
+        key = self.key(text)
+        value = np.asarray(embedding, dtype=np.float32).tobytes()
+        self._set_local(key, value)
+        self._set_remote(key, value)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.local_bytes.set(0)
@@ -0,0 +1,68 @@
+import json
+import socket
+from queue import Empty, LifoQueue
+from typing import List
+
+import numpy as np
+
+from app.ai.embedding_protocol import (
+    OP_SPLIT_CHUNKS,
+    OP_STATS,
+    STATUS_OK,
+    EmbeddingProtocolError,
+    pack_texts,
+    recv_frame,
+    unpack_embeddings,
+)
+
+
+class EmbeddingClient:
+    def __init__(self, socket_path: str, timeout: float = 30.0):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._pool: LifoQueue = LifoQueue()
+
+    def _connect(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        return sock
+
+    def _acquire(self) -> socket.socket:
+        try:
+            return self._pool.get_nowait()
+        except Empty:
+            return self._connect()
+
+    def _request(self, frame: bytes) -> bytes:
+        for attempt in range(2):
+            sock = self._acquire()
+            try:
+                sock.sendall(frame)
+                status, payload = recv_frame(sock)
+            except (OSError, EmbeddingProtocolError):
+                sock.close()
+                if attempt:
+                    raise
+                continue
+
+            self._pool.put(sock)
+            if status != STATUS_OK:
+                raise EmbeddingProtocolError(payload.decode("utf-8"))
+            return payload
+
+    def encode(self, op: int, texts: List[str]) -> np.ndarray:
+        return unpack_embeddings(self._request(pack_texts(op, texts)))
+
+    def split_chunks(self, text: str) -> List[str]:
+        return json.loads(self._request(pack_texts(OP_SPLIT_CHUNKS, [text])))
+
+    def stats(self) -> dict:
+        return json.loads(self._request(pack_texts(OP_STATS, [])))
+
+    def close(self):
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except Empty:
+                return
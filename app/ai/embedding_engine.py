@@ -1,12 +1,84 @@
+import asyncio
 from typing import List
 
+import numpy as np
 import torch
 from huggingface_hub import login
 from sentence_transformers import SentenceTransformer
 
+from app.ai.batcher import MicroBatcher
+from app.ai.embedding_cache import EmbeddingCache
+from app.ai.embedding_client import EmbeddingClient
+from app.ai.embedding_protocol import (
+    OP_ENCODE_BATCH,
+    OP_ENCODE_CHUNKS,
+    OP_ENCODE_DOCUMENT,
+)
+from app.ai.model_artifacts import (
+    ArtifactChecksumError,
+    model_identity,
+    verify_artifact,
+)
 from app.core.config import settings
 
 
+def _model_source() -> dict:
+    if settings.embedding_model_path:
+        if not settings.embedding_model_sha256:
+            raise ArtifactChecksumError(
+                "embedding_model_sha256 is required with embedding_model_path"
+            )
+        verify_artifact(settings.embedding_model_path, settings.embedding_model_sha256)
+        return {
+            "model_name_or_path": settings.embedding_model_path,
+            "local_files_only": True,
+        }
+
+    login(token=settings.hf_token)
+    return {"model_name_or_path": settings.embedding_model, "token": settings.hf_token}
+
+
+def load_model(backend: str) -> SentenceTransformer:
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    source = _model_source()
+
+    if backend == "onnx":
+        model_kwargs = {"provider": settings.embedding_onnx_provider}
+        if settings.embedding_onnx_file:
+            model_kwargs["file_name"] = settings.embedding_onnx_file
+        return SentenceTransformer(
+            **source, device=device, backend="onnx", model_kwargs=model_kwargs
+        )
+
+    if backend == "torch_int8":
+        model = SentenceTransformer(**source, device="cpu")
+        return torch.ao.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+        )
+
+    return SentenceTransformer(**source, device=device)
+
+
+def cache_namespace() -> str:
+    return ":".join(
+        str(part)
+        for part in (
+            model_identity(),
+            settings.embedding_backend,
+            settings.embedding_onnx_file or "",
+            settings.embedding_chunk_tokens,
+            settings.embedding_chunk_overlap,
+            settings.embedding_max_tokens,
+        )
+    )
+
+
+def pool_chunks(embeddings: np.ndarray) -> np.ndarray:
+    normalized = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+    pooled = normalized.mean(axis=0)
+    return (pooled / np.linalg.norm(pooled)).astype(np.float32)
+
+
 class EmbeddingEngine:
     _instance = None
 
@@ -20,24 +92,119 @@ class EmbeddingEngine:
         if self._initialized:
             return
 
-        login(token=settings.hf_token)
-
-        device = "cuda" if torch.cuda.is_available() else "cpu"
-        self.model = SentenceTransformer(
-            settings.embedding_model, device=device, token=settings.hf_token
+        if settings.embedding_server_socket:
+            self.remote = EmbeddingClient(settings.embedding_server_socket)
+        else:
+            self.remote = None
+            self.model = load_model(settings.embedding_backend)
+            self.batcher = MicroBatcher(
+                self._encode,
+                max_batch_size=settings.embedding_max_batch_size,
+                window_ms=settings.embedding_batch_window_ms,
+            )
+        self.cache = EmbeddingCache(
+            cache_namespace(),
+            max_bytes=settings.embedding_cache_max_bytes,
+            redis_ttl_seconds=settings.embedding_cache_ttl_seconds,
+            use_redis=settings.embedding_cache_redis,
         )
         self._initialized = True
 
-    def encode_query(self, text: str) -> List[float]:
-        embedding = self.model.encode(text, convert_to_tensor=True)
-        return embedding.cpu().tolist()
-
-    def encode_document(self, text: str) -> List[float]:
-        embedding = self.model.encode(text, convert_to_tensor=True)
-        return embedding.cpu().tolist()
-
-    def encode_batch(self, texts: List[str]) -> List[List[float]]:
+    def _encode(self, texts: List[str]) -> np.ndarray:
         embeddings = self.model.encode(
-            texts, convert_to_tensor=True, show_progress_bar=True
+            texts,
+            batch_size=settings.embedding_max_batch_size,
+            convert_to_numpy=True,
         )
-        return embeddings.cpu().tolist()
+        return embeddings.astype(np.float32, copy=False)
+
+    def warm_up(self, lengths: List[int]):
+        for length in lengths:
+            text = " ".join(["가"] * length)
+            if self.remote:
+                self.remote.encode(OP_ENCODE_DOCUMENT, [text])
+            else:
+                self._encode([text])
+
+    def split_chunks(self, text: str) -> List[str]:
+        if self.remote:
+            return self.remote.split_chunks(text)
+
+        window = min(settings.embedding_chunk_tokens, self.model.max_seq_length) - 2
+        overlap = min(settings.embedding_chunk_overlap, window // 2)
+
+        tokenizer = self.model.tokenizer
+        token_ids = tokenizer(text, add_special_tokens=False)["input_ids"]
+        if len(token_ids) <= window:
+            return [text]
+
+        token_ids = token_ids[: settings.embedding_max_tokens]
+        step = window - overlap
+        windows = [
+            token_ids[start : start + window]
+            for start in range(0, max(len(token_ids) - overlap, 1), step)
+        ]
+        return tokenizer.batch_decode(windows, skip_special_tokens=True)
+
+    def encode_chunks(self, text: str) -> np.ndarray:
+        if self.remote:
+            return self.remote.encode(OP_ENCODE_CHUNKS, [text])
+        return self.batcher.encode(self.split_chunks(text))
+
+    def _encode_text(self, text: str) -> np.ndarray:
+        if self.remote:
+            return self.remote.encode(OP_ENCODE_DOCUMENT, [text])[0]
+
+        embeddings = self.encode_chunks(text)
+        if len(embeddings) == 1:
+            return embeddings[0]
+        return pool_chunks(embeddings)
+
+    def _encode_cached(self, text: str) -> np.ndarray:
+        embedding = self.cache.get(text)
+        if embedding is None:
+            embedding = self._encode_text(text)
+            self.cache.set(text, embedding)
+        return embedding
+
+    def encode_query(self, text: str) -> np.ndarray:
+        return self._encode_cached(text)
+
+    def encode_document(self, text: str) -> np.ndarray:
+        return self._encode_cached(text)
+
+    def encode_batch(self, texts: List[str], batched: bool = False) -> np.ndarray:
+        if self.remote:
+            return self.remote.encode(OP_ENCODE_BATCH, texts)
+
+        chunked = [self.split_chunks(text) for text in texts]
+        flat = [chunk for chunks in chunked for chunk in chunks]
+
+        if batched:
+            embeddings = self.batcher.encode(flat)
+        else:
+            embeddings = self.model.encode(
+                flat, convert_to_numpy=True, show_progress_bar=True
+            ).astype(np.float32, copy=False)
+        if len(flat) == len(texts):
+            return embeddings
+
+        pooled = np.empty((len(texts), embeddings.shape[1]), dtype=np.float32)
+        offset = 0
+        for i, chunks in enumerate(chunked):
+            count = len(chunks)
+            if count == 1:
+                pooled[i] = embeddings[offset]
+            else:
+                pooled[i] = pool_chunks(embeddings[offset : offset + count])
+            offset += count
+        return pooled
+
+    async def aencode_query(self, text: str) -> np.ndarray:
+        return await asyncio.to_thread(self.encode_query, text)
+
+    async def aencode_document(self, text: str) -> np.ndarray:
+        return await asyncio.to_thread(self.encode_document, text)
+
+    async def aencode_chunks(self, text: str) -> np.ndarray:
+        return await asyncio.to_thread(self.encode_chunks, text)
@@ -0,0 +1,77 @@
+import argparse
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+from app.ai.embedding_engine import load_model
+
+CORPUS_PATH = Path(__file__).parent / "fixtures" / "parity_corpus.txt"
+
+
+def load_corpus(path: Path = CORPUS_PATH) -> List[str]:
+    with open(path, "r", encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def _encode(backend: str, corpus: List[str]) -> np.ndarray:
+    model = load_model(backend)
+    return model.encode(corpus, convert_to_numpy=True, normalize_embeddings=True)
+
+
+def _top_k(embeddings: np.ndarray, k: int) -> np.ndarray:
+    scores = embeddings @ embeddings.T
+    np.fill_diagonal(scores, -np.inf)
+    return np.argsort(-scores, axis=1)[:, :k]
+
+
+def compare_backends(
+    backend: str, corpus: List[str], reference: str = "torch", k: int = 5
+) -> Dict[str, float]:
+    expected = _encode(reference, corpus)
+    actual = _encode(backend, corpus)
+
+    cosine = np.sum(expected * actual, axis=1)
+    drift = 1.0 - cosine
+
+    k = min(k, len(corpus) - 1)
+    expected_neighbors = _top_k(expected, k)
+    actual_neighbors = _top_k(actual, k)
+    overlap = [
+        len(set(e) & set(a)) / k for e, a in zip(expected_neighbors, actual_neighbors)
+    ]
+
+    return {
+        "documents": len(corpus),
+        "mean_cosine": float(np.mean(cosine)),
+        "min_cosine": float(np.min(cosine)),
+        "max_drift": float(np.max(drift)),
+        "p95_drift": float(np.percentile(drift, 95)),
+        f"top{k}_overlap": float(np.mean(overlap)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare an embedding backend against the fp32 torch model"
+    )
+    parser.add_argument("--backend", required=True, choices=["torch_int8", "onnx"])
+    parser.add_argument("--corpus", type=Path, default=CORPUS_PATH)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--min-cosine", type=float, default=0.99)
+    args = parser.parse_args()
+
+    report = compare_backends(args.backend, load_corpus(args.corpus), k=args.top_k)
+    for name, value in report.items():
+        print(
+            f"{name}: {value:.4f}" if isinstance(value, float) else f"{name}: {value}"
+        )
+
+    if report["min_cosine"] < args.min_cosine:
+        print(f"FAIL: min_cosine below {args.min_cosine}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+import json
+import socket
+import struct
+from typing import List, Tuple
+
+import numpy as np
+
+OP_ENCODE_QUERY = 1
+OP_ENCODE_DOCUMENT = 2
+OP_ENCODE_BATCH = 3
+OP_ENCODE_CHUNKS = 4
+OP_STATS = 5
+OP_SPLIT_CHUNKS = 6
+
+STATUS_OK = 0
+STATUS_ERROR = 1
+
+HEADER = struct.Struct("!BI")
+COUNT = struct.Struct("!I")
+SHAPE = struct.Struct("!II")
+
+
+class EmbeddingProtocolError(RuntimeError):
+    pass
+
+
+def pack_texts(op: int, texts: List[str]) -> bytes:
+    parts = [COUNT.pack(len(texts))]
+    for text in texts:
+        encoded = text.encode("utf-8")
+        parts.append(COUNT.pack(len(encoded)))
+        parts.append(encoded)
+    payload = b"".join(parts)
+    return HEADER.pack(op, len(payload)) + payload
+
+
+def unpack_texts(payload: bytes) -> List[str]:
+    (count,) = COUNT.unpack_from(payload, 0)
+    offset = COUNT.size
+    texts = []
+    for _ in range(count):
+        (length,) = COUNT.unpack_from(payload, offset)
+        offset += COUNT.size
+        texts.append(payload[offset : offset + length].decode("utf-8"))
+        offset += length
+    return texts
+
+
+def pack_embeddings(embeddings: np.ndarray) -> bytes:
+    matrix = np.ascontiguousarray(np.atleast_2d(embeddings), dtype="<f4")
+    payload = SHAPE.pack(*matrix.shape) + matrix.tobytes()
+    return HEADER.pack(STATUS_OK, len(payload)) + payload
+
+
+def unpack_embeddings(payload: bytes) -> np.ndarray:
+    rows, dimension = SHAPE.unpack_from(payload, 0)
+    return np.frombuffer(payload, dtype="<f4", offset=SHAPE.size).reshape(
+        rows, dimension
+    )
+
+
+def pack_json(data: dict) -> bytes:
+    payload = json.dumps(data).encode("utf-8")
+    return HEADER.pack(STATUS_OK, len(payload)) + payload
+
+
+def pack_error(message: str) -> bytes:
+    payload = message.encode("utf-8")
+    return HEADER.pack(STATUS_ERROR, len(payload)) + payload
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:], size - received)
+        if count == 0:
+            raise EmbeddingProtocolError("Embedding server closed the connection")
+        received += count
+    return bytes(buffer)
+
+
+def recv_frame(sock: socket.socket) -> Tuple[int, bytes]:
+    code, length = HEADER.unpack(_recv_exactly(sock, HEADER.size))
+    return code, _recv_exactly(sock, length)
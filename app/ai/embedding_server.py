@@ -0,0 +1,140 @@
+import argparse
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import numpy as np
+
+from app.ai.batcher import QUEUE_WAIT_BUCKETS
+from app.ai.embedding_engine import EmbeddingEngine
+from app.ai.embedding_protocol import (
+    HEADER,
+    OP_ENCODE_BATCH,
+    OP_ENCODE_CHUNKS,
+    OP_ENCODE_DOCUMENT,
+    OP_ENCODE_QUERY,
+    OP_SPLIT_CHUNKS,
+    OP_STATS,
+    pack_embeddings,
+    pack_error,
+    pack_json,
+    unpack_texts,
+)
+from app.core.config import settings
+from app.core.metrics import metrics
+
+DEFAULT_SOCKET = "/tmp/linka-embedding.sock"
+
+
+class EmbeddingServer:
+    def __init__(self, socket_path: str, engine: EmbeddingEngine, max_concurrency: int):
+        self.socket_path = socket_path
+        self.engine = engine
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="embedding-server"
+        )
+        self.handlers = {
+            OP_ENCODE_QUERY: self._encode_query,
+            OP_ENCODE_DOCUMENT: self._encode_document,
+            OP_ENCODE_BATCH: lambda texts: engine.encode_batch(texts, batched=True),
+            OP_ENCODE_CHUNKS: lambda texts: engine.encode_chunks(texts[0]),
+        }
+
+        self._connections = 0
+        self._in_flight = 0
+        self.connections_gauge = metrics.gauge("embedding_server_connections")
+        self.in_flight_gauge = metrics.gauge("embedding_server_in_flight")
+        self.request_latency = metrics.histogram(
+            "embedding_server_request_seconds", QUEUE_WAIT_BUCKETS
+        )
+
+    def _encode_query(self, texts: List[str]) -> np.ndarray:
+        return np.stack([self.engine.encode_query(text) for text in texts])
+
+    def _encode_document(self, texts: List[str]) -> np.ndarray:
+        return np.stack([self.engine.encode_document(text) for text in texts])
+
+    async def _dispatch(self, op: int, payload: bytes) -> bytes:
+        if op == OP_STATS:
+            return pack_json(metrics.snapshot())
+
+        loop = asyncio.get_running_loop()
+        if op == OP_SPLIT_CHUNKS:
+            try:
+                chunks = await loop.run_in_executor(
+                    self.executor, self.engine.split_chunks, unpack_texts(payload)[0]
+                )
+            except Exception as e:
+                return pack_error(str(e))
+            return pack_json(chunks)
+
+        handler = self.handlers.get(op)
+        if handler is None:
+            return pack_error(f"Unknown operation: {op}")
+
+        started_at = loop.time()
+        self._in_flight += 1
+        self.in_flight_gauge.set(self._in_flight)
+        try:
+            embeddings = await loop.run_in_executor(
+                self.executor, handler, unpack_texts(payload)
+            )
+        except Exception as e:
+            return pack_error(str(e))
+        finally:
+            self._in_flight -= 1
+            self.in_flight_gauge.set(self._in_flight)
+            self.request_latency.observe(loop.time() - started_at)
+
+        return pack_embeddings(embeddings)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._connections += 1
+        self.connections_gauge.set(self._connections)
+        try:
+            while True:
+                try:
+                    op, length = HEADER.unpack(await reader.readexactly(HEADER.size))
+                    payload = await reader.readexactly(length)
+                except asyncio.IncompleteReadError:
+                    break
+                writer.write(await self._dispatch(op, payload))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._connections -= 1
+            self.connections_gauge.set(self._connections)
+            writer.close()
+
+    async def serve(self):
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+        server = await asyncio.start_unix_server(self._handle, path=self.socket_path)
+        os.chmod(self.socket_path, 0o660)
+        async with server:
+            await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Serve batched embeddings to API workers over a Unix socket"
+    )
+    parser.add_argument(
+        "--socket", default=settings.embedding_server_socket or DEFAULT_SOCKET
+    )
+    parser.add_argument("--max-concurrency", type=int, default=64)
+    args = parser.parse_args()
+
+    settings.embedding_server_socket = None
+    engine = EmbeddingEngine()
+    engine.warm_up(settings.embedding_warmup_lengths)
+
+    server = EmbeddingServer(args.socket, engine, args.max_concurrency)
+    asyncio.run(server.serve())
+
+
+if __name__ == "__main__":
+    main()
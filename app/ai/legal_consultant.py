@@ -1,14 +1,25 @@
+import asyncio
+import time
+from typing import AsyncIterator, Optional
+
 from openai import OpenAI
 
 from app.ai.legal_search import LegalRepository
+from app.ai.openai_client import client as async_client
 from app.ai.prompts.loader import prompts
 from app.core.config import settings
+from app.core.metrics import metrics
+
+TTFT_BUCKETS = (0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 8.0, 13.0, 20.0)
 
 
 class LegalConsultant:
     def __init__(self):
         self.client = OpenAI(api_key=settings.openai_api_key)
+        self.async_client = async_client
         self.legal_search = LegalRepository()
+        self.ttft = metrics.histogram("consultation_ttft_seconds", TTFT_BUCKETS)
+        self.streams_cancelled = metrics.counter("consultation_streams_cancelled")
 
     def _generate_keywords(self, case_type: str, statement: str, question: str) -> str:
         messages = [
@@ -52,14 +63,39 @@ class LegalConsultant:
 
         return "".join(parts)
 
-    def generate_response(
+    def summarize(
+        self, previous_summary: Optional[str], conversation: list[dict]
+    ) -> str:
+        transcript = "\n".join(
+            f"{'상담사' if msg['role'] == 'assistant' else '피해자'}: {msg['content']}"
+            for msg in conversation
+        )
+        messages = [
+            {"role": "system", "content": prompts.consultation_summary},
+            {
+                "role": "user",
+                "content": f"이전 요약:\n{previous_summary or '없음'}\n\n새 대화:\n{transcript}",
+            },
+        ]
+
+        response = self.client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=messages,
+            max_tokens=settings.consultation_summary_tokens,
+            temperature=0.3,
+        )
+
+        return response.choices[0].message.content.strip()
+
+    def _build_messages(
         self,
         case_statement: str,
         case_type: str,
         conversation_history: list[dict],
         user_question: str,
         include_legal_search: bool = True,
-    ) -> str:
+        conversation_summary: Optional[str] = None,
+    ) -> list[dict]:
         legal_context = ""
 
         if include_legal_search:
@@ -82,10 +118,37 @@ class LegalConsultant:
             },
         ]
 
+        if conversation_summary:
+            messages.append(
+                {
+                    "role": "system",
+                    "content": f"이전 상담 내용 요약:\n{conversation_summary}",
+                }
+            )
+
         for msg in conversation_history:
             messages.append({"role": msg["role"], "content": msg["content"]})
 
         messages.append({"role": "user", "content": user_question})
+        return messages
+
+    def generate_response(
+        self,
+        case_statement: str,
+        case_type: str,
+        conversation_history: list[dict],
+        user_question: str,
+        include_legal_search: bool = True,
+        conversation_summary: Optional[str] = None,
+    ) -> str:
+        messages = self._build_messages(
+            case_statement,
+            case_type,
+            conversation_history,
+            user_question,
+            include_legal_search,
+            conversation_summary,
+        )
 
         response = self.client.chat.completions.create(
             model="gpt-4o-mini",
@@ -95,3 +158,45 @@ class LegalConsultant:
         )
 
         return response.choices[0].message.content.strip()
+
+    async def stream_response(
+        self,
+        case_statement: str,
+        case_type: str,
+        conversation_history: list[dict],
+        user_question: str,
+        include_legal_search: bool = True,
+        conversation_summary: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        started_at = time.perf_counter()
+        messages = await asyncio.to_thread(
+            self._build_messages,
+            case_statement,
+            case_type,
+            conversation_history,
+            user_question,
+            include_legal_search,
+            conversation_summary,
+        )
+
+        stream = await self.async_client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=messages,
+            max_tokens=1500,
+            temperature=0.7,
+            stream=True,
+        )
+
+        first_token = True
+        try:
+            async with stream:
+                async for chunk in stream:
+                    if not chunk.choices or not chunk.choices[0].delta.content:
+                        continue
+                    if first_token:
+                        self.ttft.observe(time.perf_counter() - started_at)
+                        first_token = False
+                    yield chunk.choices[0].delta.content
+        except (asyncio.CancelledError, GeneratorExit):
+            self.streams_cancelled.inc()
+            raise
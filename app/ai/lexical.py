@@ -0,0 +1,53 @@
+import math
+import re
+import zlib
+from collections import Counter
+from typing import List
+
+from qdrant_client.models import SparseVector
+
+from app.ai.embedding_cache import normalize_text
+
+LEXICAL_VECTOR_NAME = "lexical"
+
+NUMBER_PATTERN = re.compile(r"\d+(?:[.\-]\d+)*")
+WORD_PATTERN = re.compile(r"[0-9a-z_.@]+|[가-힣]+")
+IDENTIFIER_MIN_DIGITS = 7
+HANGUL_PATTERN = re.compile(r"[가-힣]+")
+NGRAM_SIZES = (2, 3)
+
+
+def lexical_tokens(text: str) -> List[str]:
+    text = normalize_text(text).lower()
+    tokens = []
+
+    def extract_identifier(match: re.Match) -> str:
+        digits = re.sub(r"\D", "", match.group())
+        if len(digits) < IDENTIFIER_MIN_DIGITS:
+            return match.group()
+        tokens.append(f"#{digits}")
+        return " "
+
+    text = NUMBER_PATTERN.sub(extract_identifier, text)
+
+    for word in WORD_PATTERN.findall(text):
+        word = word.strip("._")
+        if not word:
+            continue
+        if not HANGUL_PATTERN.fullmatch(word) or len(word) <= NGRAM_SIZES[0]:
+            tokens.append(word)
+            continue
+        for size in NGRAM_SIZES:
+            tokens.extend(word[i : i + size] for i in range(len(word) - size + 1))
+
+    return tokens
+
+
+def encode_lexical(text: str) -> SparseVector:
+    weights = {}
+    for token, count in Counter(lexical_tokens(text)).items():
+        index = zlib.crc32(token.encode())
+        weights[index] = weights.get(index, 0.0) + 1.0 + math.log(count)
+
+    indices = sorted(weights)
+    return SparseVector(indices=indices, values=[weights[i] for i in indices])
@@ -0,0 +1,269 @@
+import time
+from typing import List, Optional, Union
+
+import numpy as np
+from qdrant_client import QdrantClient
+from qdrant_client.models import (
+    CreateAlias,
+    CreateAliasOperation,
+    DeleteAlias,
+    DeleteAliasOperation,
+    Distance,
+    FieldCondition,
+    Filter,
+    FilterSelector,
+    HnswConfigDiff,
+    IntegerIndexParams,
+    KeywordIndexParams,
+    MatchValue,
+    PayloadSchemaType,
+    Range,
+    SearchParams,
+    VectorParams,
+)
+
+from app.ai.embedding_engine import EmbeddingEngine
+from app.ai.model_artifacts import model_identity
+from app.ai.vector_store import (
+    MODEL_METADATA_KEY,
+    WORKER_ID,
+    building_versions,
+    is_compatible,
+    journal_key,
+    version_collection_name,
+    writers_key,
+)
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.db.redis import get_binary_redis
+from app.models.consultation import ConsultationMessage
+
+TENANT_FIELD = "consultation_id"
+
+
+class MessageVectorStore:
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self.client = QdrantClient(location=settings.qdrant_url)
+        self.alias_name = settings.qdrant_message_collection
+        self.collection_name = version_collection_name(
+            hybrid=False, collection=self.alias_name
+        )
+        self.embedding_service = EmbeddingEngine()
+        self.index_failures = metrics.counter("consultation_message_index_failures")
+        self._read_collection_name = self.collection_name
+        self._alias_checked_at = 0.0
+        self._ensure_collection()
+        self._report_writer()
+        self._initialized = True
+
+    def _ensure_collection(self):
+        if not self.client.collection_exists(self.collection_name):
+            self._create_collection()
+        if self.alias_target() is None:
+            self.swap_alias(self.collection_name)
+
+    def _create_collection(self):
+        self.client.create_collection(
+            collection_name=self.collection_name,
+            vectors_config=VectorParams(
+                size=settings.embedding_dimension,
+                distance=Distance.COSINE,
+                on_disk=settings.qdrant_on_disk_vectors,
+            ),
+            hnsw_config=HnswConfigDiff(
+                m=0,
+                payload_m=settings.qdrant_hnsw_m,
+                ef_construct=settings.qdrant_hnsw_ef_construct,
+            ),
+            metadata={MODEL_METADATA_KEY: model_identity()},
+        )
+        self.client.create_payload_index(
+            collection_name=self.collection_name,
+            field_name=TENANT_FIELD,
+            field_schema=KeywordIndexParams(
+                type=PayloadSchemaType.KEYWORD, is_tenant=True
+            ),
+            wait=True,
+        )
+        self.client.create_payload_index(
+            collection_name=self.collection_name,
+            field_name="message_id",
+            field_schema=IntegerIndexParams(
+                type=PayloadSchemaType.INTEGER, lookup=False, range=True
+            ),
+            wait=True,
+        )
+
+    def alias_target(self) -> Optional[str]:
+        for alias in self.client.get_aliases().aliases:
+            if alias.alias_name == self.alias_name:
+                return alias.collection_name
+        return None
+
+    def swap_alias(self, collection_name: str):
+        operations = []
+        if self.alias_target() is not None:
+            operations.append(
+                DeleteAliasOperation(
+                    delete_alias=DeleteAlias(alias_name=self.alias_name)
+                )
+            )
+        operations.append(
+            CreateAliasOperation(
+                create_alias=CreateAlias(
+                    collection_name=collection_name, alias_name=self.alias_name
+                )
+            )
+        )
+        self.client.update_collection_aliases(change_aliases_operations=operations)
+        self._alias_checked_at = 0.0
+
+    def list_versions(self) -> List[str]:
+        prefix = f"{self.alias_name}__"
+        return sorted(
+            col.name
+            for col in self.client.get_collections().collections
+            if col.name.startswith(prefix)
+        )
+
+    def _read_collection(self) -> str:
+        now = time.monotonic()
+        if now - self._alias_checked_at > settings.qdrant_alias_refresh_seconds:
+            target = self.alias_target()
+            if target == self.collection_name or (
+                target is not None
+                and is_compatible(self.client.get_collection(target).config)
+            ):
+                self._read_collection_name = self.alias_name
+            else:
+                self._read_collection_name = self.collection_name
+            self._report_writer()
+            self._alias_checked_at = now
+        return self._read_collection_name
+
+    def _report_writer(self):
+        try:
+            get_binary_redis().zadd(
+                writers_key(self.collection_name), {WORKER_ID: time.time()}
+            )
+        except Exception:
+            pass
+
+    def _journal_write(self, entries: List[Union[int, str]]):
+        if not entries:
+            return
+        self._report_writer()
+        try:
+            redis = get_binary_redis()
+            for version in building_versions(redis, self.alias_name):
+                if version != self.collection_name:
+                    redis.sadd(journal_key(version), *entries)
+        except Exception:
+            pass
+
+    def _tenant_condition(self, consultation_id: int) -> FieldCondition:
+        return FieldCondition(
+            key=TENANT_FIELD, match=MatchValue(value=str(consultation_id))
+        )
+
+    def index_messages(
+        self, messages: List[ConsultationMessage], batch_encode: bool = False
+    ) -> bool:
+        messages = [message for message in messages if message.content]
+        if not messages:
+            return True
+
+        self._journal_write([message.id for message in messages])
+        texts = [message.content for message in messages]
+        try:
+            if batch_encode:
+                embeddings = self.embedding_service.encode_batch(texts)
+            else:
+                embeddings = np.stack(
+                    [self.embedding_service.encode_document(text) for text in texts]
+                )
+            self.client.upload_collection(
+                collection_name=self.collection_name,
+                vectors=embeddings,
+                payload=[
+                    {
+                        TENANT_FIELD: str(message.consultation_id),
+                        "message_id": message.id,
+                        "author_id": message.author_id,
+                    }
+                    for message in messages
+                ],
+                ids=[message.id for message in messages],
+                wait=True,
+            )
+            return True
+        except Exception:
+            self.index_failures.inc()
+            return False
+
+    def search(
+        self,
+        consultation_id: int,
+        query: str,
+        limit: int,
+        before_message_id: Optional[int] = None,
+        score_threshold: Optional[float] = None,
+    ) -> List[int]:
+        return self.search_vector(
+            consultation_id,
+            self.embedding_service.encode_query(query),
+            limit,
+            before_message_id,
+            score_threshold,
+        )
+
+    def search_vector(
+        self,
+        consultation_id: int,
+        query: np.ndarray,
+        limit: int,
+        before_message_id: Optional[int] = None,
+        score_threshold: Optional[float] = None,
+    ) -> List[int]:
+        conditions = [self._tenant_condition(consultation_id)]
+        if before_message_id is not None:
+            conditions.append(
+                FieldCondition(key="message_id", range=Range(lt=before_message_id))
+            )
+
+        results = self.client.query_points(
+            collection_name=self._read_collection(),
+            query=query,
+            query_filter=Filter(must=conditions),
+            limit=limit,
+            score_threshold=score_threshold,
+            search_params=SearchParams(hnsw_ef=settings.qdrant_search_ef),
+            with_payload=["message_id"],
+        ).points
+        return [point.payload["message_id"] for point in results]
+
+    def delete_messages(self, message_ids: List[int]):
+        self._journal_write(message_ids)
+        self.client.delete(
+            collection_name=self.collection_name, points_selector=message_ids
+        )
+
+    def delete_consultation(self, consultation_id: int):
+        self._journal_write([f"consultation:{consultation_id}"])
+        self.client.delete(
+            collection_name=self.collection_name,
+            points_selector=FilterSelector(
+                filter=Filter(must=[self._tenant_condition(consultation_id)])
+            ),
+        )
@@ -0,0 +1,82 @@
+import argparse
+import hashlib
+from pathlib import Path
+
+from app.core.config import settings
+
+
+class ArtifactChecksumError(RuntimeError):
+    pass
+
+
+def model_identity() -> str:
+    if settings.embedding_model_sha256:
+        return f"{settings.embedding_model}@{settings.embedding_model_sha256}"
+    return settings.embedding_model
+
+
+def compute_artifact_digest(path: str) -> str:
+    root = Path(path)
+    digest = hashlib.sha256()
+
+    for file in sorted(p for p in root.rglob("*") if p.is_file()):
+        relative = file.relative_to(root).as_posix()
+        if relative.startswith(".cache/"):
+            continue
+        digest.update(relative.encode())
+        digest.update(b"\0")
+        with open(file, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def verify_artifact(path: str, expected_digest: str):
+    if not Path(path).is_dir():
+        raise ArtifactChecksumError(f"Model artifact directory not found: {path}")
+
+    actual = compute_artifact_digest(path)
+    if actual != expected_digest:
+        raise ArtifactChecksumError(
+            f"Model artifact checksum mismatch for {path}: "
+            f"expected {expected_digest}, got {actual}"
+        )
+
+
+def download_artifact(output: str, revision: str):
+    from huggingface_hub import snapshot_download
+
+    snapshot_download(
+        repo_id=settings.embedding_model,
+        revision=revision,
+        local_dir=output,
+        token=settings.hf_token,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Pin the embedding model as a local, checksummed artifact"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    download = subparsers.add_parser("download")
+    download.add_argument("output")
+    download.add_argument("--revision", required=True)
+
+    digest = subparsers.add_parser("digest")
+    digest.add_argument("path")
+
+    args = parser.parse_args()
+
+    if args.command == "download":
+        download_artifact(args.output, args.revision)
+        print(f"EMBEDDING_MODEL_PATH={args.output}")
+        print(f"EMBEDDING_MODEL_SHA256={compute_artifact_digest(args.output)}")
+    else:
+        print(compute_artifact_digest(args.path))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+import hashlib
+from typing import List, Tuple
+
+import numpy as np
+
+from app.ai.embedding_cache import normalize_text
+from app.core.metrics import metrics
+from app.db.redis import get_redis
+
+SHINGLE_SIZE = 5
+NUM_PERM = 64
+BANDS = 16
+ROWS_PER_BAND = NUM_PERM // BANDS
+SHINGLE_BASE = np.uint64(1_000_003)
+
+_rng = np.random.default_rng(20240501)
+_MULTIPLIERS = _rng.integers(1, 2**63, NUM_PERM, dtype=np.uint64) | np.uint64(1)
+_OFFSETS = _rng.integers(0, 2**63, NUM_PERM, dtype=np.uint64)
+
+
+def canonical_statement(statement: str) -> str:
+    return "".join(normalize_text(statement).lower().split())
+
+
+def minhash_signature(statement: str) -> np.ndarray:
+    text = canonical_statement(statement)
+    codepoints = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32).astype(
+        np.uint64
+    )
+    size = min(SHINGLE_SIZE, len(codepoints))
+    if size == 0:
+        return np.zeros(NUM_PERM, dtype=np.uint32)
+
+    count = len(codepoints) - size + 1
+    shingles = np.zeros(count, dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        for offset in range(size):
+            shingles = shingles * SHINGLE_BASE + codepoints[offset : offset + count]
+        hashes = shingles[:, None] * _MULTIPLIERS + _OFFSETS
+
+    return (hashes >> np.uint64(32)).min(axis=0).astype(np.uint32)
+
+
+def estimate_similarity(a: np.ndarray, b: np.ndarray) -> float:
+    return float(np.count_nonzero(a == b)) / NUM_PERM
+
+
+class NearDuplicateIndex:
+    def __init__(self):
+        self.hits = metrics.counter("near_duplicate_hits")
+        self.own_hits = metrics.counter("near_duplicate_own_hits")
+        self.misses = metrics.counter("near_duplicate_misses")
+
+    def _band_keys(self, signature: np.ndarray, scope: str) -> List[str]:
+        keys = []
+        for band in range(BANDS):
+            rows = signature[band * ROWS_PER_BAND : (band + 1) * ROWS_PER_BAND]
+            digest = hashlib.blake2b(rows.tobytes(), digest_size=8).hexdigest()
+            keys.append(f"dup:lsh:{scope}:{band}:{digest}")
+        return keys
+
+    def _scopes(self, user_id: int) -> Tuple[str, str]:
+        return f"user:{user_id}", "global"
+
+    async def find(
+        self, signature: np.ndarray, user_id: int, threshold: float
+    ) -> List[Tuple[int, float, bool]]:
+        redis = await get_redis()
+        own_scope, global_scope = self._scopes(user_id)
+
+        pipe = redis.pipeline(transaction=False)
+        for key in self._band_keys(signature, own_scope):
+            pipe.smembers(key)
+        for key in self._band_keys(signature, global_scope):
+            pipe.smembers(key)
+        members = await pipe.execute()
+
+        own = set().union(*members[:BANDS])
+        candidates = sorted(own.union(*members[BANDS:]))
+        if not candidates:
+            self.misses.inc()
+            return []
+
+        stored = await redis.mget([f"dup:sig:{case_id}" for case_id in candidates])
+        matches = []
+        for case_id, value in zip(candidates, stored):
+            if value is None:
+                continue
+            similarity = estimate_similarity(
+                signature, np.frombuffer(bytes.fromhex(value), dtype=np.uint32)
+            )
+            if similarity >= threshold:
+                matches.append((int(case_id), similarity, case_id in own))
+
+        if not matches:
+            self.misses.inc()
+            return []
+
+        matches.sort(key=lambda match: (match[2], match[1]), reverse=True)
+        self.hits.inc()
+        if matches[0][2]:
+            self.own_hits.inc()
+        return matches
+
+    async def add(self, case_id: int, user_id: int, signature: np.ndarray):
+        redis = await get_redis()
+        pipe = redis.pipeline(transaction=False)
+        pipe.set(f"dup:sig:{case_id}", signature.tobytes().hex())
+        for scope in self._scopes(user_id):
+            for key in self._band_keys(signature, scope):
+                pipe.sadd(key, case_id)
+        await pipe.execute()
+
+    async def remove(self, case_id: int, user_id: int):
+        redis = await get_redis()
+        value = await redis.get(f"dup:sig:{case_id}")
+        if value is None:
+            return
+
+        signature = np.frombuffer(bytes.fromhex(value), dtype=np.uint32)
+        pipe = redis.pipeline(transaction=False)
+        pipe.delete(f"dup:sig:{case_id}")
+        for scope in self._scopes(user_id):
+            for key in self._band_keys(signature, scope):
+                pipe.srem(key, case_id)
+        await pipe.execute()
+
+
+near_duplicate_index = NearDuplicateIndex()
@@ -0,0 +1,92 @@
+import asyncio
+import json
+from typing import Awaitable, Callable, Dict, List
+
+from app.ai.vector_store import INDEX_GENERATION_KEY
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.db.redis import get_redis
+
+
+class SimilarCaseCache:
+    def __init__(self):
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self.hits = metrics.counter("similar_cache_hits")
+        self.misses = metrics.counter("similar_cache_misses")
+        self.coalesced = metrics.counter("similar_cache_coalesced")
+
+    async def _key(
+        self, redis, case_id: int, case_type: str, limit: int, threshold: float
+    ) -> str:
+        generation = int(await redis.get(INDEX_GENERATION_KEY) or 0)
+        return f"similar:{generation}:{case_id}:{case_type}:{limit}:{threshold}"
+
+    async def get_or_search(
+        self,
+        case_id: int,
+        case_type: str,
+        limit: int,
+        search: Callable[[], Awaitable[List[Dict]]],
+    ) -> List[Dict]:
+        try:
+            redis = await get_redis()
+            key = await self._key(
+                redis, case_id, case_type, limit, settings.similarity_threshold
+            )
+            cached = await redis.get(key)
+        except Exception:
+            return await search()
+
+        if cached is not None:
+            self.hits.inc()
+            return json.loads(cached)
+
+        if key in self._in_flight:
+            self.coalesced.inc()
+            return await asyncio.shield(self._in_flight[key])
+
+        self.misses.inc()
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            results = await self._search_locked(redis, key, search)
+            future.set_result(results)
+            return results
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()
+            raise
+        finally:
+            del self._in_flight[key]
+
+    async def _search_locked(
+        self, redis, key: str, search: Callable[[], Awaitable[List[Dict]]]
+    ) -> List[Dict]:
+        lock_key = f"{key}:lock"
+        lock_ms = int(settings.similar_cache_lock_seconds * 1000)
+
+        if await redis.set(lock_key, "1", nx=True, px=lock_ms):
+            try:
+                results = await search()
+                await redis.set(
+                    key, json.dumps(results), ex=settings.similar_cache_ttl_seconds
+                )
+                return results
+            finally:
+                await redis.delete(lock_key)
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.similar_cache_lock_seconds
+        while loop.time() < deadline:
+            await asyncio.sleep(0.05)
+            cached = await redis.get(key)
+            if cached is not None:
+                self.coalesced.inc()
+                return json.loads(cached)
+            if not await redis.exists(lock_key):
+                break
+
+        return await search()
+
+
+similar_case_cache = SimilarCaseCache()
@@ -0,0 +1,49 @@
+import time
+
+from app.core.config import settings
+
+_message_store_failed_at = None
+
+
+def get_vector_store():
+    if settings.vector_backend == "embedded":
+        from app.ai.embedded_vector_store import EmbeddedVectorStore
+
+        return EmbeddedVectorStore()
+
+    from app.ai.vector_store import VectorStore
+
+    return VectorStore()
+
+
+def get_async_vector_store():
+    if settings.vector_backend == "embedded":
+        from app.ai.embedded_vector_store import AsyncEmbeddedVectorStore
+
+        return AsyncEmbeddedVectorStore()
+
+    from app.ai.async_vector_store import AsyncVectorStore
+
+    return AsyncVectorStore()
+
+
+def get_message_store():
+    global _message_store_failed_at
+    if settings.vector_backend != "qdrant":
+        return None
+    if (
+        _message_store_failed_at is not None
+        and time.monotonic() - _message_store_failed_at
+        < settings.consultation_retrieval_retry_seconds
+    ):
+        return None
+
+    from app.ai.message_vector_store import MessageVectorStore
+
+    try:
+        store = MessageVectorStore()
+    except Exception:
+        _message_store_failed_at = time.monotonic()
+        return None
+    _message_store_failed_at = None
+    return store
@@ -1,52 +1,153 @@
 import hashlib
+import os
+import re
+import socket
+import time
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 
+import numpy as np
 from qdrant_client import QdrantClient
 from qdrant_client.models import (
+    CreateAlias,
+    CreateAliasOperation,
+    DeleteAlias,
+    DeleteAliasOperation,
+    Disabled,
     Distance,
     FieldCondition,
     Filter,
+    FilterSelector,
+    HasIdCondition,
+    HnswConfigDiff,
+    MatchAny,
     MatchValue,
-    PointStruct,
+    Modifier,
+    PayloadSchemaType,
+    QuantizationSearchParams,
+    QueryRequest,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    ScoredPoint,
+    SearchParams,
+    SparseVectorParams,
     VectorParams,
+    VectorParamsDiff,
 )
 
-from app.ai.embedding_engine import EmbeddingEngine
+from app.ai.embedding_engine import EmbeddingEngine, pool_chunks
+from app.ai.lexical import LEXICAL_VECTOR_NAME, encode_lexical
+from app.ai.model_artifacts import model_identity
 from app.core.config import settings
-from app.models.case import Case
-
-
-class VectorStore:
-    _instance = None
-
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
-
-    def __init__(self):
-        if self._initialized:
-            return
-
-        self.client = QdrantClient(url=settings.qdrant_url)
-        self.collection_name = settings.qdrant_collection
-        self.embedding_service = EmbeddingEngine()
-        self._ensure_collection()
-        self._initialized = True
+from app.core.metrics import metrics
+from app.db.redis import get_binary_redis
+from app.models.case import Case, CaseStatus
+
+BUILDING_VERSIONS_KEY = "vector:building"
+INDEX_GENERATION_KEY = "vector:generation"
+DRIFT_REPORT_KEY = "vector:drift"
+MODEL_METADATA_KEY = "embedding_model"
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+LEAN_PAYLOAD_FIELDS = ["case_id", "case_type", "status", "created_at", "indexed_at"]
+
+PAYLOAD_INDEXES = {
+    "status": PayloadSchemaType.KEYWORD,
+    "case_type": PayloadSchemaType.KEYWORD,
+    "case_id": PayloadSchemaType.INTEGER,
+}
+
+
+def version_collection_name(
+    model: Optional[str] = None,
+    dimension: Optional[int] = None,
+    hybrid: Optional[bool] = None,
+    collection: Optional[str] = None,
+) -> str:
+    name, _, revision = (model or model_identity()).partition("@")
+    dimension = dimension or settings.embedding_dimension
+    hybrid = settings.hybrid_search if hybrid is None else hybrid
+    slug = re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+    if revision:
+        slug = f"{slug}-{revision[:12]}"
+    suffix = "_hybrid" if hybrid else ""
+    return f"{collection or settings.qdrant_collection}__{slug}_{dimension}{suffix}"
+
+
+def journal_key(collection_name: str) -> str:
+    return f"vector:journal:{collection_name}"
+
+
+def writers_key(collection_name: str) -> str:
+    return f"vector:writers:{collection_name}"
+
+
+def is_compatible(config) -> bool:
+    vectors = config.params.vectors
+    size = vectors.size if isinstance(vectors, VectorParams) else None
+    identity = (config.metadata or {}).get(MODEL_METADATA_KEY)
+    return size == settings.embedding_dimension and identity == model_identity()
+
+
+def building_versions(redis, alias_name: str) -> List[str]:
+    versions = []
+    for version in redis.smembers(BUILDING_VERSIONS_KEY):
+        version = version if isinstance(version, str) else version.decode()
+        if version.startswith(f"{alias_name}__"):
+            versions.append(version)
+    return versions
+
+
+def stale_writer_versions(versions: List[str], target: str) -> List[str]:
+    redis = get_binary_redis()
+    cutoff = time.time() - settings.qdrant_writer_ttl_seconds
+    stale = []
+    for version in versions:
+        if version == target:
+            continue
+        redis.zremrangebyscore(writers_key(version), 0, cutoff)
+        if redis.zcard(writers_key(version)):
+            stale.append(version)
+    return stale
+
+
+class VectorStoreBase:
+    alias_name: str
+    collection_name: str
+    chunk_collection_name: str
+    hybrid: bool
+
+    stored_vector_searches = metrics.counter("similar_search_stored_vector")
+    encoded_searches = metrics.counter("similar_search_encoded")
+    incompatible_alias_reads = metrics.counter("vector_alias_incompatible_reads")
+
+    def _hnsw_config(self) -> HnswConfigDiff:
+        return HnswConfigDiff(
+            m=settings.qdrant_hnsw_m, ef_construct=settings.qdrant_hnsw_ef_construct
+        )
 
-    def _ensure_collection(self):
-        collections = self.client.get_collections().collections
-        collection_names = [col.name for col in collections]
+    def _quantization_config(self) -> Optional[ScalarQuantization]:
+        if not settings.qdrant_quantization:
+            return None
+        return ScalarQuantization(
+            scalar=ScalarQuantizationConfig(
+                type=ScalarType.INT8,
+                quantile=settings.qdrant_quantization_quantile,
+                always_ram=True,
+            )
+        )
 
-        if self.collection_name not in collection_names:
-            self.client.create_collection(
-                collection_name=self.collection_name,
-                vectors_config=VectorParams(
-                    size=settings.embedding_dimension, distance=Distance.COSINE
-                ),
+    def _search_params(self) -> SearchParams:
+        quantization = None
+        if settings.qdrant_quantization:
+            quantization = QuantizationSearchParams(
+                rescore=settings.qdrant_rescore,
+                oversampling=settings.qdrant_oversampling,
             )
+        return SearchParams(
+            hnsw_ef=settings.qdrant_search_ef, quantization=quantization
+        )
 
     def _create_search_text(self, case: Case) -> str:
         case_type_map = {
@@ -91,127 +192,588 @@ class VectorStore:
 
         return "\n".join(parts)
 
+    def _create_lexical_text(self, case: Case) -> str:
+        parts = [case.title or "", case.statement]
+        if case.case_type_other:
+            parts.append(case.case_type_other)
+        parts.extend(info.value for info in case.scammer_infos or [])
+        return "\n".join(parts)
+
     def _generate_point_id(self, case_id: int) -> str:
         return hashlib.md5(f"case_{case_id}".encode()).hexdigest()
 
-    def index_case(self, case: Case) -> bool:
-        try:
-            search_text = self._create_search_text(case)
-            embedding = self.embedding_service.encode_document(search_text)
+    def _generate_chunk_point_id(self, case_id: int, chunk_index: int) -> str:
+        return hashlib.md5(f"case_{case_id}_chunk_{chunk_index}".encode()).hexdigest()
+
+    def _chunk_points(
+        self, case: Case, chunk_count: int
+    ) -> Tuple[List[str], List[Dict]]:
+        point_ids = [
+            self._generate_chunk_point_id(case.id, i) for i in range(chunk_count)
+        ]
+        payloads = [
+            {
+                "case_id": case.id,
+                "chunk_index": i,
+                "case_type": case.case_type.value,
+                "status": case.status.value,
+            }
+            for i in range(chunk_count)
+        ]
+        return point_ids, payloads
 
-            scammer_infos_data = []
-            if case.scammer_infos:
-                for info in case.scammer_infos:
-                    scammer_infos_data.append(
-                        {"info_type": info.info_type.value, "value": info.value}
-                    )
+    def _case_selector(self, case_ids: List[int]) -> FilterSelector:
+        return FilterSelector(
+            filter=Filter(
+                must=[FieldCondition(key="case_id", match=MatchAny(any=case_ids))]
+            )
+        )
+
+    def _payload_selector(self) -> Union[bool, List[str]]:
+        if settings.qdrant_lean_payload:
+            return LEAN_PAYLOAD_FIELDS
+        return True
 
-            payload = {
+    def _build_payload(self, case: Case) -> Dict:
+        if settings.qdrant_lean_payload:
+            return {
                 "case_id": case.id,
                 "case_type": case.case_type.value,
-                "title": case.title,
-                "statement": case.statement[:500],
                 "status": case.status.value,
                 "created_at": case.created_at.isoformat() if case.created_at else None,
-                "scammer_infos": scammer_infos_data,
                 "indexed_at": datetime.utcnow().isoformat(),
             }
 
-            point_id = self._generate_point_id(case.id)
+        scammer_infos_data = []
+        if case.scammer_infos:
+            for info in case.scammer_infos:
+                scammer_infos_data.append(
+                    {"info_type": info.info_type.value, "value": info.value}
+                )
+
+        return {
+            "case_id": case.id,
+            "case_type": case.case_type.value,
+            "title": case.title,
+            "statement": case.statement[:500],
+            "status": case.status.value,
+            "created_at": case.created_at.isoformat() if case.created_at else None,
+            "scammer_infos": scammer_infos_data,
+            "indexed_at": datetime.utcnow().isoformat(),
+        }
+
+    def build_points(
+        self, cases: List[Case]
+    ) -> Tuple[List[str], List[str], List[str], List[Dict]]:
+        point_ids = [self._generate_point_id(case.id) for case in cases]
+        search_texts = [self._create_search_text(case) for case in cases]
+        lexical_texts = [self._create_lexical_text(case) for case in cases]
+        payloads = [self._build_payload(case) for case in cases]
+        return point_ids, search_texts, lexical_texts, payloads
+
+    def _search_filter(
+        self, case_type: Optional[str], exclude_case_id: Optional[int]
+    ) -> Filter:
+        must_conditions = [
+            FieldCondition(key="status", match=MatchValue(value="approved"))
+        ]
 
-            self.client.upsert(
-                collection_name=self.collection_name,
-                points=[PointStruct(id=point_id, vector=embedding, payload=payload)],
+        if case_type:
+            must_conditions.append(
+                FieldCondition(key="case_type", match=MatchValue(value=case_type))
             )
 
-            return True
-        except:
-            return False
+        must_not_conditions = []
+        if exclude_case_id:
+            must_not_conditions.append(
+                FieldCondition(key="case_id", match=MatchValue(value=exclude_case_id))
+            )
 
-    def search_similar(
+        return Filter(
+            must=must_conditions,
+            must_not=must_not_conditions if must_not_conditions else None,
+        )
+
+    def _vectors(
+        self, embeddings: np.ndarray, lexical_texts: Optional[List[str]]
+    ) -> Union[np.ndarray, List[Dict]]:
+        if not self.hybrid or lexical_texts is None:
+            return embeddings
+        return [
+            {"": embedding, LEXICAL_VECTOR_NAME: encode_lexical(text)}
+            for embedding, text in zip(embeddings, lexical_texts)
+        ]
+
+    def _hybrid_requests(
         self,
-        query_text: str,
-        case_type: Optional[str] = None,
-        limit: int = 5,
-        score_threshold: Optional[float] = None,
-        exclude_case_id: Optional[int] = None,
-    ) -> List[Dict]:
-        try:
-            if score_threshold is None:
-                score_threshold = settings.similarity_threshold
+        query: Union[np.ndarray, str],
+        lexical_text: str,
+        case_type: Optional[str],
+        score_threshold: float,
+        exclude_case_id: Optional[int],
+    ) -> List[QueryRequest]:
+        query_filter = self._search_filter(case_type, exclude_case_id)
+        if isinstance(query, np.ndarray):
+            query = query.tolist()
+        return [
+            QueryRequest(
+                query=query,
+                filter=query_filter,
+                params=self._search_params(),
+                score_threshold=score_threshold,
+                limit=settings.hybrid_prefetch_limit,
+                with_payload=self._payload_selector(),
+            ),
+            QueryRequest(
+                query=encode_lexical(lexical_text),
+                using=LEXICAL_VECTOR_NAME,
+                filter=query_filter,
+                limit=settings.hybrid_prefetch_limit,
+                with_payload=self._payload_selector(),
+            ),
+        ]
+
+    def _lexical_only(
+        self, dense: List[ScoredPoint], lexical: List[ScoredPoint]
+    ) -> List:
+        dense_ids = {point.id for point in dense}
+        return [
+            point.id
+            for point in lexical
+            if point.score >= settings.hybrid_lexical_score_floor
+            and point.id not in dense_ids
+        ]
+
+    def _id_filter(self, point_ids: List) -> Filter:
+        return Filter(must=[HasIdCondition(has_id=point_ids)])
+
+    def _fuse(
+        self,
+        dense: List[ScoredPoint],
+        lexical: List[ScoredPoint],
+        limit: int,
+        score_threshold: float,
+    ) -> List[ScoredPoint]:
+        k = settings.hybrid_rrf_k
+        points = {point.id: point for point in dense}
+        scores = {
+            point_id: settings.hybrid_dense_weight / (k + rank + 1)
+            for rank, point_id in enumerate(points)
+        }
+        admitted = {point.id for point in dense if point.score >= score_threshold}
+        for rank, point in enumerate(lexical):
+            if point.id not in points:
+                continue
+            scores[point.id] += settings.hybrid_lexical_weight / (k + rank + 1)
+            if point.score >= settings.hybrid_lexical_score_floor:
+                admitted.add(point.id)
+
+        ranked = sorted(
+            (point_id for point_id in points if point_id in admitted),
+            key=scores.get,
+            reverse=True,
+        )
+        return [points[point_id] for point_id in ranked[:limit]]
+
+    def _read_target(self, target: Optional[str], config) -> Tuple[str, bool]:
+        if target is None:
+            return self.collection_name, self.hybrid
+        if target == self.collection_name:
+            return self.alias_name, self.hybrid
+
+        if not is_compatible(config):
+            self.incompatible_alias_reads.inc()
+            return self.collection_name, self.hybrid
+        return self.alias_name, LEXICAL_VECTOR_NAME in (
+            config.params.sparse_vectors or {}
+        )
+
+    def _to_similar_case(self, result: ScoredPoint) -> Dict:
+        return {
+            "case_id": result.payload["case_id"],
+            "title": result.payload.get("title"),
+            "case_type": result.payload["case_type"],
+            "statement": result.payload.get("statement"),
+            "scammer_infos": result.payload.get("scammer_infos"),
+            "similarity_score": round(result.score, 4),
+            "created_at": result.payload.get("created_at"),
+        }
 
-            query_embedding = self.embedding_service.encode_query(query_text)
 
-            must_conditions = [
-                FieldCondition(key="status", match=MatchValue(value="approved"))
-            ]
+class VectorStore(VectorStoreBase):
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self.client = QdrantClient(location=settings.qdrant_url)
+        self.alias_name = settings.qdrant_collection
+        self.collection_name = version_collection_name()
+        self.embedding_service = EmbeddingEngine()
+        self.hybrid = False
+        self._read_collection_name = None
+        self._read_hybrid = False
+        self._alias_checked_at = 0.0
+        self._ensure_collection()
+        self.chunk_collection_name = f"{self.collection_name}_chunks"
+        self._ensure_chunk_collection()
+        self._report_writer()
+        self._initialized = True
+
+    def _create_collection(self, collection_name: str, lexical: bool = False):
+        sparse_vectors_config = None
+        if lexical:
+            sparse_vectors_config = {
+                LEXICAL_VECTOR_NAME: SparseVectorParams(modifier=Modifier.IDF)
+            }
+
+        self.client.create_collection(
+            collection_name=collection_name,
+            vectors_config=VectorParams(
+                size=settings.embedding_dimension,
+                distance=Distance.COSINE,
+                on_disk=settings.qdrant_on_disk_vectors,
+            ),
+            sparse_vectors_config=sparse_vectors_config,
+            hnsw_config=self._hnsw_config(),
+            quantization_config=self._quantization_config(),
+            metadata={MODEL_METADATA_KEY: model_identity()},
+        )
+        self._ensure_payload_indexes(collection_name)
+
+    def _migrate_collection(self, collection_name: str):
+        config = self.client.get_collection(collection_name).config
+        changes = {}
+
+        hnsw = self._hnsw_config()
+        if (config.hnsw_config.m, config.hnsw_config.ef_construct) != (
+            hnsw.m,
+            hnsw.ef_construct,
+        ):
+            changes["hnsw_config"] = hnsw
+
+        quantization = self._quantization_config()
+        if quantization is None and config.quantization_config is not None:
+            changes["quantization_config"] = Disabled.DISABLED
+        elif quantization is not None and config.quantization_config != quantization:
+            changes["quantization_config"] = quantization
+
+        vectors = config.params.vectors
+        if (
+            isinstance(vectors, VectorParams)
+            and bool(vectors.on_disk) != settings.qdrant_on_disk_vectors
+        ):
+            changes["vectors_config"] = {
+                "": VectorParamsDiff(on_disk=settings.qdrant_on_disk_vectors)
+            }
 
-            if case_type:
-                must_conditions.append(
-                    FieldCondition(key="case_type", match=MatchValue(value=case_type))
+        if MODEL_METADATA_KEY not in (config.metadata or {}):
+            changes["metadata"] = {MODEL_METADATA_KEY: model_identity()}
+
+        if changes:
+            self.client.update_collection(collection_name=collection_name, **changes)
+        self._ensure_payload_indexes(collection_name)
+
+    def _ensure_payload_indexes(self, collection_name: str):
+        existing = self.client.get_collection(collection_name).payload_schema
+        for field_name, field_schema in PAYLOAD_INDEXES.items():
+            if field_name not in existing:
+                self.client.create_payload_index(
+                    collection_name=collection_name,
+                    field_name=field_name,
+                    field_schema=field_schema,
+                    wait=True,
                 )
 
-            must_not_conditions = []
-            if exclude_case_id:
-                must_not_conditions.append(
-                    FieldCondition(
-                        key="case_id", match=MatchValue(value=exclude_case_id)
-                    )
+    def _prepare_collection(self, collection_name: str, lexical: bool = False):
+        if self.client.collection_exists(collection_name):
+            self._migrate_collection(collection_name)
+        else:
+            self._create_collection(collection_name, lexical)
+
+    def _has_lexical(self, collection_name: str) -> bool:
+        params = self.client.get_collection(collection_name).config.params
+        return LEXICAL_VECTOR_NAME in (params.sparse_vectors or {})
+
+    def _ensure_collection(self):
+        collections = self.client.get_collections().collections
+        collection_names = [col.name for col in collections]
+
+        if self.alias_name in collection_names:
+            self.collection_name = self.alias_name
+
+        self._prepare_collection(self.collection_name, settings.hybrid_search)
+        self.hybrid = self._has_lexical(self.collection_name)
+
+        if self.collection_name != self.alias_name and self.alias_target() is None:
+            self.swap_alias(self.collection_name)
+
+    def use_version(self, collection_name: str):
+        self._prepare_collection(collection_name, settings.hybrid_search)
+        self.collection_name = collection_name
+        self.hybrid = self._has_lexical(collection_name)
+        self.chunk_collection_name = f"{collection_name}_chunks"
+        self._ensure_chunk_collection()
+        self._alias_checked_at = 0.0
+
+    def _ensure_chunk_collection(self):
+        if settings.embedding_index_chunks:
+            self._prepare_collection(self.chunk_collection_name)
+
+    def alias_target(self) -> Optional[str]:
+        for alias in self.client.get_aliases().aliases:
+            if alias.alias_name == self.alias_name:
+                return alias.collection_name
+        return None
+
+    def swap_alias(self, collection_name: str):
+        operations = []
+        if self.alias_target() is not None:
+            operations.append(
+                DeleteAliasOperation(
+                    delete_alias=DeleteAlias(alias_name=self.alias_name)
                 )
+            )
+        operations.append(
+            CreateAliasOperation(
+                create_alias=CreateAlias(
+                    collection_name=collection_name, alias_name=self.alias_name
+                )
+            )
+        )
+        self.client.update_collection_aliases(change_aliases_operations=operations)
+        self._alias_checked_at = 0.0
+        self._bump_generation()
+
+    def list_versions(self) -> List[str]:
+        prefix = f"{self.alias_name}__"
+        return sorted(
+            col.name
+            for col in self.client.get_collections().collections
+            if col.name.startswith(prefix) and not col.name.endswith("_chunks")
+        )
 
-            search_filter = Filter(
-                must=must_conditions,
-                must_not=must_not_conditions if must_not_conditions else None,
+    def _read_collection(self) -> str:
+        now = time.monotonic()
+        if now - self._alias_checked_at > settings.qdrant_alias_refresh_seconds:
+            target = self.alias_target()
+            config = None
+            if target not in (None, self.collection_name):
+                config = self.client.get_collection(target).config
+            self._read_collection_name, self._read_hybrid = self._read_target(
+                target, config
             )
+            self._report_writer()
+            self._alias_checked_at = now
+        return self._read_collection_name
 
-            results = self.client.search(
-                collection_name=self.collection_name,
-                query_vector=query_embedding,
-                limit=limit,
-                score_threshold=score_threshold,
-                query_filter=search_filter,
+    def _report_writer(self):
+        try:
+            get_binary_redis().zadd(
+                writers_key(self.collection_name), {WORKER_ID: time.time()}
             )
+        except Exception:
+            pass
 
-            similar_cases = []
-            for result in results:
-                similar_cases.append(
-                    {
-                        "case_id": result.payload["case_id"],
-                        "title": result.payload["title"],
-                        "case_type": result.payload["case_type"],
-                        "statement": result.payload["statement"],
-                        "scammer_infos": result.payload.get("scammer_infos", []),
-                        "similarity_score": round(result.score, 4),
-                        "created_at": result.payload.get("created_at"),
-                    }
-                )
+    def _journal_write(self, case_id: int):
+        self._report_writer()
+        try:
+            redis = get_binary_redis()
+            for version in building_versions(redis, self.alias_name):
+                if version != self.collection_name:
+                    redis.sadd(journal_key(version), case_id)
+        except Exception:
+            pass
+
+    def _bump_generation(self):
+        try:
+            get_binary_redis().incr(INDEX_GENERATION_KEY)
+        except Exception:
+            pass
+
+    def _index_chunks(self, case: Case, chunk_embeddings: np.ndarray):
+        self._delete_chunks(case.id)
+        point_ids, payloads = self._chunk_points(case, len(chunk_embeddings))
+        self.client.upload_collection(
+            collection_name=self.chunk_collection_name,
+            vectors=chunk_embeddings,
+            payload=payloads,
+            ids=point_ids,
+            wait=True,
+        )
+
+    def _delete_chunks(self, case_id: int):
+        self.client.delete(
+            collection_name=self.chunk_collection_name,
+            points_selector=self._case_selector([case_id]),
+        )
+
+    def upsert_points(
+        self,
+        point_ids: List[str],
+        embeddings: np.ndarray,
+        payloads: List[Dict],
+        lexical_texts: Optional[List[str]] = None,
+    ):
+        self.client.upload_collection(
+            collection_name=self.collection_name,
+            vectors=self._vectors(embeddings, lexical_texts),
+            payload=payloads,
+            ids=point_ids,
+            batch_size=max(len(point_ids), 1),
+            wait=True,
+        )
+        self._bump_generation()
+
+    def index_case(self, case: Case) -> bool:
+        self._journal_write(case.id)
+        try:
+            search_text = self._create_search_text(case)
+            if settings.embedding_index_chunks:
+                chunk_embeddings = self.embedding_service.encode_chunks(search_text)
+                embedding = pool_chunks(chunk_embeddings)
+                self._index_chunks(case, chunk_embeddings)
+            else:
+                embedding = self.embedding_service.encode_document(search_text)
+
+            self.upsert_points(
+                [self._generate_point_id(case.id)],
+                embedding[np.newaxis, :],
+                [self._build_payload(case)],
+                [self._create_lexical_text(case)],
+            )
 
-            return similar_cases
+            return True
         except:
-            return []
+            return False
 
-    def search_by_case(
-        self, case: Case, limit: int = 5, score_threshold: Optional[float] = None
+    def _query(
+        self,
+        query: Union[np.ndarray, str],
+        case_type: Optional[str],
+        limit: int,
+        score_threshold: Optional[float],
+        exclude_case_id: Optional[int],
+        lexical_text: Optional[str] = None,
     ) -> List[Dict]:
-        search_text = self._create_search_text(case)
-        return self.search_similar(
-            query_text=search_text,
-            case_type=case.case_type.value,
+        if score_threshold is None:
+            score_threshold = settings.similarity_threshold
+
+        collection_name = self._read_collection()
+        if self._read_hybrid and lexical_text:
+            dense, lexical = self.client.query_batch_points(
+                collection_name=collection_name,
+                requests=self._hybrid_requests(
+                    query, lexical_text, case_type, score_threshold, exclude_case_id
+                ),
+            )
+            dense = dense.points
+            lexical_only = self._lexical_only(dense, lexical.points)
+            if lexical_only:
+                rescored = self.client.query_points(
+                    collection_name=collection_name,
+                    query=query,
+                    limit=len(lexical_only),
+                    query_filter=self._id_filter(lexical_only),
+                    search_params=self._search_params(),
+                    with_payload=self._payload_selector(),
+                )
+                dense = dense + rescored.points
+            results = self._fuse(dense, lexical.points, limit, score_threshold)
+            return [self._to_similar_case(result) for result in results]
+
+        results = self.client.query_points(
+            collection_name=collection_name,
+            query=query,
             limit=limit,
             score_threshold=score_threshold,
-            exclude_case_id=case.id,
+            query_filter=self._search_filter(case_type, exclude_case_id),
+            search_params=self._search_params(),
+            with_payload=self._payload_selector(),
+        ).points
+
+        return [self._to_similar_case(result) for result in results]
+
+    def search_similar(
+        self,
+        query_text: str,
+        case_type: Optional[str] = None,
+        limit: int = 5,
+        score_threshold: Optional[float] = None,
+        exclude_case_id: Optional[int] = None,
+    ) -> List[Dict]:
+        query_embedding = self.embedding_service.encode_query(query_text)
+        return self._query(
+            query_embedding,
+            case_type,
+            limit,
+            score_threshold,
+            exclude_case_id,
+            query_text,
+        )
+
+    def search_by_case(
+        self, case: Case, limit: int = 5, score_threshold: Optional[float] = None
+    ) -> List[Dict]:
+        lexical_text = self._create_lexical_text(case)
+        if case.status == CaseStatus.APPROVED:
+            try:
+                results = self._query(
+                    self._generate_point_id(case.id),
+                    case.case_type.value,
+                    limit,
+                    score_threshold,
+                    case.id,
+                    lexical_text,
+                )
+                self.stored_vector_searches.inc()
+                return results
+            except Exception:
+                pass
+
+        self.encoded_searches.inc()
+        return self._query(
+            self.embedding_service.encode_query(self._create_search_text(case)),
+            case.case_type.value,
+            limit,
+            score_threshold,
+            case.id,
+            lexical_text,
         )
 
     def delete_case(self, case_id: int) -> bool:
+        self._journal_write(case_id)
         try:
             point_id = self._generate_point_id(case_id)
             self.client.delete(
                 collection_name=self.collection_name, points_selector=[point_id]
             )
+            if settings.embedding_index_chunks:
+                self._delete_chunks(case_id)
+            self._bump_generation()
             return True
         except:
             return False
 
+    def delete_cases(self, case_ids: List[int]):
+        self.client.delete(
+            collection_name=self.collection_name,
+            points_selector=[self._generate_point_id(case_id) for case_id in case_ids],
+        )
+        if settings.embedding_index_chunks:
+            self.client.delete(
+                collection_name=self.chunk_collection_name,
+                points_selector=self._case_selector(case_ids),
+            )
+        self._bump_generation()
+
     def update_case(self, case: Case) -> bool:
         self.delete_case(case.id)
         return self.index_case(case)
@@ -1,3 +1,3 @@
-from . import case, consultation
+from . import case, consultation, health
 
-__all__ = ["case", "consultation"]
+__all__ = ["case", "consultation", "health"]
@@ -5,7 +5,13 @@ from sqlalchemy.orm import Session
 
 from app.core.deps import get_case_service, get_current_user, get_db
 from app.models.user import User
-from app.schemas.case import CaseCreate, CaseResponse, SimilarCaseResponse
+from app.schemas.case import (
+    CaseCreate,
+    CaseResponse,
+    LinkedCaseResponse,
+    RingResponse,
+    SimilarCaseResponse,
+)
 from app.services.case_service import CaseService
 
 router = APIRouter()
@@ -44,16 +50,35 @@ async def delete_case_by_id(
     current_user: Annotated[User, Depends(get_current_user)],
     case_service: Annotated[CaseService, Depends(get_case_service)],
 ):
-    case_service.delete_case(case_id, current_user.id)
+    await case_service.delete_case(case_id, current_user.id)
     return {"message": "Case deleted successfully"}
 
 
 @router.get("/{case_id}/similar", response_model=List[SimilarCaseResponse])
-def get_similar_cases(
+async def get_similar_cases(
     case_id: int,
     limit: int = 5,
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     service = CaseService(db)
-    return service.get_similar_cases(case_id, current_user.id, limit)
+    return await service.get_similar_cases(case_id, current_user.id, limit)
+
+
+@router.get("/{case_id}/linked", response_model=List[LinkedCaseResponse])
+async def get_linked_cases(
+    case_id: int,
+    current_user: Annotated[User, Depends(get_current_user)],
+    case_service: Annotated[CaseService, Depends(get_case_service)],
+    limit: int = 50,
+):
+    return case_service.get_linked_cases(case_id, current_user.id, limit)
+
+
+@router.get("/{case_id}/ring", response_model=RingResponse)
+async def get_case_ring(
+    case_id: int,
+    current_user: Annotated[User, Depends(get_current_user)],
+    case_service: Annotated[CaseService, Depends(get_case_service)],
+):
+    return case_service.get_case_ring(case_id, current_user.id)
@@ -1,6 +1,9 @@
+import json
+from contextlib import aclosing
 from typing import Annotated, List
 
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 
 from app.core.deps import get_consultation_service, get_current_user
 from app.core.exceptions import ForbiddenException, NotFoundException
@@ -16,6 +19,10 @@ from app.services.consultation_service import ConsultationService
 router = APIRouter()
 
 
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
 @router.get("/", response_model=List[ConsultationResponse])
 async def list_my_consultations(
     current_user: Annotated[User, Depends(get_current_user)],
@@ -68,7 +75,7 @@ async def delete_consultation(
         ConsultationService, Depends(get_consultation_service)
     ],
 ):
-    consultation_service.delete_consultation(consultation_id, current_user.id)
+    await consultation_service.delete_consultation(consultation_id, current_user.id)
     return {"message": "Consultation deleted successfully"}
 
 
@@ -109,7 +116,7 @@ async def create_consultation_message(
         ConsultationService, Depends(get_consultation_service)
     ],
 ):
-    message = consultation_service.create_message(
+    message = await consultation_service.create_message(
         consultation_id, message_data, current_user.id
     )
     return message
@@ -124,7 +131,7 @@ async def delete_consultation_message(
         ConsultationService, Depends(get_consultation_service)
     ],
 ):
-    consultation_service.delete_message(message_id, current_user.id)
+    await consultation_service.delete_message(message_id, current_user.id)
     return {"message": "Message deleted successfully"}
 
 
@@ -141,7 +148,32 @@ async def create_ai_consultation_message(
         ConsultationService, Depends(get_consultation_service)
     ],
 ):
-    message = consultation_service.create_ai_message(
+    message = await consultation_service.create_ai_message(
         consultation_id, message_data.content, current_user.id
     )
     return message
+
+
+@router.post("/{consultation_id}/messages/ai/stream")
+async def stream_ai_consultation_message(
+    consultation_id: int,
+    message_data: ConsultationMessageCreate,
+    current_user: Annotated[User, Depends(get_current_user)],
+    consultation_service: Annotated[
+        ConsultationService, Depends(get_consultation_service)
+    ],
+):
+    events = consultation_service.stream_ai_message(
+        consultation_id, message_data.content, current_user.id
+    )
+
+    async def event_stream():
+        async with aclosing(events):
+            async for event, data in events:
+                yield _sse(event, data)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
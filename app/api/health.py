@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Request, Response, status
+
+from app.ai.vector_store import DRIFT_REPORT_KEY
+from app.db.redis import get_redis
+
+router = APIRouter()
+
+
+@router.get("/ready")
+async def readiness(request: Request, response: Response):
+    ready = getattr(request.app.state, "ready", False)
+    if not ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+
+    body = {"ready": ready}
+    error = getattr(request.app.state, "startup_error", None)
+    if error:
+        body["error"] = error
+    return body
+
+
+@router.get("/vector-drift")
+async def vector_drift():
+    redis = await get_redis()
+    return await redis.hgetall(DRIFT_REPORT_KEY)
@@ -1,4 +1,5 @@
 import os
+from typing import List, Literal, Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -11,15 +12,73 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int = 30
 
     openai_api_key: str
+    openai_base_url: Optional[str] = None
+    openai_timeout_seconds: float = 30.0
+    openai_max_connections: int = 100
+    case_triage_extract_identifiers: bool = True
+    consultation_history_tokens: int = 3000
+    consultation_summary_tokens: int = 400
+    consultation_retrieval: bool = True
+    consultation_retrieval_limit: int = 4
+    consultation_retrieval_threshold: float = 0.3
+    consultation_retrieval_tokens: int = 1200
+    consultation_retrieval_retry_seconds: float = 60.0
     law_api_key: str
     hf_token: str
 
+    vector_backend: Literal["qdrant", "embedded"] = "qdrant"
+    embedded_vector_path: str = "data/vector_index"
+    embedded_partition_by_case_type: bool = True
+    embedded_compaction_ratio: float = 0.3
     qdrant_url: str = "http://localhost:6333"
+    qdrant_grpc_port: int = 6334
+    qdrant_prefer_grpc: bool = True
+    qdrant_pool_size: int = 16
     qdrant_collection: str = "scam_cases"
+    qdrant_message_collection: str = "consultation_messages"
+    qdrant_alias_refresh_seconds: float = 30.0
+    qdrant_writer_ttl_seconds: float = 600.0
+    qdrant_hnsw_m: int = 16
+    qdrant_hnsw_ef_construct: int = 128
+    qdrant_search_ef: int = 128
+    qdrant_on_disk_vectors: bool = True
+    qdrant_quantization: bool = True
+    qdrant_quantization_quantile: float = 0.99
+    qdrant_rescore: bool = True
+    qdrant_oversampling: float = 2.0
+    qdrant_lean_payload: bool = False
 
     embedding_model: str = "nlpai-lab/KURE-v1"
+    embedding_model_path: Optional[str] = None
+    embedding_model_sha256: Optional[str] = None
+    embedding_warmup_lengths: List[int] = [16, 128, 512]
+    embedding_chunk_tokens: int = 512
+    embedding_chunk_overlap: int = 64
+    embedding_max_tokens: int = 4096
+    embedding_index_chunks: bool = False
+    embedding_server_socket: Optional[str] = None
+    embedding_backend: Literal["torch", "torch_int8", "onnx"] = "torch"
+    embedding_onnx_file: Optional[str] = None
+    embedding_onnx_provider: str = "CPUExecutionProvider"
     embedding_dimension: int = 1024
     similarity_threshold: float = 0.75
+    hybrid_search: bool = False
+    hybrid_dense_weight: float = 1.0
+    hybrid_lexical_weight: float = 1.0
+    hybrid_rrf_k: int = 60
+    hybrid_prefetch_limit: int = 50
+    hybrid_lexical_score_floor: float = 8.0
+    reconcile_lock_seconds: int = 600
+    reconcile_full_sweep_seconds: int = 86400
+    near_duplicate_detection: bool = True
+    near_duplicate_threshold: float = 0.8
+    similar_cache_ttl_seconds: int = 600
+    similar_cache_lock_seconds: float = 5.0
+    embedding_max_batch_size: int = 32
+    embedding_batch_window_ms: float = 5.0
+    embedding_cache_max_bytes: int = 64 * 1024 * 1024
+    embedding_cache_redis: bool = True
+    embedding_cache_ttl_seconds: int = 7 * 24 * 60 * 60
 
     model_config = SettingsConfigDict(
         env_file=".env.local" if os.path.exists(".env.local") else ".env"
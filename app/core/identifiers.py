@@ -0,0 +1,51 @@
+import re
+from typing import Optional
+
+NON_DIGITS = re.compile(r"\D")
+SNS_PREFIXES = re.compile(r"^(?:https?://)?(?:www\.)?(?:[a-z0-9-]+\.)+[a-z]+/")
+
+KOREA_COUNTRY_CODE = "82"
+MIN_PHONE_DIGITS = 9
+MIN_ACCOUNT_DIGITS = 8
+
+
+def normalize_phone(value: str) -> Optional[str]:
+    digits = NON_DIGITS.sub("", value)
+    if digits.startswith("00" + KOREA_COUNTRY_CODE):
+        digits = digits[2:]
+    if digits.startswith(KOREA_COUNTRY_CODE):
+        digits = "0" + digits[len(KOREA_COUNTRY_CODE) :].lstrip("0")
+    if len(digits) < MIN_PHONE_DIGITS:
+        return None
+    return digits
+
+
+def normalize_account(value: str) -> Optional[str]:
+    digits = NON_DIGITS.sub("", value)
+    if len(digits) < MIN_ACCOUNT_DIGITS:
+        return None
+    return digits
+
+
+def normalize_sns_id(value: str) -> Optional[str]:
+    handle = SNS_PREFIXES.sub("", value.strip().lower())
+    handle = handle.strip("/").lstrip("@")
+    handle = "".join(handle.split())
+    return handle or None
+
+
+NORMALIZERS = {
+    "phone": normalize_phone,
+    "account": normalize_account,
+    "sns_id": normalize_sns_id,
+}
+
+
+def normalize_identifier(info_type, value: Optional[str]) -> Optional[str]:
+    if value is None:
+        return None
+    info_type = getattr(info_type, "value", info_type)
+    normalizer = NORMALIZERS.get(str(info_type).lower())
+    if normalizer is None:
+        return None
+    return normalizer(value)
@@ -0,0 +1,24 @@
+from sqlalchemy import text
+
+from app.ai.conversation_context import count_tokens
+from app.ai.embedding_engine import EmbeddingEngine
+from app.ai.vector_backends import get_vector_store
+from app.core.config import settings
+from app.db.database import engine
+
+
+def _open_db_pool():
+    connections = [engine.connect() for _ in range(engine.pool.size())]
+    try:
+        for connection in connections:
+            connection.execute(text("SELECT 1"))
+    finally:
+        for connection in connections:
+            connection.close()
+
+
+def warm_up():
+    EmbeddingEngine().warm_up(settings.embedding_warmup_lengths)
+    count_tokens("")
+    get_vector_store()
+    _open_db_pool()
@@ -1,10 +1,19 @@
 import ssl
 
+import redis as sync_redis
 import redis.asyncio as redis
 
 from app.core.config import settings
 
 redis_client = None
+binary_redis_client = None
+
+
+def _connection_kwargs() -> dict:
+    connection_kwargs = {}
+    if settings.redis_url.startswith("rediss://"):
+        connection_kwargs["ssl_cert_reqs"] = ssl.CERT_NONE
+    return connection_kwargs
 
 
 async def get_redis():
@@ -13,15 +22,22 @@ async def get_redis():
         connection_kwargs = {
             "encoding": "utf-8",
             "decode_responses": True,
+            **_connection_kwargs(),
         }
 
-        if settings.redis_url.startswith("rediss://"):
-            connection_kwargs["ssl_cert_reqs"] = ssl.CERT_NONE
-
         redis_client = await redis.from_url(settings.redis_url, **connection_kwargs)
     return redis_client
 
 
+def get_binary_redis() -> sync_redis.Redis:
+    global binary_redis_client
+    if binary_redis_client is None:
+        binary_redis_client = sync_redis.from_url(
+            settings.redis_url, **_connection_kwargs()
+        )
+    return binary_redis_client
+
+
 async def close_redis():
     global redis_client
     if redis_client:
@@ -29,6 +45,13 @@ async def close_redis():
         redis_client = None
 
 
+def close_binary_redis():
+    global binary_redis_client
+    if binary_redis_client:
+        binary_redis_client.close()
+        binary_redis_client = None
+
+
 async def add_to_blacklist(token: str, expires_in: int):
     client = await get_redis()
     await client.setex(f"blacklist:{token}", timedelta(seconds=expires_in), "1")
@@ -0,0 +1,51 @@
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session
+
+from app.db.database import SessionLocal
+from app.models.case import ScamRing
+
+SCHEMA_LOCK_KEY = 0x6C696E6B
+
+SCHEMA_TABLES = (ScamRing.__table__,)
+
+SCHEMA_STATEMENTS = (
+    "ALTER TABLE scammer_infos "
+    "ADD COLUMN IF NOT EXISTS normalized_value VARCHAR(200)",
+    "ALTER TABLE scammer_infos "
+    "ADD COLUMN IF NOT EXISTS source VARCHAR(20) NOT NULL DEFAULT 'user'",
+    "CREATE INDEX IF NOT EXISTS ix_scammer_infos_identifier "
+    "ON scammer_infos (info_type, normalized_value)",
+    "CREATE INDEX IF NOT EXISTS ix_scammer_infos_case_id ON scammer_infos (case_id)",
+    "ALTER TABLE cases "
+    "ADD COLUMN IF NOT EXISTS ring_id INTEGER REFERENCES scam_rings (id)",
+    "CREATE INDEX IF NOT EXISTS ix_cases_ring_id ON cases (ring_id)",
+    "CREATE INDEX IF NOT EXISTS ix_cases_updated_at ON cases (updated_at)",
+    "ALTER TABLE consultations ADD COLUMN IF NOT EXISTS summary TEXT",
+    "ALTER TABLE consultations ADD COLUMN IF NOT EXISTS summary_message_id INTEGER",
+)
+
+
+def apply_schema(db: Session):
+    db.execute(select(func.pg_advisory_xact_lock(SCHEMA_LOCK_KEY)))
+    for table in SCHEMA_TABLES:
+        table.create(db.connection(), checkfirst=True)
+    for statement in SCHEMA_STATEMENTS:
+        db.execute(text(statement))
+    db.commit()
+
+
+def main():
+    db = SessionLocal()
+    try:
+        apply_schema(db)
+    finally:
+        db.close()
+
+    print(
+        f"applied {len(SCHEMA_TABLES)} tables and "
+        f"{len(SCHEMA_STATEMENTS)} schema statements"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import argparse
+import time
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.identifiers import normalize_identifier
+from app.db.database import SessionLocal
+from app.models.case import ScammerInfo, ScammerInfoSource
+
+
+def backfill(db: Session, batch_size: int = 5000) -> int:
+    last_id = 0
+    updated = 0
+
+    while True:
+        rows = db.execute(
+            select(
+                ScammerInfo.id,
+                ScammerInfo.info_type,
+                ScammerInfo.value,
+                ScammerInfo.source,
+            )
+            .where(ScammerInfo.id > last_id)
+            .order_by(ScammerInfo.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            break
+
+        db.bulk_update_mappings(
+            ScammerInfo,
+            [
+                {
+                    "id": row.id,
+                    "normalized_value": (
+                        None
+                        if row.source == ScammerInfoSource.EXTRACTED
+                        else normalize_identifier(row.info_type, row.value)
+                    ),
+                }
+                for row in rows
+            ],
+        )
+        db.commit()
+
+        last_id = rows[-1].id
+        updated += len(rows)
+        print(f"updated={updated} last_id={last_id}")
+
+    return updated
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Backfill normalized scammer identifiers"
+    )
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    started_at = time.perf_counter()
+    db = SessionLocal()
+    try:
+        updated = backfill(db, batch_size=args.batch_size)
+    finally:
+        db.close()
+
+    print(f"done: {updated} rows in {time.perf_counter() - started_at:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+import argparse
+import sys
+import time
+from typing import List
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.ai.message_vector_store import MessageVectorStore
+from app.ai.vector_store import (
+    BUILDING_VERSIONS_KEY,
+    journal_key,
+    stale_writer_versions,
+)
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.db.redis import get_binary_redis
+from app.models.consultation import ConsultationMessage
+
+CONSULTATION_ENTRY_PREFIX = "consultation:"
+
+
+def index_messages(db: Session, store: MessageVectorStore, batch_size: int) -> int:
+    last_id = 0
+    indexed = 0
+
+    while True:
+        messages = (
+            db.execute(
+                select(ConsultationMessage)
+                .where(ConsultationMessage.id > last_id)
+                .order_by(ConsultationMessage.id)
+                .limit(batch_size)
+            )
+            .scalars()
+            .all()
+        )
+        if not messages:
+            return indexed
+
+        if not store.index_messages(messages, batch_encode=True):
+            raise RuntimeError(f"failed to index messages after id {last_id}")
+        indexed += len(messages)
+        last_id = messages[-1].id
+        db.expunge_all()
+
+
+def sync_messages(db: Session, store: MessageVectorStore, entries: List[str]):
+    consultation_ids = [
+        int(entry[len(CONSULTATION_ENTRY_PREFIX) :])
+        for entry in entries
+        if entry.startswith(CONSULTATION_ENTRY_PREFIX)
+    ]
+    for consultation_id in consultation_ids:
+        store.delete_consultation(consultation_id)
+
+    message_ids = [
+        int(entry)
+        for entry in entries
+        if not entry.startswith(CONSULTATION_ENTRY_PREFIX)
+    ]
+    if not message_ids:
+        return
+
+    messages = (
+        db.execute(
+            select(ConsultationMessage).where(ConsultationMessage.id.in_(message_ids))
+        )
+        .scalars()
+        .all()
+    )
+    found = {message.id for message in messages}
+    deleted = [message_id for message_id in message_ids if message_id not in found]
+    if deleted:
+        store.delete_messages(deleted)
+    if not store.index_messages(messages, batch_encode=True):
+        raise RuntimeError("failed to replay journaled messages")
+    db.expunge_all()
+
+
+def drain_journal(db: Session, store: MessageVectorStore, batch_size: int = 500) -> int:
+    redis = get_binary_redis()
+    key = journal_key(store.collection_name)
+    drained = 0
+
+    while True:
+        entries = [entry.decode() for entry in redis.spop(key, batch_size) or []]
+        if not entries:
+            return drained
+
+        sync_messages(db, store, entries)
+        drained += len(entries)
+
+
+def settle(db: Session, store: MessageVectorStore) -> bool:
+    print(f"replayed {drain_journal(db, store)} journaled writes")
+    stale = stale_writer_versions(store.list_versions(), store.collection_name)
+    if stale:
+        print(
+            f"workers still write to {', '.join(stale)}; "
+            f"keeping {store.collection_name} journaled"
+        )
+        return False
+
+    get_binary_redis().srem(BUILDING_VERSIONS_KEY, store.collection_name)
+    print(f"replayed {drain_journal(db, store)} late writes")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Embed consultation messages into the version for the "
+        "configured embedding model and point the message alias at it"
+    )
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--drain", action="store_true")
+    parser.add_argument("--interval", type=int, default=0)
+    args = parser.parse_args()
+
+    if settings.vector_backend != "qdrant":
+        print(
+            "index_consultation_messages supports only the qdrant backend, "
+            f"not {settings.vector_backend}"
+        )
+        sys.exit(1)
+
+    started_at = time.perf_counter()
+    store = MessageVectorStore()
+
+    db = SessionLocal()
+    try:
+        if not args.drain:
+            get_binary_redis().sadd(BUILDING_VERSIONS_KEY, store.collection_name)
+            indexed = index_messages(db, store, args.batch_size)
+            elapsed = time.perf_counter() - started_at
+            print(f"indexed {indexed} messages in {elapsed:.1f}s")
+            print(f"replayed {drain_journal(db, store)} journaled writes")
+
+            store.swap_alias(store.collection_name)
+            print(f"{store.alias_name} -> {store.collection_name}")
+
+        while not settle(db, store):
+            if args.interval <= 0:
+                print("rerun with --drain --interval <seconds> until old workers exit")
+                return
+            time.sleep(args.interval)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
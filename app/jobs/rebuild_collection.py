@@ -0,0 +1,180 @@
+import argparse
+import sys
+import time
+
+from sqlalchemy.orm import Session
+
+from app.ai.vector_store import (
+    BUILDING_VERSIONS_KEY,
+    VectorStore,
+    journal_key,
+    stale_writer_versions,
+    version_collection_name,
+)
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.db.redis import get_binary_redis
+from app.jobs.reindex import Checkpoint, reindex, sync_cases
+
+
+def drain_journal(db: Session, store: VectorStore, batch_size: int = 500) -> int:
+    redis = get_binary_redis()
+    key = journal_key(store.collection_name)
+    drained = 0
+
+    while True:
+        case_ids = [int(case_id) for case_id in redis.spop(key, batch_size) or []]
+        if not case_ids:
+            return drained
+
+        sync_cases(db, store, case_ids)
+        drained += len(case_ids)
+
+
+def settle(db: Session, store: VectorStore, target: str) -> bool:
+    print(f"replayed {drain_journal(db, store)} journaled writes")
+    stale = stale_writer_versions(store.list_versions(), target)
+    if stale:
+        print(f"workers still write to {', '.join(stale)}; keeping {target} journaled")
+        return False
+
+    get_binary_redis().srem(BUILDING_VERSIONS_KEY, target)
+    print(f"replayed {drain_journal(db, store)} late writes")
+    return True
+
+
+def build(args):
+    store = VectorStore()
+    target = version_collection_name()
+    if store.alias_target() == target:
+        print(f"{target} is already live")
+        return
+
+    legacy = store.client.collection_exists(store.alias_name) and (
+        store.alias_target() is None
+    )
+    if legacy and not args.drop_legacy:
+        print(
+            f"{store.alias_name} is a plain collection; rerun with --drop-legacy "
+            "to replace it with an alias once the new version is built"
+        )
+        sys.exit(1)
+
+    redis = get_binary_redis()
+    store.use_version(target)
+    redis.sadd(BUILDING_VERSIONS_KEY, target)
+    print(f"building {target}")
+
+    checkpoint = Checkpoint(f"rebuild-{target}.checkpoint.json")
+    if args.restart:
+        checkpoint.clear()
+
+    db = SessionLocal()
+    try:
+        reindex(
+            db,
+            store,
+            checkpoint,
+            page_size=args.page_size,
+            upsert_batch_size=args.upsert_batch_size,
+            parallel=args.parallel,
+        )
+        print(f"replayed {drain_journal(db, store)} journaled writes")
+
+        if legacy:
+            store.client.delete_collection(store.alias_name)
+        store.swap_alias(target)
+        checkpoint.clear()
+        print(f"{store.alias_name} -> {target}")
+
+        if not settle(db, store, target):
+            print("run 'drain --interval <seconds>' until the old workers are gone")
+    finally:
+        db.close()
+
+
+def drain(args):
+    store = VectorStore()
+    target = version_collection_name()
+    if store.alias_target() != target:
+        print(f"{target} is not live")
+        sys.exit(1)
+
+    db = SessionLocal()
+    try:
+        while not settle(db, store, target):
+            if args.interval <= 0:
+                return
+            time.sleep(args.interval)
+    finally:
+        db.close()
+    print(f"{target} is no longer journaled")
+
+
+def rollback(args):
+    store = VectorStore()
+    if args.collection not in store.list_versions():
+        print(f"unknown version: {args.collection}")
+        sys.exit(1)
+    store.swap_alias(args.collection)
+    print(f"{store.alias_name} -> {args.collection}")
+
+
+def list_versions(args):
+    store = VectorStore()
+    live = store.alias_target()
+    building = {
+        version.decode()
+        for version in get_binary_redis().smembers(BUILDING_VERSIONS_KEY)
+    }
+    for version in store.list_versions():
+        if version == live:
+            state = "live, journaled" if version in building else "live"
+        else:
+            state = "building" if version in building else ""
+        print(f"{version}\t{state}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build, list and switch versioned case collections"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = subparsers.add_parser(
+        "build", help="build the version for the configured embedding model"
+    )
+    build_parser.add_argument("--restart", action="store_true")
+    build_parser.add_argument("--drop-legacy", action="store_true")
+    build_parser.add_argument("--page-size", type=int, default=1000)
+    build_parser.add_argument("--upsert-batch-size", type=int, default=256)
+    build_parser.add_argument("--parallel", type=int, default=4)
+    build_parser.set_defaults(handler=build)
+
+    drain_parser = subparsers.add_parser(
+        "drain",
+        help="replay writes journaled by workers still on an older version",
+    )
+    drain_parser.add_argument("--interval", type=int, default=0)
+    drain_parser.set_defaults(handler=drain)
+
+    rollback_parser = subparsers.add_parser("rollback")
+    rollback_parser.add_argument("collection")
+    rollback_parser.set_defaults(handler=rollback)
+
+    list_parser = subparsers.add_parser("list")
+    list_parser.set_defaults(handler=list_versions)
+
+    args = parser.parse_args()
+
+    if settings.vector_backend != "qdrant":
+        print(
+            "rebuild_collection supports only the qdrant backend, "
+            f"not {settings.vector_backend}"
+        )
+        sys.exit(1)
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
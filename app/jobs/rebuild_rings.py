@@ -0,0 +1,26 @@
+import argparse
+import time
+
+from app.db.database import SessionLocal
+from app.services.ring_service import RingService
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Recompute scam rings from shared scammer identifiers"
+    )
+    parser.add_argument("--batch-size", type=int, default=10000)
+    args = parser.parse_args()
+
+    started_at = time.perf_counter()
+    db = SessionLocal()
+    try:
+        rings = RingService(db).rebuild(batch_size=args.batch_size)
+    finally:
+        db.close()
+
+    print(f"done: {rings} rings in {time.perf_counter() - started_at:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
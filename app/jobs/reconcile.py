@@ -0,0 +1,248 @@
+import argparse
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.ai.vector_store import DRIFT_REPORT_KEY, VectorStore
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.db.database import SessionLocal
+from app.db.redis import get_binary_redis
+from app.jobs.reindex import sync_cases
+from app.models.case import Case, CaseStatus
+
+RECONCILE_LOCK_KEY = "vector:reconcile:lock"
+RECONCILE_WATERMARK_KEY = "vector:reconcile:watermark"
+RECONCILE_FULL_SWEEP_KEY = "vector:reconcile:full_sweep"
+WATERMARK_OVERLAP = timedelta(minutes=5)
+
+
+def _as_naive_utc(value: datetime) -> datetime:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _batches(items: List[int], size: int) -> Iterator[List[int]]:
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+def _indexed_at(payload: Dict) -> datetime:
+    indexed_at = payload.get("indexed_at")
+    return datetime.fromisoformat(indexed_at) if indexed_at else datetime.min
+
+
+def scan_index(store: VectorStore, batch_size: int) -> Dict[int, datetime]:
+    indexed = {}
+    offset = None
+    while True:
+        points, offset = store.client.scroll(
+            collection_name=store.collection_name,
+            limit=batch_size,
+            offset=offset,
+            with_payload=["case_id", "indexed_at"],
+            with_vectors=False,
+        )
+        for point in points:
+            indexed[point.payload["case_id"]] = _indexed_at(point.payload)
+        if offset is None:
+            return indexed
+
+
+def fetch_indexed(
+    store: VectorStore, case_ids: List[int], batch_size: int
+) -> Dict[int, datetime]:
+    indexed = {}
+    for batch in _batches(case_ids, batch_size):
+        points = store.client.retrieve(
+            collection_name=store.collection_name,
+            ids=[store._generate_point_id(case_id) for case_id in batch],
+            with_payload=["case_id", "indexed_at"],
+            with_vectors=False,
+        )
+        for point in points:
+            indexed[point.payload["case_id"]] = _indexed_at(point.payload)
+    return indexed
+
+
+def scan_database(db: Session, batch_size: int) -> Dict[int, datetime]:
+    rows = db.execute(
+        select(Case.id, Case.updated_at)
+        .where(Case.status == CaseStatus.APPROVED)
+        .execution_options(yield_per=batch_size)
+    )
+    return {
+        case_id: _as_naive_utc(updated_at) if updated_at else datetime.min
+        for case_id, updated_at in rows
+    }
+
+
+def scan_changed(
+    db: Session, since: datetime, batch_size: int
+) -> Dict[int, Optional[datetime]]:
+    rows = db.execute(
+        select(Case.id, Case.updated_at, Case.status)
+        .where(Case.updated_at > since)
+        .execution_options(yield_per=batch_size)
+    )
+    return {
+        case_id: _as_naive_utc(updated_at) if status == CaseStatus.APPROVED else None
+        for case_id, updated_at, status in rows
+    }
+
+
+def _drift(
+    approved: Dict[int, datetime],
+    indexed: Dict[int, datetime],
+    candidates: Iterable[int],
+) -> Dict[str, List[int]]:
+    return {
+        "missing": [case_id for case_id in approved if case_id not in indexed],
+        "stale": [
+            case_id
+            for case_id, updated_at in approved.items()
+            if case_id in indexed and updated_at > indexed[case_id]
+        ],
+        "orphaned": [
+            case_id
+            for case_id in candidates
+            if case_id in indexed and case_id not in approved
+        ],
+    }
+
+
+def reconcile(
+    db: Session,
+    store: VectorStore,
+    batch_size: int = 1000,
+    dry_run: bool = False,
+    since: Optional[datetime] = None,
+) -> Dict[str, int]:
+    if since is None:
+        indexed = scan_index(store, batch_size)
+        approved = scan_database(db, batch_size)
+        drift = _drift(approved, indexed, indexed)
+        report = {"approved": len(approved), "indexed": len(indexed)}
+    else:
+        changed = scan_changed(db, since, batch_size)
+        indexed = fetch_indexed(store, list(changed), batch_size)
+        approved = {
+            case_id: updated_at
+            for case_id, updated_at in changed.items()
+            if updated_at is not None
+        }
+        drift = _drift(approved, indexed, changed)
+        report = {"changed": len(changed)}
+
+    missing, stale, orphaned = drift["missing"], drift["stale"], drift["orphaned"]
+    report.update(
+        {"missing": len(missing), "stale": len(stale), "orphaned": len(orphaned)}
+    )
+    if dry_run:
+        return report
+
+    for case_ids in _batches(missing + stale, batch_size):
+        sync_cases(db, store, case_ids)
+    for case_ids in _batches(orphaned, batch_size):
+        store.delete_cases(case_ids)
+
+    return report
+
+
+def publish(report: Dict[str, int], elapsed: float):
+    for name, value in report.items():
+        metrics.gauge(f"vector_drift_{name}").set(value)
+    metrics.counter("vector_reconcile_runs").inc()
+
+    try:
+        get_binary_redis().hset(
+            DRIFT_REPORT_KEY,
+            mapping={
+                **report,
+                "duration_seconds": round(elapsed, 3),
+                "checked_at": datetime.now(timezone.utc).isoformat(),
+            },
+        )
+    except Exception:
+        pass
+
+
+def _watermark(redis, full: bool) -> Optional[datetime]:
+    last_sweep = redis.get(RECONCILE_FULL_SWEEP_KEY)
+    watermark = redis.get(RECONCILE_WATERMARK_KEY)
+    if (
+        full
+        or last_sweep is None
+        or watermark is None
+        or time.time() - float(last_sweep) > settings.reconcile_full_sweep_seconds
+    ):
+        return None
+    return datetime.fromisoformat(watermark.decode())
+
+
+def run_once(batch_size: int, dry_run: bool, full: bool = False):
+    redis = get_binary_redis()
+    if not redis.set(
+        RECONCILE_LOCK_KEY, 1, nx=True, ex=settings.reconcile_lock_seconds
+    ):
+        print("another reconciliation is running")
+        return
+
+    started_at = time.perf_counter()
+    scanned_at = datetime.now(timezone.utc)
+    db = SessionLocal()
+    try:
+        since = _watermark(redis, full)
+        report = reconcile(
+            db, VectorStore(), batch_size=batch_size, dry_run=dry_run, since=since
+        )
+        if not dry_run:
+            redis.set(
+                RECONCILE_WATERMARK_KEY,
+                (scanned_at - WATERMARK_OVERLAP).isoformat(),
+            )
+            if since is None:
+                redis.set(RECONCILE_FULL_SWEEP_KEY, scanned_at.timestamp())
+    finally:
+        db.close()
+        redis.delete(RECONCILE_LOCK_KEY)
+
+    elapsed = time.perf_counter() - started_at
+    publish(report, elapsed)
+    print(" ".join(f"{k}={v}" for k, v in report.items()) + f" in {elapsed:.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Detect and repair drift between approved cases and Qdrant"
+    )
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--interval", type=int, default=0)
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--full", action="store_true")
+    parser.add_argument("--qdrant-url", default=None)
+    args = parser.parse_args()
+
+    if settings.vector_backend != "qdrant":
+        print(
+            f"reconcile supports only the qdrant backend, not {settings.vector_backend}"
+        )
+        sys.exit(1)
+
+    if args.qdrant_url:
+        settings.qdrant_url = args.qdrant_url
+
+    while True:
+        run_once(args.batch_size, args.dry_run, args.full)
+        if args.interval <= 0:
+            return
+        time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    main()
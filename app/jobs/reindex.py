@@ -0,0 +1,177 @@
+import argparse
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload
+
+from app.ai.vector_backends import get_vector_store
+from app.ai.vector_store import VectorStore
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.models.case import Case, CaseStatus
+
+
+class Checkpoint:
+    def __init__(self, path: str):
+        self.path = path
+
+    def load(self) -> int:
+        if not os.path.exists(self.path):
+            return 0
+        with open(self.path, "r", encoding="utf-8") as f:
+            return json.load(f).get("last_case_id", 0)
+
+    def save(self, last_case_id: int):
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"last_case_id": last_case_id}, f)
+        os.replace(tmp_path, self.path)
+
+    def clear(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def stream_approved_cases(
+    db: Session, after_case_id: int, page_size: int
+) -> Iterator[List[Case]]:
+    stmt = (
+        select(Case)
+        .options(selectinload(Case.scammer_infos))
+        .where(Case.status == CaseStatus.APPROVED, Case.id > after_case_id)
+        .order_by(Case.id)
+        .execution_options(yield_per=page_size)
+    )
+    for page in db.execute(stmt).scalars().partitions():
+        yield page
+        for case in page:
+            db.expunge(case)
+
+
+def sync_cases(db: Session, store: VectorStore, case_ids: List[int]) -> Tuple[int, int]:
+    cases = (
+        db.query(Case)
+        .options(selectinload(Case.scammer_infos))
+        .filter(Case.id.in_(case_ids))
+        .all()
+    )
+    approved = [case for case in cases if case.status == CaseStatus.APPROVED]
+    if approved:
+        point_ids, search_texts, lexical_texts, payloads = store.build_points(approved)
+        embeddings = store.embedding_service.encode_batch(search_texts)
+        store.upsert_points(point_ids, embeddings, payloads, lexical_texts)
+
+    approved_ids = {case.id for case in approved}
+    removed = [case_id for case_id in case_ids if case_id not in approved_ids]
+    if removed:
+        store.delete_cases(removed)
+
+    db.expunge_all()
+    return len(approved), len(removed)
+
+
+def reindex(
+    db: Session,
+    store: VectorStore,
+    checkpoint: Checkpoint,
+    page_size: int = 1000,
+    upsert_batch_size: int = 256,
+    parallel: int = 4,
+    limit: Optional[int] = None,
+) -> int:
+    last_case_id = checkpoint.load()
+    indexed = 0
+    started_at = time.perf_counter()
+    pending = deque()
+
+    def commit_pending(max_pending: int):
+        while pending and (
+            len(pending) > max_pending or all(f.done() for f in pending[0][1])
+        ):
+            case_id, futures = pending.popleft()
+            for future in futures:
+                future.result()
+            checkpoint.save(case_id)
+
+    with ThreadPoolExecutor(max_workers=parallel) as executor:
+        for page in stream_approved_cases(db, last_case_id, page_size):
+            if limit is not None:
+                page = page[: limit - indexed]
+
+            point_ids, search_texts, lexical_texts, payloads = store.build_points(page)
+            embeddings = store.embedding_service.encode_batch(search_texts)
+
+            futures = [
+                executor.submit(
+                    store.upsert_points,
+                    point_ids[i : i + upsert_batch_size],
+                    embeddings[i : i + upsert_batch_size],
+                    payloads[i : i + upsert_batch_size],
+                    lexical_texts[i : i + upsert_batch_size],
+                )
+                for i in range(0, len(page), upsert_batch_size)
+            ]
+            pending.append((page[-1].id, futures))
+            commit_pending(max_pending=parallel)
+
+            indexed += len(page)
+            elapsed = time.perf_counter() - started_at
+            print(
+                f"indexed={indexed} last_case_id={page[-1].id} "
+                f"docs_per_sec={indexed / elapsed:.1f}"
+            )
+
+            if limit is not None and indexed >= limit:
+                break
+
+        commit_pending(max_pending=0)
+
+    return indexed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rebuild the Qdrant case collection from approved cases"
+    )
+    parser.add_argument("--checkpoint", default="reindex.checkpoint.json")
+    parser.add_argument("--restart", action="store_true")
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--upsert-batch-size", type=int, default=256)
+    parser.add_argument("--parallel", type=int, default=4)
+    parser.add_argument("--limit", type=int, default=None)
+    parser.add_argument("--qdrant-url", default=None)
+    args = parser.parse_args()
+
+    if args.qdrant_url:
+        settings.qdrant_url = args.qdrant_url
+
+    checkpoint = Checkpoint(args.checkpoint)
+    if args.restart:
+        checkpoint.clear()
+
+    started_at = time.perf_counter()
+    db = SessionLocal()
+    try:
+        indexed = reindex(
+            db,
+            get_vector_store(),
+            checkpoint,
+            page_size=args.page_size,
+            upsert_batch_size=args.upsert_batch_size,
+            parallel=args.parallel,
+            limit=args.limit,
+        )
+    finally:
+        db.close()
+
+    elapsed = time.perf_counter() - started_at
+    print(f"done: {indexed} cases in {elapsed:.1f}s ({indexed / elapsed:.1f} docs/sec)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import argparse
+import time
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.db.database import SessionLocal
+from app.models.consultation import Consultation
+from app.services.consultation_service import ConsultationService
+
+
+def summarize(db: Session, batch_size: int = 100) -> int:
+    service = ConsultationService(db)
+    last_id = 0
+    summarized = 0
+
+    while True:
+        consultations = (
+            db.execute(
+                select(Consultation)
+                .where(Consultation.id > last_id)
+                .order_by(Consultation.id)
+                .limit(batch_size)
+            )
+            .scalars()
+            .all()
+        )
+        if not consultations:
+            return summarized
+
+        for consultation in consultations:
+            previous = consultation.summary_message_id
+            service._build_context(consultation)
+            if consultation.summary_message_id != previous:
+                summarized += 1
+        last_id = consultations[-1].id
+        db.expunge_all()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Fold older consultation turns into rolling summaries"
+    )
+    parser.add_argument("--batch-size", type=int, default=100)
+    args = parser.parse_args()
+
+    started_at = time.perf_counter()
+    db = SessionLocal()
+    try:
+        summarized = summarize(db, batch_size=args.batch_size)
+    finally:
+        db.close()
+
+    print(
+        f"done: {summarized} consultations summarized "
+        f"in {time.perf_counter() - started_at:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
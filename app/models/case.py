@@ -1,18 +1,23 @@
 import enum
 from datetime import datetime, timezone
+from typing import List, Tuple
 
 from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     TypeDecorator,
+    event,
+    tuple_,
 )
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.orm import relationship
 
+from app.core.identifiers import normalize_identifier
 from app.db.database import Base
 
 
@@ -62,6 +67,24 @@ class LowerCaseEnum(TypeDecorator):
         return value
 
 
+class ScamRing(Base):
+    __tablename__ = "scam_rings"
+
+    id = Column(Integer, primary_key=True, index=True)
+    size = Column(Integer, default=1, nullable=False)
+
+    created_at = Column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+    )
+    updated_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+
+    cases = relationship("Case", back_populates="ring")
+
+
 class Case(Base):
     __tablename__ = "cases"
 
@@ -77,6 +100,7 @@ class Case(Base):
     status = Column(
         LowerCaseEnum(CaseStatus, length=20), default=CaseStatus.PENDING, nullable=False
     )
+    ring_id = Column(Integer, ForeignKey("scam_rings.id"), nullable=True, index=True)
 
     created_at = Column(
         DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
@@ -88,10 +112,24 @@ class Case(Base):
     )
 
     user = relationship("User", back_populates="cases")
+    ring = relationship("ScamRing", back_populates="cases")
     scammer_infos = relationship(
         "ScammerInfo", back_populates="case", cascade="all, delete-orphan"
     )
 
+    @property
+    def identifier_keys(self) -> List[Tuple[str, str]]:
+        return sorted(
+            {
+                (
+                    getattr(info.info_type, "value", info.info_type),
+                    info.normalized_value,
+                )
+                for info in self.scammer_infos
+                if info.normalized_value
+            }
+        )
+
 
 class ScammerInfoType(str, enum.Enum):
     NAME = "name"
@@ -101,13 +139,41 @@ class ScammerInfoType(str, enum.Enum):
     SNS_ID = "sns_id"
 
 
+class ScammerInfoSource(str, enum.Enum):
+    USER = "user"
+    EXTRACTED = "extracted"
+
+
 class ScammerInfo(Base):
     __tablename__ = "scammer_infos"
+    __table_args__ = (
+        Index("ix_scammer_infos_identifier", "info_type", "normalized_value"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    case_id = Column(Integer, ForeignKey("cases.id"), nullable=False)
+    case_id = Column(Integer, ForeignKey("cases.id"), nullable=False, index=True)
 
     info_type = Column(LowerCaseEnum(ScammerInfoType, length=20), nullable=False)
     value = Column(String(200), nullable=False)
+    normalized_value = Column(String(200), nullable=True)
+    source = Column(
+        LowerCaseEnum(ScammerInfoSource, length=20),
+        nullable=False,
+        default=ScammerInfoSource.USER,
+        server_default=ScammerInfoSource.USER.value,
+    )
 
     case = relationship("Case", back_populates="scammer_infos")
+
+    @classmethod
+    def matches_any(cls, identifier_keys: List[Tuple[str, str]]):
+        return tuple_(cls.info_type, cls.normalized_value).in_(identifier_keys)
+
+
+@event.listens_for(ScammerInfo, "before_insert")
+@event.listens_for(ScammerInfo, "before_update")
+def _normalize_scammer_info(mapper, connection, target: ScammerInfo):
+    if target.source == ScammerInfoSource.EXTRACTED:
+        target.normalized_value = None
+        return
+    target.normalized_value = normalize_identifier(target.info_type, target.value)
@@ -20,10 +20,13 @@ class Consultation(Base):
     group_id = Column(
         Integer, ForeignKey("groups.id", ondelete="CASCADE"), nullable=True
     )
+    summary = Column(Text, nullable=True)
+    summary_message_id = Column(Integer, nullable=True)
     created_at = Column(
         DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
     )
 
+    case = relationship("Case")
     author = relationship("User", back_populates="consultations")
     group = relationship("Group", back_populates="consultations")
     messages = relationship(
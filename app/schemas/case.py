@@ -1,9 +1,9 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
-from app.models.case import CaseStatus, CaseType, ScammerInfoType
+from app.models.case import CaseStatus, CaseType, ScammerInfoSource, ScammerInfoType
 
 
 class ScammerInfoCreate(BaseModel):
@@ -25,6 +25,7 @@ class ScammerInfoResponse(BaseModel):
     case_id: int
     info_type: ScammerInfoType
     value: str
+    source: ScammerInfoSource = ScammerInfoSource.USER
 
     class Config:
         from_attributes = True
@@ -80,3 +81,35 @@ class SimilarCaseResponse(BaseModel):
     scammer_infos: List[dict]
     similarity_score: float
     created_at: Optional[str]
+
+
+class LinkedCaseResponse(BaseModel):
+    id: int
+    case_type: CaseType
+    title: str
+    created_at: datetime
+    shared_identifiers: List[ScammerInfoResponse] = Field(
+        validation_alias="scammer_infos"
+    )
+
+    class Config:
+        from_attributes = True
+
+
+class RingResponse(BaseModel):
+    ring_id: int
+    size: int
+    case_types: Dict[str, int]
+    first_reported_at: datetime
+    last_reported_at: datetime
+
+
+class TriageIdentifier(BaseModel):
+    info_type: Literal["phone", "account", "sns_id"]
+    value: str
+
+
+class CaseTriage(BaseModel):
+    verdict: CaseStatus
+    title: str
+    identifiers: List[TriageIdentifier]
@@ -1,16 +1,33 @@
-from typing import List, Optional
+import asyncio
+from typing import List, Optional, Tuple
 
-from sqlalchemy.orm import Session, joinedload
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session, contains_eager, joinedload
 
-from app.ai.case import analyze_case, generate_title
-from app.ai.vector_store import VectorStore
+from app.ai.case import triage_case
+from app.ai.near_duplicate import (
+    canonical_statement,
+    minhash_signature,
+    near_duplicate_index,
+)
+from app.ai.similar_case_cache import similar_case_cache
+from app.ai.vector_backends import get_async_vector_store
+from app.core.config import settings
 from app.core.exceptions import (
     ForbiddenException,
     NotFoundException,
     UnprocessableEntityException,
 )
-from app.models.case import Case, CaseStatus, ScammerInfo
-from app.schemas.case import CaseCreate
+from app.core.identifiers import normalize_identifier
+from app.core.metrics import metrics
+from app.models.case import Case, CaseStatus, ScammerInfo, ScammerInfoSource
+from app.schemas.case import CaseCreate, ScammerInfoCreate, TriageIdentifier
+from app.services.ring_service import RingService
+
+similar_search_failures = metrics.counter("similar_search_failures")
+
+HYDRATED_FIELDS = ("title", "statement", "scammer_infos")
 
 
 def to_db_value(enum_val):
@@ -24,14 +41,139 @@ def to_db_value(enum_val):
 class CaseService:
     def __init__(self, db: Session):
         self.db = db
-        self.vector_store = VectorStore()
+        self.vector_store = get_async_vector_store()
+        self.ring_service = RingService(db)
 
-    async def create_case(self, case: CaseCreate, user_id: int) -> Case:
-        status = await analyze_case(case.case_type, case.statement, case.scammer_infos)
-        if status == CaseStatus.REJECTED:
+    async def _find_duplicate(
+        self, case: CaseCreate, user_id: int, signature: np.ndarray
+    ) -> Optional[Case]:
+        if not settings.near_duplicate_detection:
+            return None
+        try:
+            matches = await near_duplicate_index.find(
+                signature, user_id, settings.near_duplicate_threshold
+            )
+        except Exception:
+            return None
+        if not matches:
+            return None
+
+        candidates = {
+            candidate.id: candidate
+            for candidate in self.db.query(Case)
+            .options(joinedload(Case.scammer_infos))
+            .filter(
+                Case.id.in_([case_id for case_id, _, _ in matches]),
+                Case.case_type == to_db_value(case.case_type),
+            )
+        }
+        for case_id, _, _ in matches:
+            if case_id in candidates:
+                return candidates[case_id]
+        return None
+
+    async def _triage(
+        self, case: CaseCreate
+    ) -> Tuple[CaseStatus, str, List[TriageIdentifier]]:
+        triage = await triage_case(case.case_type, case.statement, case.scammer_infos)
+        if triage.verdict == CaseStatus.REJECTED:
             raise UnprocessableEntityException("Invalid or inappropriate case content")
+        return triage.verdict, triage.title, triage.identifiers
+
+    def _extracted_identifiers(
+        self,
+        scammer_infos: List[ScammerInfoCreate],
+        identifiers: List[TriageIdentifier],
+    ) -> List[ScammerInfoCreate]:
+        if not settings.case_triage_extract_identifiers:
+            return []
+
+        extracted = []
+        seen = {
+            (
+                to_db_value(info.info_type),
+                normalize_identifier(info.info_type, info.value),
+            )
+            for info in scammer_infos
+        }
+        for identifier in identifiers:
+            key = (
+                identifier.info_type,
+                normalize_identifier(identifier.info_type, identifier.value),
+            )
+            if key[1] is None or key in seen:
+                continue
+            seen.add(key)
+            extracted.append(
+                ScammerInfoCreate(
+                    info_type=identifier.info_type, value=identifier.value[:200]
+                )
+            )
+        return extracted
+
+    def _identifier_key(self, info_type, value: str) -> Tuple[str, str]:
+        return (
+            to_db_value(info_type),
+            normalize_identifier(info_type, value) or value.strip(),
+        )
+
+    def _new_identifiers(
+        self, case: Case, scammer_infos: List[ScammerInfoCreate]
+    ) -> List[ScammerInfoCreate]:
+        seen = {
+            self._identifier_key(info.info_type, info.value)
+            for info in case.scammer_infos
+            if info.source != ScammerInfoSource.EXTRACTED
+        }
+        new = []
+        for info in scammer_infos:
+            key = self._identifier_key(info.info_type, info.value)
+            if key not in seen:
+                seen.add(key)
+                new.append(info)
+        return new
+
+    async def _add_identifiers(
+        self, case: Case, scammer_infos: List[ScammerInfoCreate]
+    ) -> Case:
+        for info in scammer_infos:
+            self.db.add(
+                ScammerInfo(
+                    case_id=case.id,
+                    info_type=to_db_value(info.info_type),
+                    value=info.value,
+                )
+            )
+        self.db.commit()
+
+        case = self.get_case(case.id)
+        if case.status == CaseStatus.APPROVED:
+            try:
+                self.ring_service.assign(case)
+            except Exception:
+                self.db.rollback()
+            await self.vector_store.index_case(case)
+        return case
+
+    async def create_case(self, case: CaseCreate, user_id: int) -> Case:
+        signature = minhash_signature(case.statement)
+        duplicate = await self._find_duplicate(case, user_id, signature)
+        same_user = duplicate is not None and duplicate.user_id == user_id
+        same_text = duplicate is not None and canonical_statement(
+            duplicate.statement
+        ) == canonical_statement(case.statement)
+        if same_user and same_text:
+            new_identifiers = self._new_identifiers(duplicate, case.scammer_infos)
+            if not new_identifiers:
+                return duplicate
+            return await self._add_identifiers(duplicate, new_identifiers)
 
-        case_title = await generate_title(case.statement)
+        extracted = []
+        if same_user or same_text:
+            status, case_title = duplicate.status, duplicate.title
+        else:
+            status, case_title, identifiers = await self._triage(case)
+            extracted = self._extracted_identifiers(case.scammer_infos, identifiers)
 
         db_case = Case(
             user_id=user_id,
@@ -44,13 +186,18 @@ class CaseService:
         self.db.add(db_case)
         self.db.flush()
 
-        for info in case.scammer_infos:
-            scammer_info = ScammerInfo(
-                case_id=db_case.id,
-                info_type=to_db_value(info.info_type),
-                value=info.value,
-            )
-            self.db.add(scammer_info)
+        for source, infos in (
+            (ScammerInfoSource.USER, case.scammer_infos),
+            (ScammerInfoSource.EXTRACTED, extracted),
+        ):
+            for info in infos:
+                scammer_info = ScammerInfo(
+                    case_id=db_case.id,
+                    info_type=to_db_value(info.info_type),
+                    value=info.value,
+                    source=source,
+                )
+                self.db.add(scammer_info)
 
         self.db.commit()
 
@@ -61,8 +208,17 @@ class CaseService:
             .first()
         )
 
+        try:
+            await near_duplicate_index.add(db_case.id, user_id, signature)
+        except Exception:
+            pass
+
         if status == CaseStatus.APPROVED:
-            self.vector_store.index_case(db_case)
+            try:
+                self.ring_service.assign(db_case)
+            except Exception:
+                self.db.rollback()
+            await self.vector_store.index_case(db_case)
 
         return db_case
 
@@ -95,7 +251,7 @@ class CaseService:
             .first()
         )
 
-    def delete_case(self, case_id: int, user_id: int) -> None:
+    async def delete_case(self, case_id: int, user_id: int) -> None:
         db_case = self.db.query(Case).filter(Case.id == case_id).first()
         if not db_case:
             raise NotFoundException("Case not found")
@@ -103,12 +259,107 @@ class CaseService:
         if db_case.user_id != user_id:
             raise ForbiddenException("Only case owner can delete")
 
-        self.vector_store.delete_case(case_id)
+        ring_id = db_case.ring_id
+        await self.vector_store.delete_case(case_id)
+        try:
+            await near_duplicate_index.remove(case_id, user_id)
+        except Exception:
+            pass
         self.db.delete(db_case)
         self.db.commit()
 
-    def get_similar_cases(
+        if ring_id is not None:
+            self.ring_service.split(ring_id)
+
+    async def get_similar_cases(
         self, case_id: int, user_id: int, limit: int = 5
     ) -> List[dict]:
+        case = await asyncio.to_thread(self.get_user_case, case_id, user_id)
+        try:
+            return await similar_case_cache.get_or_search(
+                case.id,
+                case.case_type.value,
+                limit,
+                lambda: self._search_similar(case, limit),
+            )
+        except Exception:
+            similar_search_failures.inc()
+            return []
+
+    async def _search_similar(self, case: Case, limit: int) -> List[dict]:
+        results = await self.vector_store.search_by_case(case, limit=limit)
+        if any(
+            result[field] is None for result in results for field in HYDRATED_FIELDS
+        ):
+            results = await asyncio.to_thread(self._hydrate_similar_cases, results)
+        return results
+
+    def _hydrate_similar_cases(self, results: List[dict]) -> List[dict]:
+        if not results:
+            return results
+
+        cases = {
+            case.id: case
+            for case in self.db.query(Case)
+            .options(joinedload(Case.scammer_infos))
+            .filter(
+                Case.id.in_([result["case_id"] for result in results]),
+                Case.status == CaseStatus.APPROVED,
+            )
+            .all()
+        }
+
+        hydrated = []
+        for result in results:
+            case = cases.get(result["case_id"])
+            if case is None:
+                continue
+            hydrated.append(
+                {
+                    **result,
+                    "title": case.title,
+                    "statement": case.statement[:500],
+                    "scammer_infos": [
+                        {"info_type": info.info_type.value, "value": info.value}
+                        for info in case.scammer_infos
+                    ],
+                }
+            )
+        return hydrated
+
+    def get_linked_cases(
+        self, case_id: int, user_id: int, limit: int = 50
+    ) -> List[Case]:
+        case = self.get_user_case(case_id, user_id)
+        identifier_keys = case.identifier_keys
+        if not identifier_keys:
+            return []
+
+        def matches():
+            return (
+                ScammerInfo.matches_any(identifier_keys),
+                Case.status == CaseStatus.APPROVED,
+                Case.id != case.id,
+            )
+
+        linked_ids = (
+            select(ScammerInfo.case_id)
+            .join(Case, Case.id == ScammerInfo.case_id)
+            .where(*matches())
+            .distinct()
+            .order_by(ScammerInfo.case_id.desc())
+            .limit(limit)
+        )
+
+        return (
+            self.db.query(Case)
+            .join(Case.scammer_infos)
+            .options(contains_eager(Case.scammer_infos))
+            .filter(*matches(), Case.id.in_(linked_ids))
+            .order_by(Case.id.desc())
+            .all()
+        )
+
+    def get_case_ring(self, case_id: int, user_id: int) -> dict:
         case = self.get_user_case(case_id, user_id)
-        return self.vector_store.search_by_case(case, limit=limit)
+        return self.ring_service.get_case_ring(case)
@@ -1,8 +1,18 @@
-from typing import List, Optional
+import asyncio
+from contextlib import aclosing
+from typing import AsyncIterator, List, Optional, Tuple
 
 from sqlalchemy.orm import Session
 
+from app.ai.conversation_context import (
+    message_tokens,
+    split_history,
+    truncate_history,
+)
 from app.ai.legal_consultant import LegalConsultant
+from app.ai.message_vector_store import MessageVectorStore
+from app.ai.vector_backends import get_message_store
+from app.core.config import settings
 from app.core.exceptions import (
     ForbiddenException,
     NotFoundException,
@@ -13,6 +23,7 @@ from app.models.group import Group
 from app.schemas.consultation import (
     ConsultationCreate,
     ConsultationMessageCreate,
+    ConsultationMessageResponse,
 )
 
 
@@ -72,7 +83,7 @@ class ConsultationService:
             .first()
         )
 
-    def delete_consultation(self, consultation_id: int, user_id: int) -> None:
+    async def delete_consultation(self, consultation_id: int, user_id: int) -> None:
         db_consultation = (
             self.db.query(Consultation)
             .filter(Consultation.id == consultation_id)
@@ -87,7 +98,9 @@ class ConsultationService:
         self.db.delete(db_consultation)
         self.db.commit()
 
-    def create_message(
+        await asyncio.to_thread(self._unindex_consultation, consultation_id)
+
+    async def create_message(
         self, consultation_id: int, message: ConsultationMessageCreate, user_id: int
     ) -> ConsultationMessage:
         consultation = (
@@ -120,6 +133,7 @@ class ConsultationService:
         self.db.add(db_message)
         self.db.commit()
         self.db.refresh(db_message)
+        await asyncio.to_thread(self._index_messages, [db_message])
         return db_message
 
     def get_consultation_messages(
@@ -134,7 +148,7 @@ class ConsultationService:
             .all()
         )
 
-    def delete_message(self, message_id: int, user_id: int) -> None:
+    async def delete_message(self, message_id: int, user_id: int) -> None:
         db_message = (
             self.db.query(ConsultationMessage)
             .filter(ConsultationMessage.id == message_id)
@@ -149,15 +163,182 @@ class ConsultationService:
         self.db.delete(db_message)
         self.db.commit()
 
-    def create_ai_message(
-        self, consultation_id: int, user_message: str, user_id: int
-    ) -> ConsultationMessage:
+        await asyncio.to_thread(self._unindex_messages, [message_id])
+
+    def _get_accessible_consultation(
+        self, consultation_id: int, user_id: int
+    ) -> Consultation:
         consultation = self.get_consultation(consultation_id)
         if not consultation:
             raise NotFoundException("Consultation not found")
 
         if not self.can_access_consultation(consultation_id, user_id):
             raise ForbiddenException("Access denied")
+        return consultation
+
+    def _unsummarized_messages(
+        self, consultation: Consultation
+    ) -> List[ConsultationMessage]:
+        query = self.db.query(ConsultationMessage).filter(
+            ConsultationMessage.consultation_id == consultation.id
+        )
+        if consultation.summary_message_id is not None:
+            query = query.filter(
+                ConsultationMessage.id > consultation.summary_message_id
+            )
+        return query.order_by(ConsultationMessage.id.asc()).all()
+
+    def _to_history(self, messages: List[ConsultationMessage]) -> List[dict]:
+        conversation_history = []
+        for msg in messages:
+            role = "assistant" if msg.author_id == 0 else "user"
+            conversation_history.append({"role": role, "content": msg.content})
+        return conversation_history
+
+    def _plan_context(
+        self, consultation: Consultation
+    ) -> Tuple[List[ConsultationMessage], List[ConsultationMessage]]:
+        messages = self._unsummarized_messages(consultation)
+        start = split_history(
+            self._to_history(messages), settings.consultation_history_tokens
+        )
+        return messages[:start], messages[start:]
+
+    def _unfolded_window(
+        self, folded: List[ConsultationMessage], window: List[ConsultationMessage]
+    ) -> List[ConsultationMessage]:
+        messages = folded + window
+        start = truncate_history(
+            self._to_history(messages), settings.consultation_history_tokens
+        )
+        return messages[start:]
+
+    def _save_summary(
+        self, consultation: Consultation, summary: str, folded_until: int
+    ) -> None:
+        consultation.summary = summary
+        consultation.summary_message_id = folded_until
+        self.db.commit()
+
+    def _message_store(self) -> Optional[MessageVectorStore]:
+        if not settings.consultation_retrieval:
+            return None
+        return get_message_store()
+
+    def _index_messages(self, messages: List[ConsultationMessage]) -> None:
+        store = self._message_store()
+        if store is not None:
+            store.index_messages(messages)
+
+    def _unindex_messages(self, message_ids: List[int]) -> None:
+        store = self._message_store()
+        if store is not None:
+            try:
+                store.delete_messages(message_ids)
+            except Exception:
+                pass
+
+    def _unindex_consultation(self, consultation_id: int) -> None:
+        store = self._message_store()
+        if store is not None:
+            try:
+                store.delete_consultation(consultation_id)
+            except Exception:
+                pass
+
+    def _search_relevant(
+        self,
+        consultation_id: int,
+        question: Optional[str],
+        window: List[ConsultationMessage],
+    ) -> List[int]:
+        store = self._message_store()
+        if store is None or not question:
+            return []
+        try:
+            return store.search(
+                consultation_id,
+                question,
+                settings.consultation_retrieval_limit,
+                before_message_id=window[0].id if window else None,
+                score_threshold=settings.consultation_retrieval_threshold,
+            )
+        except Exception:
+            return []
+
+    def _load_relevant(
+        self, consultation: Consultation, message_ids: List[int]
+    ) -> List[ConsultationMessage]:
+        if not message_ids:
+            return []
+
+        found = {
+            msg.id: msg
+            for msg in self.db.query(ConsultationMessage).filter(
+                ConsultationMessage.consultation_id == consultation.id,
+                ConsultationMessage.id.in_(message_ids),
+            )
+        }
+        relevant = []
+        used = 0
+        for message_id in message_ids:
+            msg = found.get(message_id)
+            if msg is None:
+                continue
+            tokens = message_tokens(self._to_history([msg])[0])
+            if used + tokens > settings.consultation_retrieval_tokens:
+                continue
+            used += tokens
+            relevant.append(msg)
+        return sorted(relevant, key=lambda msg: msg.id)
+
+    def _build_context(
+        self, consultation: Consultation, question: Optional[str] = None
+    ) -> Tuple[Optional[str], List[dict]]:
+        folded, window = self._plan_context(consultation)
+        if folded:
+            try:
+                summary = self.legal_consultant.summarize(
+                    consultation.summary, self._to_history(folded)
+                )
+                self._save_summary(consultation, summary, folded[-1].id)
+            except Exception:
+                self.db.rollback()
+                window = self._unfolded_window(folded, window)
+
+        message_ids = self._search_relevant(consultation.id, question, window)
+        relevant = self._load_relevant(consultation, message_ids)
+        return consultation.summary, self._to_history(relevant + window)
+
+    async def _build_context_async(
+        self, consultation: Consultation, question: Optional[str] = None
+    ) -> Tuple[Optional[str], List[dict]]:
+        folded, window = self._plan_context(consultation)
+        if folded:
+            try:
+                summary = await asyncio.to_thread(
+                    self.legal_consultant.summarize,
+                    consultation.summary,
+                    self._to_history(folded),
+                )
+                self._save_summary(consultation, summary, folded[-1].id)
+            except Exception:
+                self.db.rollback()
+                window = self._unfolded_window(folded, window)
+
+        message_ids = await asyncio.to_thread(
+            self._search_relevant, consultation.id, question, window
+        )
+        relevant = self._load_relevant(consultation, message_ids)
+        return consultation.summary, self._to_history(relevant + window)
+
+    async def create_ai_message(
+        self, consultation_id: int, user_message: str, user_id: int
+    ) -> ConsultationMessage:
+        consultation = self._get_accessible_consultation(consultation_id, user_id)
+        conversation_summary, conversation_history = await self._build_context_async(
+            consultation, user_message
+        )
 
         user_msg = ConsultationMessage(
             content=user_message,
@@ -167,17 +348,14 @@ class ConsultationService:
         self.db.add(user_msg)
         self.db.flush()
 
-        conversation_history = []
-        for msg in consultation.messages[:-1]:
-            role = "assistant" if msg.author_id == 0 else "user"
-            conversation_history.append({"role": role, "content": msg.content})
-
-        ai_response = self.legal_consultant.generate_response(
+        ai_response = await asyncio.to_thread(
+            self.legal_consultant.generate_response,
             case_statement=consultation.case.statement,
             case_type=consultation.case.case_type.value,
             conversation_history=conversation_history,
             user_question=user_message,
             include_legal_search=True,
+            conversation_summary=conversation_summary,
         )
 
         ai_msg = ConsultationMessage(
@@ -189,9 +367,61 @@ class ConsultationService:
         self.db.commit()
         self.db.refresh(user_msg)
         self.db.refresh(ai_msg)
+        await asyncio.to_thread(self._index_messages, [user_msg, ai_msg])
 
         return ai_msg
 
+    def stream_ai_message(
+        self, consultation_id: int, user_message: str, user_id: int
+    ) -> AsyncIterator[Tuple[str, dict]]:
+        consultation = self._get_accessible_consultation(consultation_id, user_id)
+        return self._stream_ai_reply(consultation, user_message, user_id)
+
+    async def _stream_ai_reply(
+        self, consultation: Consultation, user_message: str, user_id: int
+    ) -> AsyncIterator[Tuple[str, dict]]:
+        conversation_summary, conversation_history = await self._build_context_async(
+            consultation, user_message
+        )
+
+        chunks = []
+        stream = self.legal_consultant.stream_response(
+            case_statement=consultation.case.statement,
+            case_type=consultation.case.case_type.value,
+            conversation_history=conversation_history,
+            user_question=user_message,
+            include_legal_search=True,
+            conversation_summary=conversation_summary,
+        )
+        try:
+            async with aclosing(stream):
+                async for chunk in stream:
+                    chunks.append(chunk)
+                    yield "delta", {"content": chunk}
+        except Exception:
+            yield "error", {"detail": "Failed to generate a response"}
+            return
+
+        user_msg = ConsultationMessage(
+            content=user_message,
+            consultation_id=consultation.id,
+            author_id=user_id,
+        )
+        ai_msg = ConsultationMessage(
+            content="".join(chunks).strip(),
+            consultation_id=consultation.id,
+            author_id=0,
+        )
+        self.db.add_all([user_msg, ai_msg])
+        self.db.commit()
+        self.db.refresh(user_msg)
+        self.db.refresh(ai_msg)
+        await asyncio.to_thread(self._index_messages, [user_msg, ai_msg])
+
+        yield "done", ConsultationMessageResponse.model_validate(ai_msg).model_dump(
+            mode="json"
+        )
+
     def can_access_consultation(self, consultation_id: int, user_id: int) -> bool:
         consultation = self.get_consultation(consultation_id)
         if not consultation:
@@ -0,0 +1,217 @@
+import hashlib
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import bindparam, func, insert, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.core.exceptions import NotFoundException
+from app.models.case import Case, CaseStatus, ScammerInfo, ScamRing
+
+
+class UnionFind:
+    def __init__(self):
+        self.parent: Dict[int, int] = {}
+        self.size: Dict[int, int] = {}
+
+    def add(self, item: int):
+        if item not in self.parent:
+            self.parent[item] = item
+            self.size[item] = 1
+
+    def find(self, item: int) -> int:
+        while self.parent[item] != item:
+            self.parent[item] = self.parent[self.parent[item]]
+            item = self.parent[item]
+        return item
+
+    def union(self, a: int, b: int):
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+
+    def components(self) -> List[List[int]]:
+        groups = defaultdict(list)
+        for item in self.parent:
+            groups[self.find(item)].append(item)
+        return list(groups.values())
+
+
+def link_cases(rows: Iterable[Tuple[int, str, str]]) -> UnionFind:
+    rings = UnionFind()
+    first_case_by_identifier: Dict[Tuple[str, str], int] = {}
+
+    for case_id, info_type, normalized_value in rows:
+        rings.add(case_id)
+        if normalized_value is None:
+            continue
+        key = (getattr(info_type, "value", info_type), normalized_value)
+        first_case_id = first_case_by_identifier.setdefault(key, case_id)
+        rings.union(first_case_id, case_id)
+
+    return rings
+
+
+def identifier_lock_key(identifier_key: Tuple[str, str]) -> int:
+    digest = hashlib.blake2b("\0".join(identifier_key).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+class RingService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _lock_identifiers(self, identifier_keys: List[Tuple[str, str]]):
+        if self.db.get_bind().dialect.name != "postgresql":
+            return
+        for identifier_key in identifier_keys:
+            self.db.execute(
+                select(func.pg_advisory_xact_lock(identifier_lock_key(identifier_key)))
+            )
+
+    def assign(self, case: Case) -> ScamRing:
+        identifier_keys = case.identifier_keys
+        conditions = []
+        if identifier_keys:
+            self._lock_identifiers(identifier_keys)
+            linked_ring_ids = (
+                select(Case.ring_id)
+                .join(ScammerInfo, ScammerInfo.case_id == Case.id)
+                .where(
+                    ScammerInfo.matches_any(identifier_keys),
+                    Case.status == CaseStatus.APPROVED,
+                    Case.id != case.id,
+                    Case.ring_id.isnot(None),
+                )
+                .distinct()
+            )
+            conditions.append(ScamRing.id.in_(linked_ring_ids))
+        if case.ring_id is not None:
+            conditions.append(ScamRing.id == case.ring_id)
+
+        rings = []
+        if conditions:
+            rings = (
+                self.db.query(ScamRing)
+                .filter(or_(*conditions))
+                .order_by(ScamRing.size.desc(), ScamRing.id)
+                .with_for_update()
+                .all()
+            )
+
+        if not rings:
+            ring = ScamRing(size=1)
+            self.db.add(ring)
+            self.db.flush()
+            case.ring_id = ring.id
+            self.db.commit()
+            return ring
+
+        counted = case.ring_id is not None
+        root, merged = rings[0], rings[1:]
+        for ring in merged:
+            self.db.execute(
+                update(Case)
+                .where(Case.ring_id == ring.id)
+                .values(ring_id=root.id, updated_at=Case.updated_at)
+            )
+            root.size += ring.size
+            self.db.delete(ring)
+
+        case.ring_id = root.id
+        if not counted:
+            root.size += 1
+        self.db.commit()
+        return root
+
+    def _relabel(self, components: List[List[int]], reuse: Optional[ScamRing] = None):
+        components = sorted(components, key=len, reverse=True)
+        fresh = components
+        ring_ids = []
+        if reuse is not None:
+            reuse.size = len(components[0])
+            ring_ids.append(reuse.id)
+            fresh = components[1:]
+
+        if fresh:
+            ring_ids += self.db.scalars(
+                insert(ScamRing).returning(ScamRing.id, sort_by_parameter_order=True),
+                [{"size": len(members)} for members in fresh],
+            ).all()
+
+        self.db.connection().execute(
+            update(Case.__table__)
+            .where(Case.__table__.c.id == bindparam("case_id"))
+            .values(ring_id=bindparam("new_ring_id"), updated_at=Case.updated_at),
+            [
+                {"case_id": case_id, "new_ring_id": ring_id}
+                for ring_id, members in zip(ring_ids, components)
+                for case_id in members
+            ],
+        )
+
+    def split(self, ring_id: int):
+        ring = (
+            self.db.query(ScamRing)
+            .filter(ScamRing.id == ring_id)
+            .with_for_update()
+            .first()
+        )
+        if ring is None:
+            return
+
+        rows = self.db.execute(
+            select(Case.id, ScammerInfo.info_type, ScammerInfo.normalized_value)
+            .outerjoin(ScammerInfo, ScammerInfo.case_id == Case.id)
+            .where(Case.ring_id == ring_id, Case.status == CaseStatus.APPROVED)
+        ).all()
+
+        if not rows:
+            self.db.delete(ring)
+        else:
+            self._relabel(link_cases(rows).components(), reuse=ring)
+        self.db.commit()
+
+    def rebuild(self, batch_size: int = 10000) -> int:
+        rows = self.db.execute(
+            select(Case.id, ScammerInfo.info_type, ScammerInfo.normalized_value)
+            .outerjoin(ScammerInfo, ScammerInfo.case_id == Case.id)
+            .where(Case.status == CaseStatus.APPROVED)
+            .order_by(Case.id)
+            .execution_options(yield_per=batch_size)
+        )
+        components = link_cases(rows).components()
+
+        self.db.execute(update(Case).values(ring_id=None, updated_at=Case.updated_at))
+        self.db.query(ScamRing).delete()
+        self._relabel(components)
+        self.db.commit()
+        return len(components)
+
+    def get_case_ring(self, case: Case) -> Dict:
+        if case.ring_id is None:
+            raise NotFoundException("Case is not part of a ring")
+
+        ring = self.db.get(ScamRing, case.ring_id)
+        rows = self.db.execute(
+            select(
+                Case.case_type,
+                func.count(Case.id),
+                func.min(Case.created_at),
+                func.max(Case.created_at),
+            )
+            .where(Case.ring_id == ring.id)
+            .group_by(Case.case_type)
+        ).all()
+
+        return {
+            "ring_id": ring.id,
+            "size": ring.size,
+            "case_types": {case_type.value: count for case_type, count, _, _ in rows},
+            "first_reported_at": min(row[2] for row in rows),
+            "last_reported_at": max(row[3] for row in rows),
+        }
@@ -0,0 +1,166 @@
+import argparse
+import asyncio
+import json
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import httpx
+import numpy as np
+from openai import AsyncOpenAI
+
+from app.ai import case as case_ai
+from app.ai.embedding_parity import load_corpus
+from app.models.case import CaseType
+
+BYTES_PER_TOKEN = 3
+LEGACY_PROMPTS_DIR = Path(__file__).parent / "prompts"
+CASE_ANALYSIS_PROMPT = (LEGACY_PROMPTS_DIR / "case_analysis.md").read_text("utf-8")
+CASE_TITLE_PROMPT = (LEGACY_PROMPTS_DIR / "case_title.md").read_text("utf-8")
+
+
+def _tokens(text: str) -> int:
+    return max(1, len(text.encode()) // BYTES_PER_TOKEN)
+
+
+def _completion(content: str, prompt_tokens: int, completion_tokens: int) -> dict:
+    return {
+        "id": "chatcmpl-mock",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "gpt-4o-mini",
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        },
+    }
+
+
+class MockServer:
+    def __init__(self, base_latency: float, prefill_ms: float, decode_ms: float):
+        self.base_latency = base_latency
+        self.prefill_ms = prefill_ms
+        self.decode_ms = decode_ms
+        self.usage = defaultdict(int)
+
+    def _content(self, body: dict) -> str:
+        if "response_format" in body:
+            return json.dumps(
+                {
+                    "verdict": "approved",
+                    "title": "중고거래 선입금 사기",
+                    "identifiers": [{"info_type": "phone", "value": "010-1234-5678"}],
+                },
+                ensure_ascii=False,
+            )
+        if body["messages"][0]["content"] == CASE_ANALYSIS_PROMPT:
+            return "통과"
+        return "중고거래 선입금 사기"
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        content = self._content(body)
+        prompt_tokens = sum(_tokens(m["content"]) for m in body["messages"])
+        completion_tokens = _tokens(content)
+
+        await asyncio.sleep(
+            self.base_latency
+            + (prompt_tokens * self.prefill_ms + completion_tokens * self.decode_ms)
+            / 1000
+        )
+        self.usage["calls"] += 1
+        self.usage["prompt_tokens"] += prompt_tokens
+        self.usage["completion_tokens"] += completion_tokens
+        return httpx.Response(
+            200, json=_completion(content, prompt_tokens, completion_tokens)
+        )
+
+
+async def _legacy_call(system: str, content: str):
+    await case_ai.client.chat.completions.create(
+        model="gpt-4o-mini",
+        messages=[
+            {"role": "system", "content": system},
+            {"role": "user", "content": content},
+        ],
+        max_tokens=50,
+        temperature=0.5,
+    )
+
+
+async def _separate_calls(statement: str):
+    await asyncio.gather(
+        _legacy_call(
+            CASE_ANALYSIS_PROMPT,
+            case_ai._case_message(CaseType.SECONDHAND_FRAUD, statement, []),
+        ),
+        _legacy_call(CASE_TITLE_PROMPT, statement),
+    )
+
+
+async def _triage_call(statement: str):
+    await case_ai.triage_case(CaseType.SECONDHAND_FRAUD, statement, [])
+
+
+async def _measure(submit, statements, args) -> dict:
+    server = MockServer(args.base_latency, args.prefill_ms, args.decode_ms)
+    case_ai.client = AsyncOpenAI(
+        api_key="mock",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(server.handle)),
+    )
+
+    latencies = []
+    for statement in statements:
+        started = time.perf_counter()
+        await submit(statement)
+        latencies.append(time.perf_counter() - started)
+
+    count = len(statements)
+    return {
+        "calls": server.usage["calls"] / count,
+        "prompt_tokens": server.usage["prompt_tokens"] / count,
+        "completion_tokens": server.usage["completion_tokens"] / count,
+        "p50_ms": float(np.percentile(latencies, 50) * 1000),
+        "p99_ms": float(np.percentile(latencies, 99) * 1000),
+    }
+
+
+async def main_async(args):
+    corpus = load_corpus()
+    statements = [corpus[i % len(corpus)] for i in range(args.cases)]
+
+    print(
+        f"{'mode':<10}{'calls':>7}{'prompt_tok':>12}{'completion_tok':>16}"
+        f"{'p50_ms':>10}{'p99_ms':>10}"
+    )
+    for label, submit in (("separate", _separate_calls), ("triage", _triage_call)):
+        result = await _measure(submit, statements, args)
+        print(
+            f"{label:<10}{result['calls']:>7.1f}{result['prompt_tokens']:>12.0f}"
+            f"{result['completion_tokens']:>16.0f}"
+            f"{result['p50_ms']:>10.1f}{result['p99_ms']:>10.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare tokens and latency per case for separate and triage calls"
+    )
+    parser.add_argument("--cases", type=int, default=200)
+    parser.add_argument("--base-latency", type=float, default=0.2)
+    parser.add_argument("--prefill-ms", type=float, default=0.05)
+    parser.add_argument("--decode-ms", type=float, default=10.0)
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+import argparse
+import time
+import tracemalloc
+from typing import Callable, List
+
+import numpy as np
+
+from app.ai.embedding_engine import EmbeddingEngine
+from app.ai.embedding_parity import load_corpus
+
+
+def _legacy_encode(model, texts: List[str]):
+    return model.encode(texts, convert_to_tensor=True).cpu().tolist()
+
+
+def _numpy_encode(model, texts: List[str]):
+    return model.encode(texts, convert_to_numpy=True).astype(np.float32, copy=False)
+
+
+def _measure(fn: Callable, repeat: int):
+    latencies = []
+    peak = 0
+    for _ in range(repeat):
+        tracemalloc.start()
+        started = time.perf_counter()
+        fn()
+        latencies.append(time.perf_counter() - started)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return float(np.median(latencies)), peak
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare list and float32 array outputs of the embedding model"
+    )
+    parser.add_argument("--documents", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    model = EmbeddingEngine().model
+    corpus = load_corpus()
+    single = corpus[:1]
+    documents = [f"{corpus[i % len(corpus)]} ({i})" for i in range(args.documents)]
+
+    cases = [
+        ("single", single, args.repeat),
+        (f"batch_{args.documents}", documents, 1),
+    ]
+    print(f"{'case':<14}{'output':<8}{'latency_ms':>12}{'peak_alloc_kb':>16}")
+    for name, texts, repeat in cases:
+        for label, encode in (("list", _legacy_encode), ("numpy", _numpy_encode)):
+            latency, peak = _measure(lambda: encode(model, texts), repeat)
+            print(f"{name:<14}{label:<8}{latency * 1000:>12.2f}{peak / 1024:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+import argparse
+import asyncio
+import json
+import time
+from typing import List
+
+import httpx
+import numpy as np
+from openai import AsyncOpenAI, OpenAI
+
+from app.ai import case as case_ai
+from app.ai.embedding_parity import load_corpus
+from app.models.case import CaseStatus, CaseType
+from app.services.case_service import CaseService
+from benchmarks.case_triage import CASE_ANALYSIS_PROMPT, CASE_TITLE_PROMPT
+
+TICK_SECONDS = 0.005
+
+
+def _completion(content: str) -> dict:
+    return {
+        "id": "chatcmpl-mock",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "gpt-4o-mini",
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+    }
+
+
+def _content(request: httpx.Request) -> str:
+    body = json.loads(request.content)
+    if "response_format" in body:
+        return json.dumps(
+            {"verdict": "approved", "title": "중고거래 사기 피해", "identifiers": []}
+        )
+    system = body["messages"][0]["content"]
+    return "통과" if system == CASE_ANALYSIS_PROMPT else "중고거래 사기 피해"
+
+
+def _sync_client(latency: float) -> OpenAI:
+    def handler(request: httpx.Request) -> httpx.Response:
+        time.sleep(latency)
+        return httpx.Response(200, json=_completion(_content(request)))
+
+    return OpenAI(
+        api_key="mock", http_client=httpx.Client(transport=httpx.MockTransport(handler))
+    )
+
+
+def _async_client(latency: float) -> AsyncOpenAI:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(latency)
+        return httpx.Response(200, json=_completion(_content(request)))
+
+    return AsyncOpenAI(
+        api_key="mock",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+
+async def _legacy_submit(client: OpenAI, statement: str):
+    for system in (CASE_ANALYSIS_PROMPT, CASE_TITLE_PROMPT):
+        client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "system", "content": system},
+                {"role": "user", "content": statement},
+            ],
+        )
+
+
+async def _monitor(lags: List[float], stop: asyncio.Event):
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(TICK_SECONDS)
+        lags.append(time.perf_counter() - started - TICK_SECONDS)
+
+
+async def _run(submit, statements: List[str]):
+    lags = []
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(_monitor(lags, stop))
+    await asyncio.sleep(TICK_SECONDS * 2)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(submit(statement) for statement in statements))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await monitor
+    return elapsed, np.array(lags) * 1000
+
+
+async def main_async(args):
+    corpus = load_corpus()
+    service = CaseService.__new__(CaseService)
+    report = []
+
+    for in_flight in args.in_flight:
+        statements = [corpus[i % len(corpus)] for i in range(in_flight)]
+
+        legacy_client = _sync_client(args.latency)
+        legacy = await _run(
+            lambda statement: _legacy_submit(legacy_client, statement), statements
+        )
+
+        case_ai.client = _async_client(args.latency)
+
+        async def submit(statement: str):
+            request = type(
+                "CaseRequest",
+                (),
+                {
+                    "case_type": CaseType.SECONDHAND_FRAUD,
+                    "statement": statement,
+                    "scammer_infos": [],
+                },
+            )
+            status, _, _ = await service._triage(request)
+            assert status == CaseStatus.APPROVED
+
+        current = await _run(submit, statements)
+        report.append((in_flight, legacy, current))
+
+    print(
+        f"{'in_flight':>10}{'mode':>8}{'wall_s':>9}{'lag_p50_ms':>12}{'lag_max_ms':>12}"
+    )
+    for in_flight, legacy, current in report:
+        for label, (elapsed, lags) in (("sync", legacy), ("async", current)):
+            print(
+                f"{in_flight:>10}{label:>8}{elapsed:>9.2f}"
+                f"{np.percentile(lags, 50):>12.2f}{lags.max():>12.2f}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure event-loop lag while case submissions are in flight"
+    )
+    parser.add_argument("--in-flight", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--latency", type=float, default=0.3)
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import argparse
+import random
+import time
+from typing import List
+
+import numpy as np
+
+from app.ai.embedding_parity import load_corpus
+from app.core.config import settings
+
+
+def _documents(corpus: List[str], count: int) -> List[str]:
+    rng = random.Random(0)
+    return [
+        f"{corpus[i % len(corpus)]} 연락처 010-{rng.randint(1000, 9999)}-"
+        f"{rng.randint(1000, 9999)} 계좌 {rng.randint(10**11, 10**12 - 1)}"
+        for i in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare dense-only and hybrid similar-case search latency"
+    )
+    parser.add_argument("--qdrant-url", default=":memory:")
+    parser.add_argument("--documents", type=int, default=5_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=5)
+    args = parser.parse_args()
+
+    settings.qdrant_url = args.qdrant_url
+    settings.qdrant_collection = "benchmark_hybrid_search"
+    settings.hybrid_search = True
+
+    from app.ai.vector_store import VectorStore
+
+    store = VectorStore()
+    documents = _documents(load_corpus(), args.documents)
+    embeddings = store.embedding_service.encode_batch(documents)
+    payloads = [
+        {
+            "case_id": i,
+            "case_type": "other",
+            "title": text[:30],
+            "statement": text,
+            "status": "approved",
+        }
+        for i, text in enumerate(documents)
+    ]
+    point_ids = [store._generate_point_id(i) for i in range(len(documents))]
+    store.upsert_points(point_ids, embeddings, payloads, documents)
+
+    queries = documents[: args.queries]
+    query_embeddings = store.embedding_service.encode_batch(queries)
+
+    def measure(lexical: bool) -> np.ndarray:
+        latencies = []
+        for text, embedding in zip(queries, query_embeddings):
+            started = time.perf_counter()
+            store._query(
+                embedding, None, args.limit, 0.0, None, text if lexical else None
+            )
+            latencies.append(time.perf_counter() - started)
+        return np.array(latencies)
+
+    print(f"{'mode':<8}{'p50_ms':>10}{'p95_ms':>10}")
+    for label, lexical in (("dense", False), ("hybrid", True)):
+        measure(lexical)
+        latencies = measure(lexical) * 1000
+        print(
+            f"{label:<8}{np.percentile(latencies, 50):>10.3f}"
+            f"{np.percentile(latencies, 95):>10.3f}"
+        )
+
+    store.client.delete_collection(store.collection_name)
+
+
+if __name__ == "__main__":
+    main()
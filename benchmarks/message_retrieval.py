@@ -0,0 +1,77 @@
+import argparse
+import time
+
+import numpy as np
+
+from app.ai.message_vector_store import TENANT_FIELD, MessageVectorStore
+from app.core.config import settings
+
+
+def _populate(store: MessageVectorStore, sizes, dimension: int) -> dict:
+    rng = np.random.default_rng(0)
+    next_id = 1
+    consultations = {}
+    for consultation_id, size in enumerate(sizes, start=1):
+        ids = list(range(next_id, next_id + size))
+        store.client.upload_collection(
+            collection_name=store.collection_name,
+            vectors=rng.random((size, dimension), dtype=np.float32),
+            payload=[
+                {TENANT_FIELD: str(consultation_id), "message_id": i, "author_id": 0}
+                for i in ids
+            ],
+            ids=ids,
+            wait=True,
+        )
+        consultations[consultation_id] = ids
+        next_id += size
+    return consultations
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure turn retrieval latency by consultation length"
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10, 100, 1000, 5000, 20000]
+    )
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument(
+        "--limit", type=int, default=settings.consultation_retrieval_limit
+    )
+    parser.add_argument("--collection", default="consultation_messages_benchmark")
+    parser.add_argument("--qdrant-url", default=None)
+    parser.add_argument("--keep", action="store_true")
+    args = parser.parse_args()
+
+    if args.qdrant_url:
+        settings.qdrant_url = args.qdrant_url
+    settings.qdrant_message_collection = args.collection
+
+    store = MessageVectorStore()
+    consultations = _populate(store, args.sizes, settings.embedding_dimension)
+
+    rng = np.random.default_rng(1)
+    print(f"{'messages':>10}{'p50_ms':>10}{'p99_ms':>10}")
+    try:
+        for consultation_id, ids in consultations.items():
+            latencies = []
+            for query in rng.random(
+                (args.queries, settings.embedding_dimension), dtype=np.float32
+            ):
+                before = ids[len(ids) // 2] if len(ids) > 1 else None
+                started = time.perf_counter()
+                store.search_vector(consultation_id, query, args.limit, before)
+                latencies.append(time.perf_counter() - started)
+            latencies = np.array(latencies) * 1000
+            print(
+                f"{len(ids):>10}{np.percentile(latencies, 50):>10.2f}"
+                f"{np.percentile(latencies, 99):>10.2f}"
+            )
+    finally:
+        if not args.keep:
+            store.client.delete_collection(store.collection_name)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+import argparse
+import json
+import random
+import time
+from datetime import datetime, timezone
+from typing import List
+
+import numpy as np
+from qdrant_client import QdrantClient
+from qdrant_client.models import Distance, VectorParams
+
+from app.ai.embedding_parity import load_corpus
+from app.ai.vector_store import VectorStoreBase
+from app.core.config import settings
+from app.models.case import Case, CaseStatus, CaseType, ScammerInfo, ScammerInfoType
+
+
+def _cases(count: int) -> List[Case]:
+    rng = random.Random(0)
+    corpus = load_corpus()
+    case_types = list(CaseType)
+    cases = []
+    for i in range(count):
+        statement = " ".join(rng.choice(corpus) for _ in range(6))
+        case = Case(
+            id=i + 1,
+            case_type=case_types[i % len(case_types)],
+            title=statement[:40],
+            statement=statement,
+            status=CaseStatus.APPROVED,
+            created_at=datetime.now(timezone.utc),
+        )
+        case.scammer_infos = [
+            ScammerInfo(
+                info_type=ScammerInfoType.PHONE,
+                value=f"010-{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}",
+            ),
+            ScammerInfo(
+                info_type=ScammerInfoType.ACCOUNT,
+                value=f"국민 {rng.randint(10**11, 10**12 - 1)}",
+            ),
+        ]
+        cases.append(case)
+    return cases
+
+
+def _measure(store: VectorStoreBase, cases: List[Case], args) -> dict:
+    payloads = [store._build_payload(case) for case in cases]
+    payload_bytes = [len(json.dumps(p, ensure_ascii=False).encode()) for p in payloads]
+
+    client = QdrantClient(location=":memory:")
+    client.create_collection(
+        "payload_size",
+        vectors_config=VectorParams(size=args.dimension, distance=Distance.COSINE),
+    )
+    rng = np.random.default_rng(0)
+    vectors = rng.random((len(cases), args.dimension), dtype=np.float32)
+    client.upload_collection("payload_size", vectors=vectors, payload=payloads)
+
+    response_bytes = []
+    latencies = []
+    for query in rng.random((args.queries, args.dimension), dtype=np.float32):
+        started = time.perf_counter()
+        points = client.query_points(
+            "payload_size",
+            query=query,
+            limit=args.limit,
+            with_payload=store._payload_selector(),
+        ).points
+        latencies.append(time.perf_counter() - started)
+        response_bytes.append(
+            sum(len(point.model_dump_json().encode()) for point in points)
+        )
+
+    return {
+        "payload_bytes_per_point": float(np.mean(payload_bytes)),
+        "payload_mb_total": sum(payload_bytes) / 1024 / 1024,
+        "response_bytes": float(np.mean(response_bytes)),
+        "search_p50_ms": float(np.percentile(latencies, 50) * 1000),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare full and lean Qdrant payload size and search responses"
+    )
+    parser.add_argument("--cases", type=int, default=10_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=5)
+    parser.add_argument("--dimension", type=int, default=settings.embedding_dimension)
+    args = parser.parse_args()
+
+    store = VectorStoreBase()
+    store.hybrid = False
+    cases = _cases(args.cases)
+
+    print(
+        f"{'mode':<6}{'bytes/point':>14}{'total_mb':>12}"
+        f"{'response_bytes':>16}{'p50_ms':>10}"
+    )
+    for label, lean in (("full", False), ("lean", True)):
+        settings.qdrant_lean_payload = lean
+        result = _measure(store, cases, args)
+        print(
+            f"{label:<6}{result['payload_bytes_per_point']:>14.1f}"
+            f"{result['payload_mb_total']:>12.2f}"
+            f"{result['response_bytes']:>16.1f}{result['search_p50_ms']:>10.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,35 @@
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.api import case, consultation
-from app.db.redis import close_redis, get_redis
+from app.ai.openai_client import close_client as close_openai_client
+from app.api import case, consultation, health
+from app.core.metrics import metrics
+from app.core.startup import warm_up
+from app.db.redis import close_binary_redis, close_redis, get_redis
+
+
+async def _warm_up(app: FastAPI):
+    try:
+        await asyncio.to_thread(warm_up)
+    except Exception as e:
+        app.state.startup_error = str(e)
+        return
+    app.state.ready = True
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    app.state.ready = False
     await get_redis()
+    warm_up_task = asyncio.create_task(_warm_up(app))
     yield
+    warm_up_task.cancel()
+    await close_openai_client()
     await close_redis()
+    close_binary_redis()
 
 
 app = FastAPI(title="LINKA AI-Backend API", version="0.1.0", lifespan=lifespan)
@@ -24,6 +42,7 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.include_router(health.router, prefix="/health", tags=["health"])
 app.include_router(case.router, prefix="/api/case", tags=["case"])
 app.include_router(
     consultation.router, prefix="/api/consultation", tags=["consultation"]
@@ -33,3 +52,8 @@ app.include_router(
 @app.get("/")
 async def root():
     return {"message": "LINKA AI-Backend API"}
+
+
+@app.get("/metrics")
+async def get_metrics():
+    return metrics.snapshot()
@@ -0,0 +1,31 @@
+import os
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+for key, value in {
+    "DATABASE_URL": "sqlite://",
+    "REDIS_URL": "redis://localhost:6379/0",
+    "SECRET_KEY": "test",
+    "OPENAI_API_KEY": "test",
+    "LAW_API_KEY": "test",
+    "HF_TOKEN": "test",
+}.items():
+    os.environ.setdefault(key, value)
+
+import app.models.consultation
+import app.models.group
+import app.models.lawyer
+import app.models.user
+from app.db.database import Base
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
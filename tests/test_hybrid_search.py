@@ -0,0 +1,117 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from qdrant_client.models import ScoredPoint
+
+from app.ai.vector_store import VectorStore
+from app.core.config import settings
+
+
+def _point(case_id: int, score: float) -> ScoredPoint:
+    return ScoredPoint(
+        id=case_id,
+        version=0,
+        score=score,
+        payload={"case_id": case_id, "case_type": "other", "title": f"case {case_id}"},
+    )
+
+
+@pytest.fixture
+def store():
+    store = object.__new__(VectorStore)
+    store.hybrid = True
+    store._read_hybrid = True
+    return store
+
+
+def test_fuse_keeps_dense_cosine(store):
+    dense = [_point(1, 0.9), _point(2, 0.8)]
+    lexical = [_point(2, 12.0), _point(1, 3.0)]
+
+    fused = store._fuse(dense, lexical, limit=5, score_threshold=0.5)
+
+    assert {point.id: point.score for point in fused} == {1: 0.9, 2: 0.8}
+
+
+def test_fuse_lexical_rank_reorders_dense_hits(store):
+    dense = [_point(1, 0.71), _point(2, 0.70), _point(3, 0.69)]
+    lexical = [_point(3, 9.0), _point(2, 4.0)]
+
+    fused = store._fuse(dense, lexical, limit=5, score_threshold=0.5)
+
+    assert [point.id for point in fused] == [3, 2, 1]
+
+
+def test_fuse_admits_identifier_match_below_threshold(store):
+    dense = [_point(1, 0.9), _point(2, 0.4)]
+    lexical = [_point(2, 20.0)]
+
+    fused = store._fuse(dense, lexical, limit=5, score_threshold=0.5)
+
+    assert [point.id for point in fused] == [2, 1]
+    assert fused[0].score == 0.4
+
+
+def test_fuse_drops_weak_lexical_matches_below_threshold(store):
+    dense = [_point(1, 0.9), _point(2, 0.4)]
+    lexical = [_point(2, 3.0)]
+
+    fused = store._fuse(dense, lexical, limit=5, score_threshold=0.5)
+
+    assert [point.id for point in fused] == [1]
+
+
+def test_fuse_respects_limit(store):
+    dense = [_point(i, 0.9 - i / 100) for i in range(10)]
+
+    fused = store._fuse(dense, [], limit=3, score_threshold=0.5)
+
+    assert [point.id for point in fused] == [0, 1, 2]
+
+
+def test_hybrid_query_rescores_identifier_only_matches(store):
+    dense = [_point(1, 0.82), _point(2, 0.78)]
+    lexical = [_point(3, 30.0), _point(4, 2.0)]
+    rescore_calls = []
+
+    def query_points(**kwargs):
+        rescore_calls.append(kwargs)
+        return SimpleNamespace(points=[_point(3, 0.41)])
+
+    store.client = SimpleNamespace(
+        query_batch_points=lambda **kwargs: [
+            SimpleNamespace(points=dense),
+            SimpleNamespace(points=lexical),
+        ],
+        query_points=query_points,
+    )
+    store._read_collection = lambda: "scam_cases"
+
+    results = store._query(
+        np.zeros(settings.embedding_dimension, dtype=np.float32),
+        None,
+        5,
+        0.5,
+        None,
+        "입금 계좌 110-123-456789",
+    )
+
+    assert [result["case_id"] for result in results] == [3, 1, 2]
+    assert results[0]["similarity_score"] == 0.41
+    assert rescore_calls[0]["query_filter"].must[0].has_id == [3]
+
+
+def test_lexical_text_has_no_template_labels(store):
+    case = SimpleNamespace(
+        title="중고거래 선입금 사기",
+        statement="입금 후 연락이 두절되었습니다.",
+        case_type_other=None,
+        scammer_infos=[SimpleNamespace(value="010-1234-5678")],
+    )
+
+    text = store._create_lexical_text(case)
+
+    assert "010-1234-5678" in text
+    for label in ("유형", "제목", "내용", "정보", "전화"):
+        assert label not in text
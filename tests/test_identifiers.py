@@ -0,0 +1,71 @@
+import pytest
+
+from app.core.identifiers import (
+    normalize_account,
+    normalize_identifier,
+    normalize_phone,
+    normalize_sns_id,
+)
+from app.models.case import ScammerInfoType
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("010-1234-5678", "01012345678"),
+        ("010 1234 5678", "01012345678"),
+        ("(010)1234.5678", "01012345678"),
+        ("+82 10-1234-5678", "01012345678"),
+        ("+82 010-1234-5678", "01012345678"),
+        ("0082-10-1234-5678", "01012345678"),
+        ("02-123-4567", "021234567"),
+        ("1234-5678", None),
+        ("연락처 없음", None),
+    ],
+)
+def test_normalize_phone(value, expected):
+    assert normalize_phone(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("110-123-456789", "110123456789"),
+        ("신한 110 123 456789", "110123456789"),
+        ("3333-01-2345678", "3333012345678"),
+        ("1234-567", None),
+        ("", None),
+    ],
+)
+def test_normalize_account(value, expected):
+    assert normalize_account(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("@Scammer_01", "scammer_01"),
+        ("  scammer_01  ", "scammer_01"),
+        ("https://www.instagram.com/Scammer_01/", "scammer_01"),
+        ("instagram.com/@scammer_01", "scammer_01"),
+        ("open.kakao.com/o/abc123", "o/abc123"),
+        ("scam mer", "scammer"),
+        ("@", None),
+    ],
+)
+def test_normalize_sns_id(value, expected):
+    assert normalize_sns_id(value) == expected
+
+
+@pytest.mark.parametrize(
+    "info_type, value, expected",
+    [
+        (ScammerInfoType.PHONE, "+82 10-1234-5678", "01012345678"),
+        ("ACCOUNT", "110-123-456789", "110123456789"),
+        (ScammerInfoType.SNS_ID, "@Scammer_01", "scammer_01"),
+        (ScammerInfoType.NAME, "홍길동", None),
+        (ScammerInfoType.PHONE, None, None),
+    ],
+)
+def test_normalize_identifier_dispatches_by_type(info_type, value, expected):
+    assert normalize_identifier(info_type, value) == expected
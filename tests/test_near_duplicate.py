@@ -0,0 +1,125 @@
+import asyncio
+
+import pytest
+
+from app.ai import near_duplicate
+from app.ai.near_duplicate import (
+    NearDuplicateIndex,
+    estimate_similarity,
+    minhash_signature,
+)
+
+STATEMENT = (
+    "중고나라에서 아이폰 15 프로를 구매하기로 하고 판매자에게 80만원을 선입금했습니다. "
+    "입금 직후 판매자가 카카오톡을 차단하고 연락이 두절되었습니다."
+)
+NEAR_DUPLICATE = (
+    "중고나라에서 아이폰 15 프로를 구매하기로 하고 판매자에게 85만원을 선입금했습니다. "
+    "입금 직후 판매자가 카카오톡을 차단하고 연락이 두절되었습니다."
+)
+UNRELATED = (
+    "검찰청 수사관을 사칭한 사람이 전화해 제 명의 계좌가 범죄에 연루되었다며 "
+    "안전계좌로 예금을 옮기라고 요구했습니다."
+)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    def __getattr__(self, name):
+        def queue(*args):
+            self.calls.append((name, args))
+
+        return queue
+
+    async def execute(self):
+        return [await getattr(self.redis, name)(*args) for name, args in self.calls]
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+        self.sets = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value):
+        self.values[key] = value
+
+    async def mget(self, keys):
+        return [self.values.get(key) for key in keys]
+
+    async def delete(self, key):
+        self.values.pop(key, None)
+
+    async def smembers(self, key):
+        return set(self.sets.get(key, ()))
+
+    async def sadd(self, key, member):
+        self.sets.setdefault(key, set()).add(str(member))
+
+    async def srem(self, key, member):
+        self.sets.get(key, set()).discard(str(member))
+
+
+@pytest.fixture
+def index(monkeypatch):
+    redis = FakeRedis()
+
+    async def get_redis():
+        return redis
+
+    monkeypatch.setattr(near_duplicate, "get_redis", get_redis)
+    return NearDuplicateIndex()
+
+
+def test_identical_statements_share_a_signature():
+    spaced = " ".join(STATEMENT.split(" "))
+
+    assert estimate_similarity(
+        minhash_signature(STATEMENT), minhash_signature(f"  {spaced}\n")
+    ) == pytest.approx(1.0)
+
+
+def test_near_duplicate_estimates_high_similarity():
+    similarity = estimate_similarity(
+        minhash_signature(STATEMENT), minhash_signature(NEAR_DUPLICATE)
+    )
+
+    assert 0.8 <= similarity < 1.0
+
+
+def test_unrelated_statement_estimates_low_similarity():
+    similarity = estimate_similarity(
+        minhash_signature(STATEMENT), minhash_signature(UNRELATED)
+    )
+
+    assert similarity < 0.2
+
+
+def test_find_returns_own_match_first(index):
+    asyncio.run(index.add(1, 10, minhash_signature(STATEMENT)))
+    asyncio.run(index.add(2, 20, minhash_signature(STATEMENT)))
+
+    matches = asyncio.run(index.find(minhash_signature(NEAR_DUPLICATE), 20, 0.8))
+
+    assert [(case_id, own) for case_id, _, own in matches] == [(2, True), (1, False)]
+
+
+def test_find_ignores_unrelated_statements(index):
+    asyncio.run(index.add(1, 10, minhash_signature(STATEMENT)))
+
+    assert asyncio.run(index.find(minhash_signature(UNRELATED), 10, 0.8)) == []
+
+
+def test_remove_drops_case_from_every_band(index):
+    asyncio.run(index.add(1, 10, minhash_signature(STATEMENT)))
+    asyncio.run(index.remove(1, 10))
+
+    assert asyncio.run(index.find(minhash_signature(STATEMENT), 10, 0.8)) == []
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from app.ai import vector_store as vector_store_module
+from app.core.config import settings
+from app.jobs.reindex import Checkpoint, reindex
+from app.models.case import Case, CaseStatus, CaseType, ScammerInfo, ScammerInfoType
+
+DIMENSION = 8
+
+
+class FakeEncoder:
+    def encode_batch(self, texts, batched=False):
+        rng = np.random.default_rng(len(texts))
+        return rng.random((len(texts), DIMENSION), dtype=np.float32)
+
+
+@pytest.fixture
+def store(monkeypatch):
+    monkeypatch.setattr(settings, "qdrant_url", ":memory:")
+    monkeypatch.setattr(settings, "embedding_dimension", DIMENSION)
+    monkeypatch.setattr(settings, "hybrid_search", False)
+    monkeypatch.setattr(vector_store_module, "EmbeddingEngine", FakeEncoder)
+    monkeypatch.setattr(vector_store_module.VectorStore, "_instance", None)
+    return vector_store_module.VectorStore()
+
+
+def _seed(db, count: int):
+    for case_id in range(1, count + 1):
+        db.add(
+            Case(
+                id=case_id,
+                user_id=1,
+                case_type=CaseType.SECONDHAND_FRAUD,
+                title=f"case {case_id}",
+                statement=f"statement {case_id}",
+                status=CaseStatus.PENDING if case_id % 3 == 0 else CaseStatus.APPROVED,
+                scammer_infos=[
+                    ScammerInfo(
+                        info_type=ScammerInfoType.PHONE, value=f"010-1234-{case_id:04d}"
+                    )
+                ],
+            )
+        )
+    db.commit()
+
+
+def _indexed(store):
+    points, _ = store.client.scroll(store.collection_name, limit=100, with_payload=True)
+    return {point.payload["case_id"]: point.payload for point in points}
+
+
+def test_reindex_resumes_from_checkpoint(db, store, tmp_path):
+    _seed(db, 7)
+    checkpoint = Checkpoint(str(tmp_path / "reindex.json"))
+
+    first = reindex(
+        db, store, checkpoint, page_size=2, upsert_batch_size=1, parallel=2, limit=2
+    )
+
+    assert first == 2
+    assert checkpoint.load() == 2
+    assert sorted(_indexed(store)) == [1, 2]
+
+    second = reindex(db, store, checkpoint, page_size=2, upsert_batch_size=1)
+
+    payloads = _indexed(store)
+    assert second == 3
+    assert checkpoint.load() == 7
+    assert store.client.count(store.collection_name).count == 5
+    assert sorted(payloads) == [1, 2, 4, 5, 7]
+    assert payloads[4]["title"] == "case 4"
+    assert payloads[4]["status"] == "approved"
+    assert payloads[4]["scammer_infos"] == [
+        {"info_type": "phone", "value": "010-1234-0004"}
+    ]
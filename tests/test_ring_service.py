@@ -0,0 +1,156 @@
+from sqlalchemy import select
+
+from app.models.case import (
+    Case,
+    CaseStatus,
+    CaseType,
+    ScammerInfo,
+    ScammerInfoType,
+    ScamRing,
+)
+from app.services.ring_service import (
+    RingService,
+    UnionFind,
+    identifier_lock_key,
+    link_cases,
+)
+
+
+def _case(db, case_id: int, *identifiers, ring_id=None) -> Case:
+    case = Case(
+        id=case_id,
+        user_id=1,
+        case_type=CaseType.SECONDHAND_FRAUD,
+        title=f"case {case_id}",
+        statement="statement",
+        status=CaseStatus.APPROVED,
+        ring_id=ring_id,
+        scammer_infos=[
+            ScammerInfo(info_type=info_type, value=value)
+            for info_type, value in identifiers
+        ],
+    )
+    db.add(case)
+    db.commit()
+    return case
+
+
+def _rings(db):
+    members = {}
+    for case_id, ring_id in db.execute(select(Case.id, Case.ring_id)):
+        members.setdefault(ring_id, set()).add(case_id)
+    return sorted(members.values(), key=min)
+
+
+def test_union_find_merges_by_size():
+    rings = UnionFind()
+    for item in range(5):
+        rings.add(item)
+    rings.union(0, 1)
+    rings.union(2, 3)
+    rings.union(3, 1)
+
+    assert rings.find(0) == rings.find(2)
+    assert rings.size[rings.find(0)] == 4
+    assert sorted(map(sorted, rings.components())) == [[0, 1, 2, 3], [4]]
+
+
+def test_link_cases_joins_shared_identifiers_transitively():
+    rows = [
+        (1, "phone", "01012345678"),
+        (2, "phone", "01012345678"),
+        (2, "account", "1002123456789"),
+        (3, "account", "1002123456789"),
+        (4, "phone", "01099998888"),
+        (5, None, None),
+    ]
+
+    components = sorted(map(sorted, link_cases(rows).components()))
+
+    assert components == [[1, 2, 3], [4], [5]]
+
+
+def test_link_cases_keeps_identifier_types_apart():
+    rows = [(1, "phone", "1002123456"), (2, "account", "1002123456")]
+
+    assert len(link_cases(rows).components()) == 2
+
+
+def test_identifier_lock_key_is_stable_bigint():
+    key = identifier_lock_key(("phone", "01012345678"))
+
+    assert key == identifier_lock_key(("phone", "01012345678"))
+    assert key != identifier_lock_key(("account", "01012345678"))
+    assert -(2**63) <= key < 2**63
+
+
+def test_assign_creates_joins_and_merges_rings(db):
+    service = RingService(db)
+    phone = (ScammerInfoType.PHONE, "010-1234-5678")
+    account = (ScammerInfoType.ACCOUNT, "1002-123-456789")
+
+    first = service.assign(_case(db, 1, phone))
+    second = service.assign(_case(db, 2, account))
+    assert first.id != second.id
+
+    merged = service.assign(_case(db, 3, phone, account))
+
+    assert _rings(db) == [{1, 2, 3}]
+    assert merged.size == 3
+    assert db.query(ScamRing).count() == 1
+
+
+def test_split_separates_cases_after_bridge_is_removed(db):
+    ring = ScamRing(size=3)
+    db.add(ring)
+    db.flush()
+    _case(db, 1, (ScammerInfoType.PHONE, "010-1234-5678"), ring_id=ring.id)
+    bridge = _case(
+        db,
+        2,
+        (ScammerInfoType.PHONE, "010-1234-5678"),
+        (ScammerInfoType.ACCOUNT, "1002-123-456789"),
+        ring_id=ring.id,
+    )
+    _case(db, 3, (ScammerInfoType.ACCOUNT, "1002-123-456789"), ring_id=ring.id)
+
+    bridge.status = CaseStatus.REJECTED
+    db.commit()
+    RingService(db).split(ring.id)
+
+    ring_of = dict(db.execute(select(Case.id, Case.ring_id)).all())
+    assert ring_of[1] != ring_of[3]
+    assert {ring_of[1], ring_of[3]} & {ring.id}
+    assert sorted(size for (size,) in db.execute(select(ScamRing.size))) == [1, 1]
+
+
+def test_split_drops_empty_ring(db):
+    ring = ScamRing(size=1)
+    db.add(ring)
+    db.flush()
+    case = _case(db, 1, (ScammerInfoType.PHONE, "010-1234-5678"), ring_id=ring.id)
+    case.status = CaseStatus.REJECTED
+    db.commit()
+
+    RingService(db).split(ring.id)
+
+    assert db.get(ScamRing, ring.id) is None
+
+
+def test_assign_again_merges_without_recounting_case(db):
+    service = RingService(db)
+    phone = (ScammerInfoType.PHONE, "010-1234-5678")
+    account = (ScammerInfoType.ACCOUNT, "1002-123-456789")
+
+    service.assign(_case(db, 1, phone))
+    service.assign(_case(db, 2, account))
+    case = _case(db, 3, phone)
+    service.assign(case)
+
+    case.scammer_infos.append(ScammerInfo(info_type=account[0], value=account[1]))
+    db.commit()
+    ring = service.assign(case)
+
+    assert _rings(db) == [{1, 2, 3}]
+    assert ring.size == 3
+    assert db.query(ScamRing).count() == 1